@@ -12,10 +12,13 @@ import json
 import time
 import gym
 import rl.gym_mastermind.envs.mastermind_env
-from tinydb import TinyDB
 from collections_extended import frozenbag
 from utils.feedback_highlighter import FeedbackHighlighter
 from utils.emotion_analyzer import EmotionAnalyzer
+from utils.session_storage import open_storage, import_tinydb, STORAGE_BACKENDS
+from utils.session_writer import SessionWriter
+from utils.session_log import SessionEventLog, LOG_EXTENSION
+from utils.array_codec import encode_qmatrix
 from rl.agent import Agent
 from threading import Thread, Condition, Lock
 from collections import OrderedDict
@@ -34,14 +37,28 @@ if __name__ == "__main__":
 	with open(APP_PATH + '/style/styles.json') as STYLES_FILE:
 	  	STYLES = json.load(STYLES_FILE) 
 
-	DB = TinyDB(
-		CONFIG['db']['db_path'] + '/' + CONFIG['db']['db_name'] + '.json',
-		default_table=CONFIG['db']['default_table'],
-		sort_keys=True, 
-		indent=4, 
-		separators=(',', ': ')
+	DB_PATH = CONFIG['db']['db_path'] + '/' + CONFIG['db']['db_name'] + STORAGE_BACKENDS.get(CONFIG['db']['backend'], '')
+
+	# Le sessioni del database TinyDB sono importate alla creazione dell'archivio
+	DB_IMPORT = not os.path.isfile(DB_PATH) and os.path.isfile(CONFIG['db']['db_path'] + '/' + CONFIG['db']['db_name'] + '.json')
+
+	DB = open_storage(CONFIG['db']['backend'], DB_PATH)
+
+	if DB_IMPORT:
+		import_tinydb(CONFIG['db']['db_path'] + '/' + CONFIG['db']['db_name'] + '.json', DB, CONFIG['db']['default_table'])
+
+	# Le sessioni sono scritte da un thread dedicato (il thread RL si limita ad accodarle)
+	DB_WRITER = SessionWriter(
+		DB,
+		maxsize=CONFIG['db']['queue_size'],
+		batch_size=CONFIG['db']['batch_size'],
+		fsync_policy=CONFIG['db']['fsync_policy'],
+		fallback_path=DB_PATH + '.fallback.jsonl'
 	)
 
+	if not os.path.isdir(CONFIG['db']['log_path']):
+		os.makedirs(CONFIG['db']['log_path'])
+
 
 	# application----------------------------------------------------------------
 
@@ -104,6 +121,7 @@ if __name__ == "__main__":
 			# mainloop
 			self.mainloop_cv = Condition()
 			self.stoppable_mutex = Lock()
+			self.session_mutex = Lock()
 			self.mainloop_thread = self.mainloop()
 			self.mainloop_thread.start()
 
@@ -736,10 +754,7 @@ if __name__ == "__main__":
 
 
 		def on_reset_button_clicked(self):
-			if self.rl_session is not None:
-				self.fill_rl_session_result()
-				DB.insert(self.rl_session)
-				self.rl_session = None
+			self.save_rl_session()
 			self.reset()
 			self.refresh()
 
@@ -757,6 +772,7 @@ if __name__ == "__main__":
 				'attempt': list(self.agent.curr_state),
 				'time': str(int(self.time_secs/60)).zfill(2) + ':' + str(int(self.time_secs%60)).zfill(2)
 			}
+			self.session_log.append('feedback', feedback_id=self.feedback_id, **self.rl_session['feedback'][self.feedback_id])
 			with self.mainloop_cv:
 				self.feedback_required = False
 				self.mainloop_cv.notifyAll()
@@ -782,6 +798,7 @@ if __name__ == "__main__":
 			self.feedback_provided = False
 			self.feedback_frame = False
 			self.rl_session = None
+			self.session_log = None
 			with self.mainloop_cv:
 				self.feedback_required = False
 				self.stopped = True
@@ -796,15 +813,14 @@ if __name__ == "__main__":
 
 
 		def fill_rl_session_result(self):
-			qmatrix = {}
-			for state in self.agent.qmatrix.keys():
-				state_str = '{' + str(list(state))[1:-1] + '}'
-				qmatrix[state_str] = {
-					'qvalues': str(list(self.agent.qmatrix[state]['qvalues'])),
-			    	'td_errors': str(list(self.agent.qmatrix[state]['td_errors'])),
-			    	'td_errors_variations': str(list(self.agent.qmatrix[state]['td_errors_delta'])),
-			    	'visits': self.agent.qmatrix[state]['visits']
-				}
+			rows = self.agent.qmatrix.rows(np.arange(len(self.agent.qmatrix)))
+			qmatrix = encode_qmatrix(
+				self.env.state_space.state_counts,
+				self.agent.qmatrix.qvalues[rows],
+				self.agent.qmatrix.td_errors[rows],
+				self.agent.qmatrix.td_errors_delta[rows],
+				self.agent.qmatrix.visits[rows]
+			)
 			time_str = str(int(self.time_secs/60)).zfill(2) + ':' + str(int(self.time_secs%60)).zfill(2)
 			self.rl_session['result']['guessed'] = self.env.is_guessed()
 			self.rl_session['result']['optimal'] = list(self.agent.get_optimal())
@@ -817,6 +833,23 @@ if __name__ == "__main__":
 					self.rl_session['feedback'][feedback_id]['csv_path'] = csv_path
 				else:
 					self.rl_session['feedback'][feedback_id]['csv_path'] = None
+			self.session_log.seal(
+				guessed=self.rl_session['result']['guessed'],
+				attempts=self.attempts,
+				optimal=self.rl_session['result']['optimal']
+			)
+			self.rl_session['log_path'] = self.session_log.path
+
+
+		def save_rl_session(self):
+			# Invocato sia dal thread RL (codice indovinato, uscita) sia dall'interfaccia (reset)
+			with self.session_mutex:
+				if self.rl_session is not None:
+					try:
+						self.fill_rl_session_result()
+					finally:
+						DB_WRITER.put(self.rl_session)
+						self.rl_session = None
 
 
 		# services--------------------------------------------------
@@ -862,31 +895,53 @@ if __name__ == "__main__":
 
 			def mainloop_thread():
 
+				# La sessione in corso è salvata qualunque sia il motivo dell'uscita
+				# (chiusura della finestra durante l'esecuzione, eccezioni)
+				try:
+					mainloop_steps()
+				finally:
+					self.save_rl_session()
+
+			def mainloop_steps():
+
+				# Registro della sessione in corso: un reset dall'interfaccia lo chiude
+				# e azzera self.session_log mentre uno step può essere in esecuzione
+				# (gli eventi successivi alla chiusura sono ignorati)
+				session_log = None
+
 				while not self.exit:
 
 					# Verifica se l'applicazione è stata fermata o se è richiesto un feedback
 					# in caso affermativo rimane in attesa passiva
 					with self.mainloop_cv:
 						while self.stopped or self.feedback_required:
-							# In caso di uscita salva i dati se presenti
+							# In caso di uscita termina (la sessione in corso è salvata da mainloop_thread)
 							if self.exit:
-								if self.rl_session is not None:
-									self.fill_rl_session_result()
-									DB.insert(self.rl_session)
-									self.rl_session = None
 								return
 							self.mainloop_cv.wait()
 
 					# Inializzazione sessione RL
 					if self.rl_session is None:
+						random_seed = np.random.randint(np.iinfo(np.int32).max)
 						self.env = gym.make(
 							CONFIG['rl']['gym'], 
 							no_pegs=CONFIG['rl']['no_actions'], 
 							secret=self.secret,
-							random_seed=np.random.randint(np.iinfo(np.int32).max)
+							random_seed=random_seed
 						)
 						self.agent = Agent(self.env)
 						self.rl_session = self.init_rl_session()
+						session_log = SessionEventLog(
+							CONFIG['db']['log_path'] + '/' + self.rl_session['session_id'] + LOG_EXTENSION,
+							CONFIG['db']['log_fsync_interval']
+						)
+						self.session_log = session_log
+						session_log.append(
+							'begin',
+							session_id=self.rl_session['session_id'],
+							config=self.rl_session['config'],
+							random_seed=int(random_seed)
+						)
 
 					else:
 
@@ -904,6 +959,7 @@ if __name__ == "__main__":
 
 							# Se è stato fornito un feedback aggiorna la matrice Q
 							if self.feedback_provided:
+								session_log.append('update', reward=self.evaluation)
 								self.agent.update_qmatrix(self.evaluation)
 								self.feedback_provided = False
 								self.agent.curr_state = self.env.reset()
@@ -913,6 +969,18 @@ if __name__ == "__main__":
 							elif not self.feedback_required:
 								action = self.agent.get_action()
 								self.feedback_required = self.agent.take_action(action)
+								state_id, _, qvalue, td_error, td_error_delta = self.agent.td_history.get_views()[-1][-1].tolist()
+								session_log.append(
+									'step',
+									step=self.agent.td_history.total,
+									state_id=state_id,
+									action=int(action),
+									state=[int(peg) for peg in self.agent.curr_state],
+									done=bool(self.feedback_required),
+									qvalue=qvalue,
+									td_error=td_error,
+									td_error_delta=td_error_delta
+								)
 
 								# Se l'azione è terminale incrementa gli attempts
 								if self.feedback_required:
@@ -920,10 +988,9 @@ if __name__ == "__main__":
 
 									# Se il multiset finale è corretto interrompi e salva i dati
 									if self.env.is_guessed():
+										session_log.append('update', reward=CONFIG['rl']['max_evaluation'])
 										self.agent.update_qmatrix(CONFIG['rl']['max_evaluation'])
-										self.fill_rl_session_result()
-										DB.insert(self.rl_session)
-										self.rl_session = None
+										self.save_rl_session()
 										self.stopped = True
 										self.feedback_required = False
 										self.flash_guessed_code_selector()
@@ -955,4 +1022,14 @@ if __name__ == "__main__":
 	# main--------------------------------------------------------------------
 
 	app = Application()
-	tk.mainloop()
\ No newline at end of file
+	tk.mainloop()
+
+	# Attende il salvataggio dell'ultima sessione e la scrittura delle sessioni in coda
+	app.mainloop_thread.join()
+	DB_WRITER.close()
+	if DB_WRITER.error is not None:
+		print(
+			'session storage error: ' + str(DB_WRITER.error) + ' (' + str(DB_WRITER.spilled) + ' sessions saved to ' + 
+			DB_WRITER.fallback_path + ', ' + str(len(DB_WRITER.failed)) + ' sessions not saved)'
+		)
+	DB.close()
\ No newline at end of file
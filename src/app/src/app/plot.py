@@ -3,70 +3,21 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
-
-
-PERCENTAGE_HOPE_TOLERANCE = 0.1
-NO_EMOTION = 0
-HOPE = 1
-FEAR = -1
+from rl.emotions import get_emotions, get_intensities, get_emotion_values
 
 
 
 td_error_data = [(0.0, -np.inf), (0.0, -np.inf), (0.0, -np.inf), (0.0, 0.0), (0.0, 0.0), (0.0, -np.inf), (0.46890624875485853, 0.23496857357199658), (0.0029357369999999713, 0.0085849469999999973), (0.0073499999999999677, 0.22784999999999994), (0.26869234151251187, 0.10467156607884195), (-0.25940801880000003, 0.028016377199999991), (-0.27489000000000002, 0.15140999999999999), (0.71430052088644203, 3.2457797568019581e-05), (0.57876383041387469, 0.063397062367625726), (0.57770999999999995, 0.12201000000000008), (0.54455682553340823, 0.08728002498716167), (0.41777943382005944, 0.0022168210865276925), (0.46525499999999986, 0.4579049999999999), (1.0139851667504804, 6.5690768023762836e-05), (1.1264667092763401, 0.014728818355206584), (1.0675433999999999, 0.20406540000000004), (0.92814817290120366, 0.00573362613973003), (1.0340060458297802, 0.098523188447179097), (0.98596450050000006, 0.1494161655), (1.3417095273338471, 0.030384338812113262), (1.2296224076845301, 0.045142237351096209), (0.31443299999999991, 0.58932299999999993), (1.4631929412333422, 0.022200971460238361), (1.6363418258752556, 0.027091653737737587), (0.79410575999999999, 0.10708656000000009), (1.3308450826562432, -0.13427018376948607), (1.392620566383943, -0.24368121399519962), (1.4313175115400003, -0.39974086025999994), (1.3589345661649483, 0.0055446910714492589), (0.64819637447024059, -0.0015260570972282727), (0.71949149999999995, 0.25423650000000009), (1.5207953699279928, 0.030374889922930557), (1.7042368665499588, 0.044231363476034957), (0.65439990000000003, 0.33996690000000007), (1.6763890548161116, 0.053098598139502351), (1.0536971862932645, -0.075136735747416361), (1.1349952534620003, -0.29632225807800006), (1.778833050423039, 0.018827177796039526), (1.9854464898967286, 0.097267088262635013), (1.8449936563659302, 0.10501480181283002), (2.1217686435213814, 0.12616508128451576), (0.94851135848797941, -0.10518582780528513), (0.83082194999999992, 0.11133045), (1.3734128955337375, 0.0018157329288854605), (1.1356963733943006, 0.034833950579152437), (-0.90836827200000003, -1.702474032), (1.1509619372343542, -0.00045753357834557026), (0.94678454089733244, -0.1988562934454422), (0.50023219373650307, -0.18720845205184072), (2.3654755696768714, -0.0009922697479019416), (0.73690056241933199, -0.028218608645107866), (0.80534097000000004, 0.15094106999999995), (0.82530378879855681, -0.00010205922253898602), (0.90480382402124371, -0.0032015807162353305), (0.14638143721471192, -0.34155668683432799), (2.4211910334867377, 0.0053844388510287718), (1.0745156796424518, -0.013215952499054405), (0.72811811041261332, -0.22894225762943085), (0.82526008101797155, -7.4401173233429308e-08), (0.89386547848593656, -1.1106786125336665e-05), (-1.9394904816, -1.0311222095999999), (0.96350448198309979, -2.0247452488220129e-05), (0.71211173227106117, 0.0010503675941370581), (0.79173543312378403, 0.063617322711170723), (0.82526004915499951, -5.4238424862518285e-11), (0.91695561014639382, -0.031555748341585588), (0.8819999999999999, 0.8819999999999999), (0.96252167773103214, -0.00022485255331845531), (1.0693614581678206, -0.0011894357249148779), (1.1876129999999998, 0.60990299999999986), (3.1032138861562735, 0.10919202957086761), (1.2926299944503463, 0.22326853628252566), (0.85051062993713522, 0.058775196813351201), (1.0417217688681215, 0.014015507033277717), (0.7872650416701229, -3.9695339237866276e-10), (-0.026143714377945292, 0.0610020002152055), (3.2377388254525541, -0.026341442683703906), (1.3596105553351039, 0.066980560884757651), (0.95728935015000005, -0.028675150349999998), (1.047724035894686, 1.0217304627269108e-05), (0.89386071874704698, -7.287162095970245e-10), (0.99317857603860005, -0.14181667742340015), (1.0944467360485153, 0.046718439537799701), (1.2382988049131756, 0.074156121869257394), (1.0038130199999999, -0.06373037999999992), (1.2466581716979233, 0.0011701782731807552), (1.3857329740801594, 0.0060282504796281607), (0.92663680504500012, -0.03065254510499997), (3.5646653004544864, 0.034022321349299695), (0.82401837685610824, -0.0099748588192354534), (-0.70623851393088355, 0.17788986583872846), (1.13444110983922, 0.00011659080378765284), (1.2605456414739526, 0.02224683656077717), (0.93475757281158001, -0.058421003227020048), (3.4850940931955758, -0.0026084263354789082), (3.8710846624385069, -0.013089157512083682), (0.86530859100000002, 0.059967620999999999), (3.5831146676719272, 0.022854890941658643), (0.81977806437205125, -8.0796356435797182e-05), (-1.6671715541792651, -0.96093304024838155), (3.5040116787632427, -0.0055657201850405789), (3.8906959667916792, -0.10142583424458529), (0.874738935, 0.04391698500000004), (1.141759000575598, 0.0012616715621820206), (0.82138514711573174, -0.00038155239874549936), (-1.2790855688355862, -1.4254670060502981), (1.2492755829559656, 2.2480563877103064e-08), (1.3880839917672145, 0.0005425425431665686), (0.91246847184347391, -0.022289100968106046), (1.1426781001728872, 0.00037850146817011151), (0.80192673225475652, 8.3334288901459883e-05), (-1.3308431143133832, -1.3046993999354379), (3.531545697771667, -0.058791310116607494), (1.2698225723197969, 0.00060066458714096431), (0.89106938549999992, 0.016330450499999972), (3.5356650933377134, 0.0048517845313263749), (1.2700027716959392, 0.00018019937614224268), (1.4112, 0.5292), (1.2494208925295824, 2.76861098609249e-06), (0.81397680966751651, -0.00013812929614986924), (0.90435290155304215, -0.0081155702904317506), (1.3061138423674441, 0.0291314243264966), (0.85248801540015995, -3.730349362740526e-13), (-2.1036256706506755, -0.82454010181508952), (1.2494656681959886, 8.3259669676483122e-07), (0.79204517004852759, 8.04972088985778e-11), (-2.2597414662537796, -0.59256991207451437), (3.8241395498611612, -0.0031688943163544979), (0.7971089446298214, 0.0042585105270834256), (0.88770446729999997, 0.022395876299999992), (3.8692877405993871, 0.01070401373575498), (4.3043057500639641, 0.013100954553989385), (0.89574490718999999, 0.0080404398900000285), (1.2494660241560545, 2.0232099995354244e-09), (0.81134251219226039, -4.4136701911168251e-06), (-2.4700577011952025, -0.36643203054452711), (3.9890520225177517, 0.044410325266253547), (4.4155759370362908, 0.12273379165962604), (2.2733980969097791, 0.42840444054384874), (1.2494660249997329, 5.4626614343078471e-11), (1.3882955833590493, 4.8828828884972528e-05), (0.88005018898114051, 0.029539559044005344), (4.4382000672215645, 0.16699680206637763), (0.81974343736229915, -3.4777736246383029e-13), (-2.528799439876134, -0.26905797362235423), (4.4862333566095689, -0.00013375367688608363), (0.8071243240975039, 0.0036723491788575257), (-2.1191529342940147, -0.78830981998063165), (4.3812401081832473, -0.11924072120335481), (4.8112632688369308, -0.18174763169707722), (1.64934, 0.23814000000000002), (1.3649155090387584, 0.046316770531390647), (0.81134062199827806, -3.2175655917399125e-09), (0.9014895784659126, -0.0028633230871295099), (4.5002834907914737, 0.019526825254391509), (1.5606839978507372, 0.022055605014946675), (0.90050198593977382, -0.00098759252613882524), (1.4087345694439002, 0.0042840979435305512), (0.80722361443500001, 7.7715611723760953e-17), (0.89691512714999999, 0.0058457416500000241), (1.4118062922840426, 0.00128525399769015), (1.5692856838065663, 0.001985004451345218), (1.744596, 0.09525599999999998), (4.9580933278362984, 0.044945121648286075), (5.5303950253649115, 0.23265541180448793), (0.91082604151350011, -0.015810763531500072), (5.2202283731563748, 0.056447641817826348), (0.80822602885116113, 0.0011017047536572731), (-2.4747158802882043, -0.35556294599418964), (5.1821963142247256, -0.0035589723977912154), (0.80855654027725832, 0.00033051142609721304), (0.89855354225700002, 0.0028086350670000313), (1.4331464641302321, 9.5549426157859321e-07), (1.5923854151419699, 0.023099731335403526), (0.90016712950193223, -0.00033485643784160186), (5.2887096278350629, 0.014507523249891461), (5.8832523753325576, 0.069819449039045259), (0.89951508370709998, 0.00096154145010000078), (5.4287491690950862, 0.051698779789701721), (1.3883164591482626, 1.1865405413757911e-07), (0.90409831245405003, -0.006727729059450082), (1.2494848353974357, 2.3036055640801577e-08), (1.3883164947444788, 3.5596216241273734e-08), (0.90148464373621506, -0.0026136687178350158), (5.7546416077034817, 0.059161349893361768), (1.5993153345425908, 0.0069299194006210421), (1.7803169999999999, 0.035720999999999933), (6.0135005857499095, 0.091650749176271598), (6.6594561178771317, 0.23723781571769437), (0.89983923142113009, 0.00032414771403006522), (6.2393961528802411, 0.057150456592344405), (6.9598768952283683, 0.069327871696439475), (0.89895283159500006, 0.0020377044450000546), (6.4355172402558889, 0.040115171377992538), (7.16967717395638, 0.048415448937233305), (7.9893629467470406, 0.2231531242568989), (1.2494848548554955, 5.9532179186305706e-11), (0.8032355207609001, 5.139493516881366e-07), (-2.40494114448, -0.46545066288000009), (1.4512943818648909, 1.406087804767253e-06), (0.8096828805037064, 3.5542697020773947e-06), (-2.6171057640864612, -0.1423898837982569), (5.2574130232332106, -1.1662807310544023), (1.3883165054233437, 1.0678864903468366e-08), (0.89248415669434211, 0.01243396771320162), (4.9075288039168896, -0.34988421931632069), (1.6125499827488332, 0.0030541495860558539), (0.90005509896657965, -0.00011203053535255857), (1.2494848583464397, 6.5998631004759992e-10), (1.3883165095881012, 9.6109777913966346e-10), (0.8972859770083027, 0.0048018203139605807), (1.4520453890236855, 0.00017317028983214743), (0.80968440342901349, 7.7731877601294737e-10), (0.89964933751350007, 0.00069650591850000103), (1.4522921739954227, 0.00017457296087703965), (1.613741101087395, 0.00027487346274508435), (0.94720890600000007, -0.056604113999999921), (4.743243427704984, -0.0064224301565867668), (5.267212175153194, -1.8391780855734809), (1.5425739000000001, 0.35496090000000019), (4.2531582902035767, -0.0096114099641824591), (0.80992768547197469, 5.7814668707900636e-05), (-2.6705390292259383, -0.053433265139476924), (1.4524411512376305, 1.2967725484536172e-07), (0.80989541673945553, 1.0770349234690001e-07), (0.8998838476645501, 0.0002345101510499825), (1.452456791688769, 1.5586375723231071e-05), (0.80994461460332967, 4.9155859512173267e-05), (0.899961868222515, 7.8020557964952875e-05), (1.4524680930546903, 4.8018472447175498e-06), (1.6138557233213597, 7.4215834941160349e-06), (0.91898217179999997, -0.028226734200000089), (1.3389013955905866, 0.00050822675411568154), (0.81046974431017105, -3.2499114510642356e-12), (-1.084730341879049, -1.5849625356155521), (4.2480543379491911, -0.0096634146376977977), (1.6138579497964078, 2.2264750481726379e-06), (1.79317656, 0.012859560000000169), (1.4542589609475622, 0.0017868076320916692), (1.6166941507189223, 0.002836200922514531), (0.90001801772477397, -3.7081241805703152e-05), (4.0507090783031048, -6.8736152982751262e-07), (0.80995023319277082, 5.2033201836776398e-06), (-2.0188591025637148, -0.93412876068466566), (1.4557692757416278, 4.9546360455843264e-05), (1.6175450109956766, 0.00085086027675440601), (1.797677406, 0.0045008459999999577), (1.36594416768133, 0.00015246892654194875), (0.80913907377841288, 9.6532656007286551e-06), (0.89904801210249075, 0.0017620350941880967), (4.0507087839343434, -5.0108663884884655e-10), (0.8099517941888259, 1.5609960550722057e-06), (0.89994718131903906, 0.00010794989790895436), (4.051952127758879, -0.0039776464857072648), (4.5002749134690525, -0.049657808310484074), (2.5209894290729338, 0.2475913321631546), (4.0410973907719612, -0.0096113929669581211), (0.80998881717922178, 2.514100039263667e-13), (0.89998757464369949, 2.5706421184490402e-05), (1.4571271204312601, 0.00023215552058946097), (1.6191406840604108, 0.00036823224570785572), (1.7992205531999999, 0.0015431471999998835), (4.0344700341367181, -0.0037589537714882936), (1.5267517809356634, 0.0089634348167849428), (0.90000585172787217, -1.2165996901758458e-05), (4.0328699643903025, -2.5457696518405015e-05), (0.80999636060639457, 4.2875418782006843e-08), (-2.2937054551949458, 0.20697939545487831), (1.3764312279025015, 0.00015283879363134909), (0.81046974430877827, 0.0), (0.90052193812086467, -0.0009627056153504453), (1.4577394602550569, 6.8967601420943934e-07), (0.81000202150719613, -7.4902298768941833e-07), (0.90000188944149373, -3.9622863784671832e-06), (1.3773551028881228, 0.0001994464283319397), (0.80970439238155822, 3.1967042664393651e-06), (-2.6369029319628403, -0.10810349208670619), (4.0316333153917006, -2.3361252474884961e-05), (4.479581448251504, -0.0013730561362041093), (0.89998277796352166, 3.5596644482660533e-05), (4.0328317014533699, -3.3063445806558178e-05), (4.480908368227964, -0.0044692027479434236), (4.976658884024113, -3.012704062722928), (3.3065605048518476, -0.72627119660152251), (3.3275910385037504, -1.151578492906892), (3.1489526652072342, -1.8277062188168789), (1.4577751945289987, 2.0157808751086747e-07), (0.81642645138600078, -2.0983215165415457e-15), (-0.63813579195795733, 0.018983514568568005), (1.3774328869951722, 1.7950178549863692e-05), (0.81000098886807315, -1.032639123010881e-06), (-2.5914105433440002, -0.18646939886400007), (1.3774398875648068, 1.6155160694752979e-06), (0.8097057513005419, 2.5893304533841641e-08), (-2.6775498095888519, -0.040646877626011643), (2.2179779525504109, -0.0049456827061772563), (0.80999637898154153, 7.5928152654114453e-14), (-2.6897838987677813, -0.01924486954184319), (1.3774405176160738, 1.4539644626054836e-07), (0.81016991059701937, -1.9413693567149613e-05), (0.9001795449362594, -0.00034239318460523857), (2.0522910951468365, -0.16362450771509862), (0.80999637898157317, 2.0206059048177848e-15), (-3.5324128075321628, -0.087703449091615704), (1.4577752809179072, 3.9676928409448915e-12), (1.6197503121328973, 3.9472321240174853e-05), (0.90000060700938778, -1.2824321059756726e-06), (1.3775178807134036, 1.7839936780617016e-05), (1.5305839182228835, 2.1781146604826773e-05), (0.90000019415589827, -4.1285348949537944e-07), (1.3775289549254564, 5.7222310185345291e-06), (0.81000013678583227, -1.8925528453284101e-07), (-2.6157083103585608, -0.14565060916335815), (1.4577885601978733, 1.3428484757271874e-06), (1.619765706338181, 3.5525089116639206e-06), (0.90714050153999992, -0.011841670260000003), (1.3775311865955535, 5.1500079161215236e-07), (1.530590452566865, 6.5343439814791179e-06), (0.90006075253087781, -0.00011879240538160696), (1.9394022028323943, -0.06380153999991249), (0.81003955844085362, -4.9688832705174768e-05), (0.90002029247426341, -4.0460056614421974e-05), (1.4577896344766004, 1.0742787270201503e-06), (0.80999637898157384, 6.2172489379008762e-16), (-2.6965218266303346, -0.0067379278625531829), (2.3905608979991015, -0.00046753684968603432), (2.6559561389594686, -0.67215655058947799), (1.70065917, 0.15808526999999997), (1.4025006611643129, 0.024967022761711321), (1.5702231264183053, 0.039630125457287502), (1.763563851, 0.062904681000000059), (2.1871184177294656, -0.07626463115331851), (1.5969266986644917, 0.026703572246186334), (0.90000006186269399, -1.3229320422469826e-07), (1.4415454359108308, 0.0067633005852578698), (0.81001609341902681, -2.3465021826785113e-05), (-2.4366897307691149, -0.41783062820539985), (1.4577902548725592, 2.9811234079080148e-07), (0.80999637898157395, 1.5543122344752191e-16), (-3.1324238422596484, 0.39998896527251437), (1.4441831231390814, 0.00060869705267314607), (1.6049377703383476, 0.0080110716738558841), (0.8996730693307472, 0.00062505722825643149), (1.8914182435651405, -0.00091430268187433486), (0.80999637898157406, 7.7715611723760953e-17), (0.89999597664619335, 8.4020024938236123e-06), (1.4459346075359829, 0.0015688752810995243), (1.6073410918405044, 0.0024033215021567189), (1.7870789853, 0.023515134300000028), (1.4577904315645485, 8.7258287129188256e-08), (0.80999809738443551, 1.7184028614392055e-06), (-2.8845371526778942, 0.24788668958175405), (2.1432649401006629, -0.012051126437868919), (1.6197671877343971, 9.5917740616791031e-08), (0.90257590546199995, -0.0045645960780000272), (1.8853198514054597, -0.0014073212676185996), (0.80999481406413731, 3.8348175207536528e-07), (-1.3229999999999997, -1.3229999999999997), (1.8848976550251741, -0.00042219638028553327), (0.80999492910866289, 1.1504452558375177e-07), (0.89999442045939948, 1.1642495877839387e-05), (1.4577904837237334, 2.598169881462553e-08), (1.6197672165097192, 2.8775322169494186e-08), (0.90000001964358556, -4.2219108420393778e-08), (2.1382396203760718, -0.0003253804138224403), (2.3756668573636563, -0.018148226865915884), (2.3234722995621704, -0.82548036564506377), (2.1347119913742669, -0.0035276290018047439), (1.8829948491064341, -0.20903160419084568), (0.90000670775677893, -1.3584717484438346e-05), (1.6721759448137352, -0.079144598748769779), (0.80999734615572028, 2.4170470573570132e-06), (-2.6033165192307344, -0.16662678846161957), (1.6484325651891043, -0.023743379624630932), (0.80999807126983747, 7.2511411718378933e-07), (-2.1167999999999996, -0.79380000000000006), (2.1336537026737257, -0.0010582887005412987), (1.8202853678491804, -0.06270948125725366), (1.9926776398686512, -0.33079465969351918), (1.4577904969567792, 1.3233045681459997e-08), (0.80999861290529396, 5.1552085842399001e-07), (0.89999870426978301, 2.7276235896822595e-06), (2.1319032642782276, -0.00040394732203807848), (2.3685890488859491, -0.0016333404179324606), (1.79552664459, 0.0084476592900000636), (2.1314733787426272, -0.00042988553560037164), (1.6197672277320949, 2.5897790356665947e-09), (0.89999958466371244, 8.8039392940331132e-07), (1.455439678901304, 0.0012784003122039422), (0.81000001483113049, -2.1547102546648489e-08), (-2.6614016230031998, -0.06999107965919972), (2.1313444130819472, -0.0001289656606800804), (1.6177639608326571, 0.0020230686855005064), (0.89988952050922422, 0.00021645117847697291), (1.5240064296088747, -0.016700269355433138), (0.81000261528552642, -1.485836989012501e-06), (-2.6656878357692202, -0.062371316538485773), (1.4565186457149761, 3.5344352168031884e-05), (1.6183708814383073, 0.00060692060565015193), (1.798478878077, 0.0029522334870000222), (1.4570484240518855, 0.00051917503125902258), (0.8100000083669997, -6.4641307639945463e-09), (-2.4741616365584833, -0.1804561813635375), (1.5174933245602558, -0.001503024241989026), (0.80999835406434317, 6.5260270520894892e-08), (0.8999982022589228, 3.7817995232836129e-06), (1.4577905055744291, 1.9529187156308579e-10), (0.81000000642776049, -1.9392392136552417e-09), (0.90000000621850884, -1.3425076683670766e-08), (1.457423923569543, 0.00015900352962230357), (0.81000000316513321, -3.2626272794544771e-09), (-2.6010634909675452, -0.12690185440906174), (2.1311608613212334, -9.3795580041522428e-06), (1.6827676589230716, -0.0026203092032497598), (1.8684940769605956, -0.1241835629080557), (1.4577905058414857, 6.162848009694244e-11), (0.81129759620746655, -0.0011316383930287997), (0.90090289813859992, -0.0016730073234000331), (1.4577905059040264, 6.2540705947355943e-11), (0.81000000218634505, -9.7878818383634317e-10), (-2.68661402490096, -0.025212401897760237), (2.1311210852369502, -9.179096372902151e-06), (2.3679079459316714, -4.4100191284179856e-05), (1.7997413653800001, 0.00052081218000012966), (1.4574915159699853, 1.2879285898659275e-06), (0.80996681811201399, 1.0143412032537213e-08), (-5.7682213127147657, -0.50581693699888308), (2.1311099965718854, -1.1088665064784563e-05), (1.6194356310437565, 0.00024571144741136752), (0.90000219833138373, -4.5094253952049357e-06), (1.4578594093930468, 6.8903470258163668e-05), (1.61987659939081, 0.00010937057877709044), (1.7999149694400001, 0.00017360406000004324), (1.4853120190118712, -0.011007943598763226), (1.6451048098867949, -0.0086914267006792389), (0.89999942351400763, 1.2212550848822445e-06), (1.457538457725696, 4.6555377133827847e-05), (0.8100000018927086, -2.9363647069402529e-10), (0.90000000196318264, -4.2553261692113148e-09), (2.1311018071119907, -3.1486146316872517e-07), (2.3678907468570705, -3.9690172156880973e-06), (2.6309878287218802, 0.10999839964894628), (1.4803669562858137, -0.0049450627260573914), (0.81000104934690431, -9.4634459767428676e-07), (-2.6922086218766554, -0.014658812287803613), (1.4579557364318163, 3.2246819336467775e-05), (0.80999986559405612, 3.5183157998108783e-08), (-2.7718041458033684, 0.11273300687452598), (1.4579654104776172, 9.6740458008781616e-06), (0.80999987614900348, 1.0554947360574829e-08), (-2.6609635472902635, -0.059900056322718283), (1.4783048651290478, -0.00013351669360357475), (0.81000068027251126, -8.5171013819440581e-08), (0.90000071530072023, -1.4830306635071898e-06), (1.4777720062270383, -0.00053285890200951416), (0.81000034982003621, -3.3045247503915572e-07), (-2.6973456902629964, -0.0051370683863412037), (2.1536567607195498, 0.0052049892940520866), (1.6199661738858291, 2.067103731200337e-05), (1.7999722587797999, 5.728933979989303e-05), (2.1604232751393493, 0.0067665144197995627), (1.6195380927173271, 6.6342090801807524e-06), (1.7994899288331001, 0.0010110507561001069), (1.4579805317542844, 1.2219062927010248e-05), (0.81037059781237608, -0.00021392270655934406), (-1.646740737587387, -1.0086049456294297), (1.4776121485564355, -0.0001598576706028698), (1.6417151534735299, -0.00078222840306114701), (0.90000023133060769, -4.8397011257472757e-07), (1.4774163500870761, -0.00019579846935946499), (0.81000012209070693, -1.2859358680117337e-07), (-2.6881142147307657, -0.022426378961545621), (1.4579841974731624, 3.6657188780875315e-06), (0.81000000067668554, -2.8062073775814155e-10), (-2.6954422688702881, -0.008828243969328263), (1.4579852971888259, 1.0997156634884318e-06), (0.81030642100040828, -6.4176811967842074e-05), (0.90030990739158001, -0.00059299074701992796), (2.1654154040047766, 0.00032323136538727756), (1.6199895912166962, 5.4039994307641941e-06), (0.899999867413947, 2.8275023458146362e-07), (1.4578347454146039, 7.3866997780225317e-06), (1.6198199012700891, 6.5032742945048117e-05), (1.7998308582729301, 0.00034092943982990672), (1.4579911733093609, 2.1416861945011689e-06), (1.6199912124165254, 1.6211998291826289e-06), (0.90000000061824392, -1.344938760361458e-09), (1.4579921222219872, 9.4891262620855337e-07), (0.81000000030013353, -2.923658204423418e-10), (-2.6984700990810868, -0.0030278302107986208), (1.4772956363335723, -6.1974212695914402e-05), (0.80999993722668573, 5.7911198070303978e-08), (-2.7264741437410107, 0.045330002062357752), (1.4579924922979113, 8.540213631835768e-08), (0.8100000002124238, -8.7709761675824885e-11), (-2.6854824141870792, -0.02451886689681566), (1.477271466390621, -5.5776791426431766e-06), (0.80999995981205297, 5.2120078364303872e-09), (-2.7094221131223035, 0.017052030618707369), (2.1661591785470384, 0.0001492627229180865), (1.6199916987764742, 4.8635994869261619e-07), (1.7999910080182802, 1.8749238480109121e-05), (1.4772697930868781, -1.6733037428551255e-06), (0.80999996137565533, 1.5636023587006775e-09), (-2.6948027292561241, -0.0093203150690447586), (1.4772692910957552, -5.019911228254514e-07), (1.6414100843963362, -7.0400556275540527e-05), (1.8237554585881788, -0.044738618372416723), (1.4579957921654867, 7.5382170980908816e-07), (0.81009994479769754, -1.336896276543653e-05), (-2.2536122212762155, -0.60687148368882871), (1.4710377412647135, -0.0062315498310415718), (0.80999977209925955, 1.4516910734618804e-07), (-2.6988325450891004, -0.0023107184587658923), (1.4579960861559536, 6.7843953854840311e-08), (0.81009593410886782, -4.0106888296698172e-06), (-2.5269606663828648, -0.27334844510664907), (1.4579440390283807, 9.4725265524786546e-07), (1.6199382722153381, 2.7316371980568019e-05), (1.799944421368779, 0.00011356309584886758), (1.4691682763154013, -0.0018694649493123936), (0.80999981564999179, 4.3550732242714219e-08), (0.89999981590510147, 3.9239109389521687e-07), (2.1664968148443298, 1.2592401615840742e-05), (2.4072246795420882, 2.0076496578980141e-05), (1.7999818755767036, 3.7454207924647596e-05), (1.4579961065091398, 2.0353186203081463e-08), (1.6199956835910376, 3.9848145633625267e-06), (1.7999971015207861, 6.0935025058217459e-06), (1.4579813166057318, 1.6965032124960364e-05), (0.81000000017821694, -7.8938855452292942e-12), (-2.699492255250326, -0.0010221561692393521), (2.1665077970135256, 3.4099908576834532e-06), (1.6199981192975321, 2.4357064945190739e-06), (0.89999995782863407, 9.0414687115014655e-08), (1.4654481133529909, -0.0012899037075051467), (0.80999990779388165, 9.2143889862672513e-08), (0.89999994142680018, 1.255216987350316e-07), (2.1665091269099599, 3.0689917731585579e-07), (1.6199988500094804, 7.3071194837126532e-07), (0.90000000019425985, -4.2398404787036268e-10), (2.166509218979713, 9.2069753288015469e-08), (1.6273943816754477, -0.00026705996715872257), (1.8080888082264537, -0.015666650361725074), (1.4579990260984681, 3.1780534484049381e-07), (0.81009473090221895, -1.203206648869859e-06), (-2.7032705949366909, 0.0061515181856125253), (1.4579991214400714, 9.534160338997566e-08), (0.81000000009113038, -8.4718410064965608e-11), (-2.6981882202768372, -0.0033854910207130827), (2.1665095881018459, 3.6912213272621838e-07), (1.6239289495102842, -0.0034654321651634841), (0.8999999814246209, 3.9997820755477415e-08), (1.4579926308188653, 1.4364700375635308e-06), (0.81000006742557318, -1.0416080442610109e-09), (-2.6959566236192298, -0.007842408888463881), (1.4579930617598766, 4.309410112535161e-07), (0.81000006711309069, -3.1248242882142563e-10), (-2.698643694845769, -0.0026870712265391725), (2.1665096988384858, 1.1073663972460678e-07), (1.6228893198607353, -0.0010396296495490452), (1.8027152936629363, -0.0053735145635175341), (2.1665098345098399, 1.3567135397352102e-07), (2.4072332140607839, 1.6261962221264525e-07), (2.6747036486165641, 0.04371581989468365), (2.1729911384622147, 0.0064813039523748724), (1.6214345415363705, -0.0014547783243647582), (0.89999999412636056, 1.2701739637854814e-08), (1.4579991500425524, 2.8602481094708307e-08), (0.80999998726543299, 1.6368327693250249e-09), (-2.6993806865330514, -0.0011924662562141197), (1.4579991586232968, 8.5807443594987363e-09), (0.81000000005809025, -7.6246786662181876e-12), (-2.6997914720949154, -0.00041078556186384673), (1.4579932414622783, 1.1635407304311229e-08), (0.81000000005580286, -2.2874035998654561e-12), (-2.6701197931075682, -0.054411482749007242), (2.1749355296479274, 0.0019443911857125239), (2.4175209335067662, 0.010287719445982101), (1.7999990701908266, 1.9686700404308866e-06), (1.4579994547859148, 2.9281612785592158e-07), (0.80999998790379779, 1.473149158215392e-10), (-2.6999306214689747, -0.00013914937405923311), (1.4579932460000871, 1.0471866263017659e-09), (0.81000006698025451, -2.5311197582311706e-12), (-2.6991086381888989, -0.0017629479259023471), (1.4589002263959618, -4.5013752162592621e-06), (1.620998108039061, -0.00043643349730939637), (0.9000000744212997, -1.5690930793565983e-07), (2.178221534878233, 0.00075830889930128542), (1.6208671779898682, -0.00013093004919275674), (0.89999999814760046, 4.021239907725515e-09), (1.4579995426307533, 8.7844838403405845e-08), (0.8100942616516259, -1.0828859842160198e-07), (-2.6363512999148595, -0.10939063353199464), (1.4587664933700413, -4.9896682364369834e-05), (0.80999998794799222, 4.4194459203339419e-11), (-2.6996125626567302, -0.00078001756762997583), (1.4579942248226603, 9.785084171154423e-07), (1.6199940490926781, 1.5530383653983292e-06), (0.90000000006091396, -1.3334584547664006e-10), (1.458751524365332, -1.4969004709342037e-05), (0.81000003510865448, -3.1870840677683529e-08), (-2.6995501207817307, -0.00090642593596155228), (1.4579949880224692, 1.7612303273573102e-07), (0.81000002554740225, -9.5612522343913042e-09), (-2.6997040707896693, -0.00059543260077052904), (1.4579950408593789, 5.2836909758546823e-08), (0.80996682245890539, 6.6547878319056502e-13), (0.89996313606576728, 7.3615556543094032e-05), (1.4579996670373851, 9.0147145059837891e-08), (1.6199996729687509, 1.3932592750620641e-07), (0.8999999866299252, 2.8801291152014129e-08), (1.4579951447677271, 1.0390834821460969e-07), (0.8100000226790266, -2.8683756703173912e-09), (-2.6998521399329194, -0.00030201915118857056), (2.1785438919913256, 6.142302084422013e-06), (1.620816115270683, -1.1783704427337227e-05), (0.90000002383302524, -5.0588274513874154e-08), (1.458732578556645, -2.9316308592486349e-06), (0.80999999372560338, 5.7643528172945933e-09), (0.89999999577337819, 9.1434529503331412e-09), (1.4587310309313462, -1.5476252988033679e-06), (0.80999999727810124, 3.5524978070355926e-09), (-2.7011143667810074, 0.0021562281556835039), (1.4579952117091655, 3.5768933903668193e-08), (1.6199946967096763, 4.1932035887981553e-08), (1.7999941274228322, 1.2251846128452647e-05), (2.1791297670238818, 0.00058347953474338068), (1.6208115196259565, -1.0605333985225228e-06), (1.8009011834573807, -0.0018141102055554857), (1.4579968101178764, 1.5984087109233157e-06), (0.81000000002848427, -2.6426572041771123e-11), (-2.6999771403928423, -4.6518923867644446e-05), (2.1794798049920812, 0.00035003796819941255), (1.6199972168335344, 2.520123858085199e-06), (1.7999981076517959, 3.9802289637957957e-06), (2.1796373146148738, 0.00015750962279268419), (1.6204301460839883, -0.00038137354196812187), (1.8002963336447642, -0.00060484981261650357), (2.1797003169714113, 6.3002356537644736e-05), (2.4219192422015068, 2.499915825371346e-05), (2.6910332845849694, 0.016329635968405174), (1.4579984200042126, 1.1303637230009044e-06), (0.80998237635765857, 1.5553898753239981e-05), (-2.6998330442328977, -0.00034078898257168251), (1.4582450875219743, -0.0001729531187503186), (1.6201899608408838, -0.00024018524310451814), (1.8000966936756941, -0.0001996399690699535), (1.4581218701533245, -0.00012321736864975285), (1.6200767363440194, -0.00011322449686443913), (0.90000000760189824, -1.6231126998000889e-08), (1.457999754298571, 6.4564575907866129e-10), (1.6199997273058626, 1.2539333438255084e-08), (1.7999997029776251, 6.3278679858225211e-07), (1.4579998372311844, 8.29326134876851e-08), (0.81009421941907256, -9.7459738501726169e-09), (0.90010468360247398, -0.00020522378910602378), (2.1843145494220644, 0.00010089081059883043), (2.427064209267658, 0.00033312736399531139), (1.7999993931230227, 1.2854712268861589e-06), (2.184407777737039, 9.3228314974735932e-05), (1.6199996536414778, 4.0115870412193996e-07), (1.7999998061851519, 4.1306212925640292e-07), (1.4580635055128222, -5.8364640502284178e-05), (0.8099999986635753, 3.197248243935746e-10), (-2.7003742665243022, 0.00074010025670534496), (2.1844546345530702, 4.68568160312266e-05), (1.6200427689949601, -3.3967349059316196e-05), (1.8000313461773876, -6.5347498306511651e-05), (1.4579997687114963, 2.3987792139301686e-07), (0.81000000001817785, -2.3784085811939803e-12), (0.90000000001906499, -4.1849002041516313e-11), (2.1844802751567221, 5.9170623812665463e-06), (2.4272031233784439, 8.9944388277363174e-06), (1.7999999054694007, 2.0249177565823117e-07), (1.457999945190172, 3.1427455238208776e-08), (0.81000000000920613, -8.9717233642261353e-12), (0.90000000000595681, -1.3108214513835036e-11), (1.457999962973878, 1.7783706018903444e-08), (0.8099999987594928, 9.591746286119473e-11), (-2.6999925283034978, -1.5387910655473291e-05), (1.4579999683089897, 5.3351117745847884e-09), (1.6199999673282959, 1.3262650044865153e-08), (1.7999999700136542, 6.4544253430831586e-08), (1.4579999372353241, 1.3403137799627984e-08), (1.6199999366439177, 1.8323898998140462e-08), (0.9000000000018582, -4.0985659310877052e-12), (1.4579999447194822, 7.484158270898433e-09), (1.6199999421410873, 5.4971696528127721e-09), (1.7999999383300191, 1.3214486727086694e-07), (1.4579999874200844, 6.8665603869533236e-09), (0.81000000000106975, -1.2805978499841329e-12), (0.90000000000057889, -1.2793544001965528e-12), (2.1844861574623682, 6.8112622164662174e-08), (1.6199999908126781, 1.5205715353516779e-09), (0.8999999986673336, 2.8939554530538201e-09), (1.4579999916307791, 1.1927664633759604e-09), (0.80999999937238198, 5.8411395720270318e-10), (-2.6998726085360194, -0.00026004587928913909), (2.1844861778961548, 2.043378661831241e-08), (2.4272068740594355, 2.4284984845301949e-07), (1.8000101052756201, -2.1240901767516362e-05), (1.4579999919886091, 3.5782987684029877e-10), (0.81000000000043437, -6.3532512584174583e-13), (0.9000000000001801, -3.9875880375461745e-13), (1.4579999921821745, 1.9356534153303072e-10), (1.6199999914057011, 1.3685144129027548e-10), (0.89999999958079613, 9.1346253894286629e-10), (1.4579999922661089, 8.393441497389631e-11), (1.6199999914467564, 4.1055447930204989e-11), (1.7999999905159463, 2.0502292152890788e-08), (2.1844862653904906, 1.5174363010572732e-08), (1.6200037464944297, -1.9336005807613077e-06), (1.8000032420094072, -6.8632662128864647e-06), (1.4579999948758793, 2.6097704441951917e-09), (1.6199999955492803, 4.1025239871927965e-09), (0.90000000000005598, -1.2411183192284623e-13), (1.4579999830163357, 1.9779403448438867e-09), (0.81000000000006056, -1.0499379143880105e-13), (-2.6999455235672092, -0.00011247933431155487), (2.1844862766786304, 2.6049554957552345e-09), (1.6200017764587571, -1.9700356725271814e-06), (0.89999999986841772, 2.8762159320905312e-10), (2.1844862774601173, 7.8148674198530441e-10), (1.6199999820711384, 7.6084081257477008e-10), (0.89998782479363015, 2.4688727862876014e-05), (2.1844862776945631, 2.3444592933685723e-10), (1.6199999822993907, 2.2825230594492038e-10), (1.7999999804413478, 4.211132860199029e-08), (1.4579999893792603, 5.4477286903775731e-09), (0.81000000271590644, -1.2631649171090941e-09), (0.90000000241616673, -5.1857315663816905e-09), (1.458001081095031, -4.0545089803334377e-07), (1.6200010081448448, -1.7730321051345753e-07), (0.90000000076552922, -1.6506375488667401e-09), (1.4579999940724433, 1.4535088688205633e-09), (0.81000000000002914, -3.1474822748123188e-14), (0.90000000000001734, -3.8624659026709194e-14), (1.4580009259494546, -1.551455762971443e-07), (0.80999999946938328, 1.4199885711718707e-11), (-2.6999584344825061, -8.5825946486561827e-05), (1.4579999975106757, 5.4492632628466702e-11), (1.619999997260033, 1.1076821682109993e-10), (0.90000000000000535, -1.1968204205459187e-14)]
 td_error_delta_data = [(-np.inf, -np.inf), (-np.inf, -np.inf), (-np.inf, -np.inf), (0.0, 0.0), (0.0, np.inf), (-np.inf, -np.inf), (0.23496857357199658, 0.23491498199867458), (0.0085849469999999973, -0.020031542999999985), (0.22784999999999994, 0.44834999999999992), (0.10467156607884195, 0.10042671561950521), (0.028016377199999991, -0.065371546799999958), (0.15140999999999999, 0.13671000000000005), (3.2457797568019581e-05, -7.5734860991916167e-05), (0.063397062367625726, 0.052728521142206768), (0.12201000000000008, -0.03968999999999985), (0.08728002498716167, 0.069577053841878012), (0.0022168210865276925, -0.0051725825352312172), (0.4579049999999999, 0.23005499999999995), (6.5690768023762836e-05, -0.00015327845872206147), (0.014728818355206584, -0.034367242828815467), (0.20406540000000004, 0.013847399999999982), (0.00573362613973003, -0.013378460992703454), (0.098523188447179097, 0.084636648839915132), (0.1494161655, -0.10363771950000003), (0.030384338812113262, 0.02180150218585912), (0.045142237351096209, -0.10533188715255767), (0.58932299999999993, 0.43791299999999994), (0.022200971460238361, 0.0050902061086928879), (0.027091653737737587, -0.063213858721387961), (0.10708656000000009, -0.0048686399999998686), (-0.13427018376948607, -0.15190163423898412), (-0.24368121399519962, -0.27086630722386695), (-0.39974086025999994, -0.53727132605999994), (0.0055446910714492589, -0.012937612500048165), (-0.0015260570972282727, 0.0035607998935325842), (0.25423650000000009, -0.20366849999999981), (0.030374889922930557, 0.022011120146168926), (0.044231363476034957, -0.10320651477741483), (0.33996690000000007, -0.24935609999999986), (0.053098598139502351, -0.036550528235390234), (-0.075136735747416361, 0.17531905007730464), (-0.29632225807800006, 0.10341860218199989), (0.018827177796039526, -0.043930081524092238), (0.097267088262635013, 0.055433809781071576), (0.10501480181283002, -3.4537563270056748e-05), (0.12616508128451576, -0.084957277190499281), (-0.10518582780528513, -0.030049092057868765), (0.11133045, -0.14290605000000009), (0.0018157329288854605, -0.0042367101673993048), (0.034833950579152437, -0.081279218018022126), (-1.702474032, -1.8095605920000002), (-0.00045753357834557026, 0.001067578349472842), (-0.1988562934454422, -0.21048650181148898), (-0.18720845205184072, -0.29818027854570472), (-0.0009922697479019416, 0.0023152960784376562), (-0.028218608645107866, 0.065843420171918327), (0.15094106999999995, -0.18902583000000012), (-0.00010205922253898602, 0.00023813818592435251), (-0.0032015807162353305, 0.0074703550045489998), (-0.34155668683432799, 0.061965602613431925), (0.0053844388510287718, -0.01256369065240088), (-0.013215952499054405, 0.030837222497793769), (-0.22894225762943085, -0.20080139886466133), (-7.4401173233429308e-08, 1.7360273751876321e-07), (-1.1106786125336665e-05, 2.5915834292400401e-05), (-1.0311222095999999, 0.67135182240000013), (-2.0247452488220129e-05, 4.7244055805872866e-05), (0.0010503675941370581, -0.0024508577196531876), (0.063617322711170723, 0.29255958034060159), (-5.4238424862518285e-11, 1.2655645420522887e-10), (-0.031555748341585588, 0.073630079463699538), (0.8819999999999999, np.inf), (-0.00022485255331845531, 0.00052465595774303653), (-0.0011894357249148779, 0.0027753500248013816), (0.60990299999999986, 0.4878929999999998), (0.10919202957086761, -0.086138691921149271), (0.22326853628252566, 0.22445797200744053), (0.058775196813351201, -0.0048421258978195228), (0.014015507033277717, -0.032702849744314831), (-3.9695339237866276e-10, 9.2622460812208359e-10), (0.0610020002152055, 0.34766199949785381), (-0.026341442683703906, -0.063464453909854238), (0.066980560884757651, -0.15628797539776801), (-0.028675150349999998, -0.17809131584999999), (1.0217304627269108e-05, -2.3840377463524293e-05), (-7.287162095970245e-10, 1.7003379260138727e-09), (-0.14181667742340015, 0.15450558065459991), (0.046718439537799701, 0.04671816367057479), (0.074156121869257394, -0.17303095102826699), (-0.06373037999999992, -0.26779577999999993), (0.0011701782731807552, -0.0027304159707549399), (0.0060282504796281607, -0.014065917785799196), (-0.03065254510499997, -0.0019773947549999726), (0.034022321349299695, 0.0077471442656286763), (-0.0099748588192354534, -0.0099279328379337384), (0.17788986583872846, 0.074923646376300043), (0.00011659080378765284, -0.0002720452088380121), (0.02224683656077717, -0.051909285308480227), (-0.058421003227020048, 0.08339567419638011), (-0.0026084263354789082, 0.0060863281161178664), (-0.013089157512083682, 0.079677350668960797), (0.059967620999999999, -0.090973448999999956), (0.022854890941658643, 0.0053283806104270394), (-8.0796356435797182e-05, 0.00018852483168357859), (-0.96093304024838155, -1.13882290608711), (-0.0055657201850405789, 0.012986680431761141), (-0.10142583424458529, -0.12935748161329852), (0.04391698500000004, -0.06741346499999995), (0.0012616715621820206, 0.0012607517982284433), (-0.00038155239874549936, 0.00089028893040611341), (-1.4254670060502981, -1.08391031921597), (2.2480563877103064e-08, -5.2454648891142588e-08), (0.0005425425431665686, -0.0012659326007219418), (-0.022289100968106046, 0.036131902258914002), (0.00037850146817011151, 0.00037822554059949718), (8.3334288901459883e-05, -0.00019444667410350997), (-1.3046993999354379, -1.3657014001506433), (-0.058791310116607494, -0.071984875718924354), (0.00060066458714096431, -0.001401550703328969), (0.016330450499999972, -0.027586534500000068), (0.0048517845313263749, 0.0055841734966066252), (0.00018019937614224268, -0.00042046521099872161), (0.5292, -0.35279999999999989), (2.76861098609249e-06, -6.4600923009860969e-06), (-0.00013812929614986924, 0.00032230169101625793), (-0.0081155702904317506, 0.014173530677674295), (0.0291314243264966, 0.026578500253598779), (-3.730349362740526e-13, 8.7041485130612273e-13), (-0.82454010181508952, 0.60092690423520856), (8.3259669676483122e-07, -1.9427256256809854e-06), (8.04972088985778e-11, -1.8782689847895993e-10), (-0.59256991207451437, 0.36836312817386718), (-0.0031688943163544979, 0.007394086738160598), (0.0042585105270834256, -0.009936524563194736), (0.022395876299999992, -0.037571744700000007), (0.01070401373575498, 0.0025359725132831912), (0.013100954553989385, -0.030568893959308771), (0.0080404398900000285, -0.014355436409999964), (2.0232099995354244e-09, -4.7208231768181008e-09), (-4.4136701911168251e-06, 1.0298563779376213e-05), (-0.36643203054452711, 0.45810807127056241), (0.044410325266253547, -0.031357253209459784), (0.12273379165962604, 0.082884426168604447), (0.42840444054384874, 0.32338963873101872), (5.4626614343078471e-11, -1.2746230737548102e-10), (4.8828828884972528e-05, -0.00011393393406493591), (0.029539559044005344, -0.029235637769345856), (0.16699680206637763, 0.10602556589617071), (-3.4777736246383029e-13, 8.1158413323123552e-13), (-0.26905797362235423, 0.32351193845216014), (-0.00013375367688608363, 0.0003120919127344024), (0.0036723491788575257, -0.0026706811099674655), (-0.78830981998063165, 0.51638957995480628), (-0.11924072120335481, -0.10344167708937045), (-0.18174763169707722, -0.13599996019248486), (0.23814000000000002, -0.29105999999999999), (0.046316770531390647, 0.04631677053138241), (-3.2175655917399125e-09, 7.5076529437723138e-09), (-0.0028633230871295099, 0.0052522472033022412), (0.019526825254391509, -0.045562592260246865), (0.022055605014946675, -0.05146307836820907), (-0.00098759252613882524, 0.0018757305609906846), (0.0042840979435305512, 0.0038988026245110772), (7.7715611723760953e-17, -2.3314683517128283e-16), (0.0058457416500000241, -0.010484708849999948), (0.00128525399769015, 0.0011695833532148203), (0.001985004451345218, -0.0046316770531387389), (0.09525599999999998, -0.14288400000000004), (0.044945121648286075, -0.10487195051266857), (0.23265541180448793, 0.18884627348120525), (-0.015810763531500072, 0.014841781573499899), (0.056447641817826348, 0.012092903277572814), (0.0011017047536572731, -0.0025706444252002526), (-0.35556294599418964, 0.43274687398644202), (-0.0035589723977912154, 0.0083042689281795038), (0.00033051142609721304, -0.00077119332756006012), (0.0028086350670000313, -0.0052318048229999976), (9.5549426157859321e-07, -2.2294866105054821e-06), (0.023099731335403526, 0.02111472688405831), (-0.00033485643784160186, 0.00065273608829722338), (0.014507523249891461, -0.033850887583080698), (0.069819449039045259, 0.056635194340531742), (0.00096154145010000078, -0.0018470936169000304), (0.051698779789701721, -0.036641981680619023), (1.1865405413757911e-07, -2.7685945975797209e-07), (-0.006727729059450082, 0.0090830344720499896), (2.3036055640801577e-08, 2.1001257466402023e-08), (3.5596216241273734e-08, -8.3057837896305376e-08), (-0.0026136687178350158, 0.0041140603416150662), (0.059161349893361768, -0.047981528315409784), (0.0069299194006210421, -0.016169811934782483), (0.035720999999999933, -0.059535000000000046), (0.091650749176271598, -0.075557479693884474), (0.23723781571769437, 0.19435132931970933), (0.00032414771403006522, -0.00063739373606993557), (0.057150456592344405, 0.012237465180387104), (0.069327871696439475, -0.16176503395835773), (0.0020377044450000546, -0.0038080372049999695), (0.040115171377992538, 0.0080703762195422912), (0.048415448937233305, -0.11296938085354478), (0.2231531242568989, -0.030690623266099865), (5.9532179186305706e-11, -1.3890857353260344e-10), (5.139493516881366e-07, -1.1992151538353645e-06), (-0.46545066288000009, 0.56567154671999975), (1.406087804767253e-06, -3.2808715443533029e-06), (3.5542697020773947e-06, -8.2932959716175418e-06), (-0.1423898837982569, 0.21317306219593274), (-1.1662807310544023, -1.2339840363583718), (1.0678864903468366e-08, -2.4917351337805369e-08), (0.01243396771320162, -0.017105591330803725), (-0.34988421931632069, 0.81639651173808159), (0.0030541495860558539, -0.0071263490341305861), (-0.00011203053535255857, 0.0002228259024890433), (6.5998631004759992e-10, 4.7833756955384375e-10), (9.6109777913966346e-10, -2.2425616919008462e-09), (0.0048018203139605807, -0.0076321473992410392), (0.00017317028983214743, -0.00040406400960839582), (7.7731877601294737e-10, -1.8137438106968773e-09), (0.00069650591850000103, -0.0013411985265000537), (0.00017457296087703965, 0.00016989736305157431), (0.00027487346274508435, -0.00064137141307165637), (-0.056604113999999921, 0.0071262659999999992), (-0.0064224301565867668, 0.014985670365368086), (-1.8391780855734809, -2.0352629987133586), (0.35496090000000019, -0.25494209999999967), (-0.0096114099641824591, 0.02242662324975804), (5.7814668707900636e-05, -0.00013490089365176817), (-0.053433265139476924, 0.088956618658779976), (1.2967725484536172e-07, -3.0258026120222323e-07), (1.0770349234690001e-07, -2.5130814891305419e-07), (0.0002345101510499825, -0.00046199576745001856), (1.5586375723231071e-05, 1.5582874437369831e-05), (4.9155859512173267e-05, 4.914616619787759e-05), (7.8020557964952875e-05, -0.00015648959308502963), (4.8018472447175498e-06, 4.3810151002077189e-06), (7.4215834941160349e-06, -1.7317028152885605e-05), (-0.028226734200000089, 0.028377379799999831), (0.00050822675411568154, -0.0011858624262697679), (-3.2499114510642356e-12, 7.5831785295576973e-12), (-1.5849625356155521, -1.3977540835637114), (-0.0096634146376977977, 0.022547967487960903), (2.2264750481726379e-06, -5.195108445943397e-06), (0.012859560000000169, -0.022861439999999764), (0.0017868076320916692, 0.0017868041290662218), (0.002836200922514531, 0.0028339744474663582), (-3.7081241805703152e-05, 7.494929354685542e-05), (-6.8736152982751262e-07, 1.6038435689758043e-06), (5.2033201836776398e-06, -1.2141080428684777e-05), (-0.93412876068466566, 0.65083377493088646), (4.9546360455843264e-05, -0.00011560817439670856), (0.00085086027675440601, -0.001985340645760125), (0.0045008459999999577, -0.0083587140000002114), (0.00015246892654194875, -0.00035576082859798406), (9.6532656007286551e-06, -2.2524286401803813e-05), (0.0017620350941880967, -0.0030397852197724838), (-5.0108663884884655e-10, 1.1692021573139754e-09), (1.5609960550722057e-06, -3.6423241286054339e-06), (0.00010794989790895436, -0.00021619781612111085), (-0.0039776464857072648, 0.0082046647392808765), (-0.049657808310484074, 0.11586821939112929), (0.2475913321631546, -0.18081310838069414), (-0.0096113929669581211, -0.0096113929218600621), (2.514100039263667e-13, -5.8667515290267139e-13), (2.5706421184490402e-05, -5.2314136780462473e-05), (0.00023215552058946097, 0.00023159150127820548), (0.00036823224570785572, -0.00085920857331838168), (0.0015431471999998835, -0.0029576988000000739), (-0.0037589537714882936, -0.00051754770174525797), (0.0089634348167849428, -0.020914681239164713), (-1.2165996901758458e-05, 2.4915244903944693e-05), (-2.5457696518405015e-05, 5.9401291877314577e-05), (4.2875418782006843e-08, -1.0004264382468265e-07), (0.20697939545487831, 0.0070480772719504481), (0.00015283879363134909, -0.00035662385180663665), (0.0, 0.0), (-0.0009627056153504453, 0.0016509631024845704), (6.8967601420943934e-07, -1.6092440332071687e-06), (-7.4902298768941833e-07, 1.747720304556832e-06), (-3.9622863784671832e-06, 8.2037105232912744e-06), (0.0001994464283319397, 4.2851754670447662e-05), (3.1967042664393651e-06, -7.4589766215882304e-06), (-0.10810349208670619, 0.16095448153564804), (-2.3361252474884961e-05, 5.450958910868664e-05), (-0.0013730561362041093, 0.0032037976511433363), (3.5596644482660533e-05, -7.2353253426293829e-05), (-3.3063445806558178e-05, 7.7148040215302402e-05), (-0.0044692027479434236, 0.010428139745201737), (-3.012704062722928, -3.2358571869798269), (-0.72627119660152251, -0.72623813315571595), (-1.151578492906892, -1.1511665760660308), (-1.8277062188168789, 1.1849978439060491), (2.0157808751086747e-07, -4.7034887065144907e-07), (-2.0983215165415457e-15, 4.8960835385969397e-15), (0.018983514568568005, 0.20070513267334139), (1.7950178549863692e-05, -4.1883749949733762e-05), (-1.032639123010881e-06, -2.8361613532146267e-07), (-0.18646939886400007, 0.27898126401599999), (1.6155160694752979e-06, -3.7695374955459824e-06), (2.5893304533841641e-08, -6.0417710656679444e-08), (-0.040646877626011643, 0.06745661446069455), (-0.0049456827061772563, 0.011539926314413806), (7.5928152654114453e-14, -1.7726931034189872e-13), (-0.01924486954184319, 0.034188395597633731), (1.4539644626054836e-07, -3.3925837450432539e-07), (-1.9413693567149613e-05, 4.5298618323297286e-05), (-0.00034239318460523857, 0.00062031243074520668), (-0.16362450771509862, -0.16349097428203194), (2.0206059048177848e-15, -4.8183679268731784e-15), (-0.087703449091615704, 0.44964138121377034), (3.9676928409448915e-12, -9.257794530981299e-12), (3.9472321240174853e-05, -9.2102082893585896e-05), (-1.2824321059756726e-06, 2.6798542724915109e-06), (1.7839936780617016e-05, 4.1138887155289801e-06), (2.1781146604826773e-05, -5.0822675411210652e-05), (-4.1285348949537944e-07, 8.6957861648029314e-07), (5.7222310185345291e-06, 3.7024998442714042e-07), (-1.8925528453284101e-07, 1.637799348697122e-07), (-0.14565060916335815, 0.22078142138116896), (1.3428484757271874e-06, -3.1333131100819141e-06), (3.5525089116639206e-06, -8.2891874603419049e-06), (-0.011841670260000003, 0.016385063940000087), (5.1500079161215236e-07, -1.2016685139171202e-06), (6.5343439814791179e-06, -1.5246802623347655e-05), (-0.00011879240538160696, 0.0002236007792236316), (-0.06380153999991249, -0.014714187685382726), (-4.9688832705174768e-05, 3.0974490755375497e-05), (-4.0460056614421974e-05, 7.8332348767184981e-05), (1.0742787270201503e-06, -2.6856974870703705e-07), (6.2172489379008762e-16, -1.3988810110276972e-15), (-0.0067379278625531829, 0.012506941679290007), (-0.00046753684968603432, 0.0010909193159340802), (-0.67215655058947799, 0.48063912808953901), (0.15808526999999997, -0.19687563000000022), (0.024967022761711321, 0.024966877016310927), (0.039630125457287502, 0.039629537366329147), (0.062904681000000059, -0.095180588999999913), (-0.07626463115331851, 0.050913217962998789), (0.026703572246186334, -0.012926553211101168), (-1.3229320422469826e-07, 2.8056028527068118e-07), (0.0067633005852578698, 0.001042215816162418), (-2.3465021826785113e-05, 2.6223810878389655e-05), (-0.41783062820539985, 0.51629813247926581), (2.9811234079080148e-07, -2.4171277268614222e-08), (1.5543122344752191e-16, -4.6629367034256567e-16), (0.39998896527251437, 0.48769241436413008), (0.00060869705267314607, -0.0014202931229042148), (0.0080110716738558841, -0.018692500572330448), (0.00062505722825643149, -0.0011369778659316653), (-0.00091430268187433486, 0.0021333729243731892), (7.7715611723760953e-17, -7.7715611723760953e-17), (8.4020024938236123e-06, -1.7304418690666788e-05), (0.0015688752810995243, 0.0013862661652975338), (0.0024033215021567189, -0.0056077501716991652), (0.023515134300000028, -0.039389546700000028), (8.7258287129188256e-08, -2.1754150925090751e-09), (1.7184028614392055e-06, 1.7184028613614898e-06), (0.24788668958175405, -0.15210227569076032), (-0.012051126437868919, -0.009991981396729209), (9.5917740616791031e-08, -2.2380806143917909e-07), (-0.0045645960780000272, 0.0072770741819999755), (-0.0014073212676185996, 0.0032837496244435549), (3.8348175207536528e-07, -8.9479075486842415e-07), (-1.3229999999999997, np.inf), (-0.00042219638028553327, 0.00098512488733306638), (1.1504452558375177e-07, -2.6843722649161351e-07), (1.1642495877839387e-05, -2.3954148604821145e-05), (2.598169881462553e-08, -1.9578738630343651e-10), (2.8775322169494186e-08, -6.7142418447296845e-08), (-4.2219108420393778e-08, 9.007409580430448e-08), (-0.0003253804138224403, 0.0007592209655856941), (-0.018148226865915884, 0.042345862687136956), (-0.82548036564506377, 1.0022258531718151), (-0.0035276290018047439, -0.0032022485879823035), (-0.20903160419084568, -0.20692837557775054), (-1.3584717484438346e-05, 2.6875339129983626e-05), (-0.079144598748769779, 0.05298081977356367), (2.4170470573570132e-06, 2.3020025317732616e-06), (-0.16662678846161957, 0.25120383974378024), (-0.023743379624630932, 0.055401219124138847), (7.2511411718378933e-07, -1.6919329401732239e-06), (-0.79380000000000006, 0.52919999999999967), (-0.0010582887005412987, 0.0024693403012634452), (-0.06270948125725366, 0.14632212293359204), (-0.33079465969351918, 0.4946857059515446), (1.3233045681459997e-08, -1.2748653133165533e-08), (5.1552085842399001e-07, -1.2028820030152155e-06), (2.7276235896822595e-06, -5.6743789041413528e-06), (-0.00040394732203807848, 0.00094254375142197575), (-0.0016333404179324606, 0.0038111276418423042), (0.0084476592900000636, -0.015067475009999965), (-0.00042988553560037164, -2.5938213562293156e-05), (2.5897790356665947e-09, -6.0428176462679055e-09), (8.8039392940331132e-07, -1.8472296602789482e-06), (0.0012784003122039422, 0.0012655101777422795), (-2.1547102546648489e-08, 2.2083911399572992e-08), (-0.06999107965919972, 0.11647831920480035), (-0.0001289656606800804, 0.00030091987492029124), (0.0020230686855005064, 0.0014791967231992276), (0.00021645117847697291, -0.0004086060497794586), (-0.016700269355433138, 0.020625130739928797), (-1.485836989012501e-06, 3.4669529743625029e-06), (-0.062371316538485773, 0.10425547192313381), (3.5344352168031884e-05, -8.2470155058533831e-05), (0.00060692060565015193, -0.0014161480798503545), (0.0029522334870000222, -0.0054954258030000414), (0.00051917503125902258, 0.00050857172560867523), (-6.4641307639945463e-09, 1.5082971782653941e-08), (-0.1804561813635375, -0.38743557681841578), (-0.001503024241989026, 0.0035070565646408533), (6.5260270520894892e-08, -1.5227396462647034e-07), (3.7817995232836129e-06, -7.860696354555774e-06), (1.9529187156308579e-10, -4.5568129269923931e-10), (-1.9392392136552417e-09, 4.5248915503393047e-09), (-1.3425076683670766e-08, 2.8794031736723012e-08), (0.00015900352962230357, 0.00014498580377826363), (-3.2626272794544771e-09, -1.3233880657992354e-09), (-0.12690185440906174, 0.053554326954475762), (-9.3795580041522428e-06, 2.1885635343332766e-05), (-0.0026203092032497598, 0.0061140548075828242), (-0.1241835629080557, 0.20661109678546347), (6.162848009694244e-11, -1.4379968327205005e-10), (-0.0011316383930287997, -0.00087282579540622898), (-0.0016730073234000331, 0.0028915887545999941), (6.2540705947355943e-11, 9.1222585041350354e-13), (-9.7878818383634317e-10, 2.2838390956181339e-09), (-0.025212401897760237, 0.044778677761439484), (-9.179096372902151e-06, 2.1417891537289789e-05), (-4.4100191284179856e-05, 0.0001029004463298566), (0.00052081218000012966, -0.0010223350199997539), (1.2879285898659275e-06, -3.0051667099462166e-06), (1.0143412032537213e-08, -2.3667961279727477e-08), (-0.50581693699888308, -0.28976048033593915), (-1.1088665064784563e-05, -1.9095686918824122e-06), (0.00024571144741136752, -0.00057332671062657601), (-4.5094253952049357e-06, 9.0752920892334107e-06), (6.8903470258163668e-05, 6.8903451495905252e-05), (0.00010937057877709044, 0.00010937050885309051), (0.00017360406000004324, -0.00034720812000008642), (-0.011007943598763226, 0.0074332056590211242), (-0.0086914267006792389, 0.020279995634918221), (1.2212550848822445e-06, -2.5605444384013682e-06), (4.6555377133827847e-05, 4.6168998556805896e-05), (-2.9363647069402529e-10, 6.8515171314231793e-10), (-4.2553261692113148e-09, 9.1697505144594516e-09), (-3.1486146316872517e-07, 7.346767473936922e-07), (-3.9690172156880973e-06, 9.261040169628032e-06), (0.10999839964894628, -0.13759293251420832), (-0.0049450627260573914, 0.0060628808727058343), (-9.4634459767428676e-07, -9.0622699897568984e-07), (-0.014658812287803613, 0.025988065338208029), (3.2246819336467775e-05, -3.1833400096514816e-05), (3.5183157998108783e-08, -8.2094035303015279e-08), (0.11273300687452598, -0.13515368270722808), (9.6740458008781616e-06, -2.2572773535589613e-05), (1.0554947360574829e-08, -2.4628210637533954e-08), (-0.059900056322718283, 0.067001798086343461), (-0.00013351669360357475, 0.00031153895174151902), (-8.5171013819440581e-08, 1.9873236547507387e-07), (-1.4830306635071898e-06, 3.0263947316977459e-06), (-0.00053285890200951416, -0.00039934220840593944), (-3.3045247503915572e-07, -2.4528146121971515e-07), (-0.0051370683863412037, 0.0095217439014624091), (0.0052049892940520866, -0.012144975019454973), (2.067103731200337e-05, -4.8232420394933581e-05), (5.728933979989303e-05, -0.00011631472020015021), (0.0067665144197995627, 0.001561525125747476), (6.6342090801807524e-06, -1.5479821186881182e-05), (0.0010110507561001069, -0.0019411827308999153), (1.2219062927010248e-05, 9.3168491867467999e-06), (-0.00021392270655934406, 0.00049915298197182871), (-1.0086049456294297, -1.0275884601979977), (-0.0001598576706028698, 0.00037300123140664436), (-0.00078222840306114701, 0.0018251996071426246), (-4.8397011257472757e-07, 9.9906055093246229e-07), (-0.00019579846935946499, -3.5940798756595193e-05), (-1.2859358680117337e-07, -2.94578442971982e-08), (-0.022426378961545621, 0.039944937576940148), (3.6657188780875315e-06, -8.5533440489227158e-06), (-2.8062073775814155e-10, 6.54781617814848e-10), (-0.008828243969328263, 0.016384157928431974), (1.0997156634884318e-06, -2.5660032145990997e-06), (-6.4176811967842074e-05, 0.00014974589459150199), (-0.00059299074701992796, 0.0010800165763801052), (0.00032323136538727756, -0.00075420651923749924), (5.4039994307641941e-06, -1.2609332005375507e-05), (2.8275023458146362e-07, -5.976436948218477e-07), (7.3866997780225317e-06, -1.7235632815593147e-05), (6.5032742945048117e-05, -0.0001517430668719344), (0.00034092943982990672, -0.00067012131627020022), (2.1416861945011689e-06, -1.5927481460620282e-06), (1.6211998291826289e-06, -3.7827996015815654e-06), (-1.344938760361458e-09, 2.9103874088498568e-09), (9.4891262620855337e-07, -1.1927735682926157e-06), (-2.923658204423418e-10, -2.081796068864605e-10), (-0.0030278302107986208, 0.0058004137585296427), (-6.1974212695914402e-05, -3.234671888074911e-06), (5.7911198070303978e-08, 5.4744713862131531e-08), (0.045330002062357752, -0.067403004812168224), (8.540213631835768e-08, -1.9927165151312209e-07), (-8.7709761675824885e-11, 2.0465605876651692e-10), (-0.02451886689681566, 0.035381189425902626), (-5.5776791426431766e-06, 1.3014584666115602e-05), (5.2120078364303872e-09, -1.2161351592432368e-08), (0.017052030618707369, -0.028277971443650383), (0.0001492627229180865, -0.00034827968680928295), (4.8635994869261619e-07, -1.1348398804900127e-06), (1.8749238480109121e-05, -3.8540101319783909e-05), (-1.6733037428551255e-06, 3.9043753997880511e-06), (1.5636023587006775e-09, -3.6484054777297097e-09), (-0.0093203150690447586, 0.015198551827770902), (-5.019911228254514e-07, 1.1713126200296741e-06), (-7.0400556275540527e-05, 0.00016426796464277249), (-0.044738618372416723, 0.079444944535638967), (7.5382170980908816e-07, -1.7589173226806309e-06), (-1.336896276543653e-05, 3.119424645273705e-05), (-0.60687148368882871, 0.401733461940601), (-0.0062315498310415718, -0.0062310478399187465), (1.4516910734618804e-07, -3.3872791711520016e-07), (-0.0023107184587658923, 0.0044272094037872906), (6.7843953854840311e-08, -1.5830255915005864e-07), (-4.0106888296698172e-06, 9.3582739357667137e-06), (-0.27334844510664907, 0.33352303858217963), (9.4725265524786546e-07, -2.2102561955783527e-06), (2.7316371980568019e-05, -6.3738201287888422e-05), (0.00011356309584886758, -0.00022736634398103913), (-0.0018694649493123936, 0.004362084881729178), (4.3550732242714219e-08, -1.0161837510347382e-07), (3.9239109389521687e-07, -8.2886399098702763e-07), (1.2592401615840742e-05, -2.9382270437272596e-05), (2.0076496578980141e-05, -4.6845158684183364e-05), (3.7454207924647596e-05, -7.6108887924219987e-05), (2.0353186203081463e-08, -4.7490767651758845e-08), (3.9848145633625267e-06, 3.4984546146699103e-06), (6.0935025058217459e-06, -1.2655735974287375e-05), (1.6965032124960364e-05, -3.3475131012261634e-06), (-7.8938855452292942e-12, 1.8419066272201688e-11), (-0.0010221561692393521, 0.0020056740415592689), (3.4099908576834532e-06, -4.1621874805830569e-06), (2.4357064945190739e-06, -1.5491080688434527e-06), (9.0414687115014655e-08, -1.9233554746644895e-07), (-0.0012899037075051467, 0.0011403555474001734), (9.2143889862672513e-08, 4.8593157619958294e-08), (1.255216987350316e-07, -2.6686939516018524e-07), (3.0689917731585579e-07, -7.1609807998918014e-07), (7.3071194837126532e-07, -1.7049945461478086e-06), (-4.2398404787036268e-10, 9.2095471249109536e-10), (9.2069753288015469e-08, -2.1482942402784033e-07), (-0.00026705996715872257, 0.00062313992337050808), (-0.015666650361725074, 0.029071968010691649), (3.1780534484049381e-07, -2.8119727677466957e-07), (-1.203206648869859e-06, 2.8074821807999582e-06), (0.0061515181856125253, -0.010900512433094844), (9.534160338997566e-08, -2.2246374145051815e-07), (-8.4718410064965608e-11, -8.2350259944519161e-11), (-0.0033854910207130827, 0.0059348240483316755), (3.6912213272621838e-07, 2.7705237943820292e-07), (-0.0034654321651634841, -0.0031983721980047616), (3.9997820755477415e-08, -8.5523877979554186e-08), (1.4364700375635308e-06, -3.3517634208779506e-06), (-1.0416080442610109e-09, 2.4304188217527664e-09), (-0.007842408888463881, 0.01458397007308174), (4.309410112535161e-07, -1.0055290263100147e-06), (-3.1248242882142563e-10, 7.2912561543958523e-10), (-0.0026870712265391725, 0.0051553376619247089), (1.1073663972460678e-07, -2.5838549300161162e-07), (-0.0010396296495490452, 0.0024258025156144386), (-0.0053735145635175341, 0.01029313579820754), (1.3567135397352102e-07, 2.4934714248914236e-08), (1.6261962221264525e-07, -3.7944578537008054e-07), (0.04371581989468365, -0.066282579754262633), (0.0064813039523748724, 0.0064811682810208991), (-0.0014547783243647582, -0.00041514867481571302), (1.2701739637854814e-08, -2.7296081117622599e-08), (2.8602481094708307e-08, -6.6739122295267353e-08), (1.6368327693250249e-09, -3.819276461758392e-09), (-0.0011924662562141197, 0.0021930247644989633), (8.5807443594987363e-09, -2.0021736735209571e-08), (-7.6246786662181876e-12, 1.7790813267026805e-11), (-0.00041078556186384673, 0.0007816806943502729), (1.1635407304311229e-08, -2.7149283710059535e-08), (-2.2874035998654561e-12, 5.3372750663527315e-12), (-0.054411482749007242, 0.091239126414350905), (0.0019443911857125239, -0.0045369127666623488), (0.010287719445982101, 0.010287556826359888), (1.9686700404308866e-06, -4.1248324653908593e-06), (2.9281612785592158e-07, 2.9204386082781751e-07), (1.473149158215392e-10, -3.4373490720440712e-10), (-0.00013914937405923311, 0.00027163618780461362), (1.0471866263017659e-09, -2.4434355649916029e-09), (-2.5311197582311706e-12, 5.9059201973354889e-12), (-0.0017629479259023471, 0.0033741204604388567), (-4.5013752162592621e-06, 1.0503208837731036e-05), (-0.00043643349730939637, 0.0010183448270553619), (-1.5690930793565983e-07, 3.2706080463906775e-07), (0.00075830889930128542, -0.0017693874317028955), (-0.00013093004919275674, 0.00030550344811663965), (4.021239907725515e-09, -8.6804997301292989e-09), (8.7844838403405845e-08, -2.0497128945251574e-07), (-1.0828859842160198e-07, 2.5267339623935566e-07), (-0.10939063353199464, 0.16395781157465444), (-4.9896682364369834e-05, 3.3939661191961786e-05), (4.4194459203339419e-11, -1.0312045661819977e-10), (-0.00078001756762997583, 0.0015307008911359164), (9.785084171154423e-07, 9.781942610809224e-07), (1.5530383653983292e-06, -3.6237561857221927e-06), (-1.3334584547664006e-10, 2.9063820239372264e-10), (-1.4969004709342037e-05, 3.4927677655027795e-05), (-3.1870840677683529e-08, -3.1870081318441378e-08), (-0.00090642593596155228, 0.0017806452905776201), (1.7612303273573102e-07, -4.1095374325728073e-07), (-9.5612522343913042e-09, 2.2309588443292225e-08), (-0.00059543260077052904, 0.0011675153251318182), (5.2836909758546823e-08, -1.2328612297718419e-07), (6.6547878319056502e-13, -1.5529133534641916e-12), (7.3615556543094032e-05, -0.00014283562193387887), (9.0147145059837891e-08, 8.2241109611302924e-08), (1.3932592750620641e-07, -3.2509383089962536e-07), (2.8801291152014129e-08, -6.1613395963000533e-08), (1.0390834821460969e-07, 5.1071438456062869e-08), (-2.8683756703173912e-09, 6.6928765640739126e-09), (-0.00030201915118857056, 0.00060440678477298167), (6.142302084422013e-06, -1.4332038196673834e-05), (-1.1783704427337227e-05, 2.7495310330505339e-05), (-5.0588274513874154e-08, 1.0632103342178567e-07), (-2.9316308592486349e-06, -5.8326178438150561e-07), (5.7643528172945933e-09, 5.7510944562189076e-09), (9.1434529503331412e-09, -1.9657838201680988e-08), (-1.5476252988033679e-06, 1.3840055604452671e-06), (3.5524978070355926e-09, -2.2118550102590007e-09), (0.0021562281556835039, -0.0039952900299290214), (3.5768933903668193e-08, 4.5964293926559181e-09), (4.1932035887981553e-08, -9.7841416968336135e-08), (1.2251846128452647e-05, -2.5202361796194949e-05), (0.00058347953474338068, 0.00058292672755575468), (-1.0605333985225228e-06, 2.4745779296786452e-06), (-0.0018141102055554857, 0.0035594043579620484), (1.5984087109233157e-06, 1.5626397770196476e-06), (-2.6426572041771123e-11, -2.6220703386314881e-11), (-4.6518923867644446e-05, 9.2630450191588665e-05), (0.00035003796819941255, -0.00023344156654396813), (2.520123858085199e-06, 2.4781918221972173e-06), (3.9802289637957957e-06, -8.2716171646568526e-06), (0.00015750962279268419, -0.00019252834540672836), (-0.00038137354196812187, -0.00038031300856959936), (-0.00060484981261650357, 0.0012092603929389821), (6.3002356537644736e-05, -9.4507266255039455e-05), (2.499915825371346e-05, -5.8331369258768359e-05), (0.016329635968405174, -0.027386183926278476), (1.1303637230009044e-06, 6.508411097394528e-07), (1.5553898753239981e-05, 1.5553898087761197e-05), (-0.00034078898257168251, 0.0006813671866676696), (-0.0001729531187503186, -0.00010083173343522489), (-0.00024018524310451814, 0.00014118829886360372), (-0.0001996399690699535, 0.00040520984354655006), (-0.00012321736864975285, 4.9735750100565751e-05), (-0.00011322449686443913, 0.00012696074624007903), (-1.6231126998000889e-08, 3.4357147515873265e-08), (6.4564575907866129e-10, -1.5065065639419114e-09), (1.2539333438255084e-08, -2.9258444844693084e-08), (6.3278679858225211e-07, -1.3358832418486346e-06), (8.29326134876851e-08, 8.2286967728606439e-08), (-9.7459738501726169e-09, 2.2740605676307979e-08), (-0.00020522378910602378, 0.00038776695791390418), (0.00010089081059883043, -0.00023541189139675289), (0.00033312736399531139, -0.00077729718265593371), (1.2854712268861589e-06, -2.6947577369096367e-06), (9.3228314974735932e-05, -7.6624956240944951e-06), (4.0115870412193996e-07, -6.8606505032597909e-08), (4.1306212925640292e-07, -8.7240909762975605e-07), (-5.8364640502284178e-05, 6.485272814746868e-05), (3.197248243935746e-10, -7.4602448663085844e-10), (0.00074010025670534496, -0.0014161278989781589), (4.68568160312266e-05, -4.6371498943509332e-05), (-3.3967349059316196e-05, 7.9257147805122935e-05), (-6.5347498306511651e-05, 0.00013429247076344184), (2.3987792139301686e-07, -1.3215750724882016e-07), (-2.3784085811939803e-12, 5.5495941175820449e-12), (-4.1849002041516313e-11, 9.1496843435123744e-11), (5.9170623812665463e-06, -1.3806478889311079e-05), (8.9944388277363174e-06, -2.0987023931695602e-05), (2.0249177565823117e-07, -4.3029502292402091e-07), (3.1427455238208776e-08, 1.9507821114039812e-08), (-8.9717233642261353e-12, -6.5933147830321546e-12), (-1.3108214513835036e-11, 2.8740787527681277e-11), (1.7783706018903444e-08, -1.3643749219305332e-08), (9.591746286119473e-11, -2.2380736153237987e-10), (-1.5387910655473291e-05, 3.1131013212171155e-05), (5.3351117745847884e-09, -1.2448594244318656e-08), (1.3262650044865153e-08, -3.0946183282587469e-08), (6.4544253430831586e-08, -1.379475222273996e-07), (1.3403137799627984e-08, -3.1273988043700735e-08), (1.8323898998140462e-08, -4.2755764328994419e-08), (-4.0985659310877052e-12, 9.0096485827473297e-12), (7.484158270898433e-09, -5.918979528729551e-09), (5.4971696528127721e-09, -1.2826729345327689e-08), (1.3214486727086694e-07, -2.8091726198553598e-07), (6.8665603869533236e-09, -5.3779737996251236e-09), (-1.2805978499841329e-12, 3.0145885787646888e-13), (-1.2793544001965528e-12, 2.8192115308911522e-12), (6.8112622164662174e-08, -1.5892945182116591e-07), (1.5205715353516779e-09, -3.5480002491539157e-09), (2.8939554530538201e-09, -6.2494974972793211e-09), (1.1927664633759604e-09, -1.8251617106557204e-09), (5.8411395720270318e-10, 5.5533874165902832e-10), (-0.00026004587928913909, 0.00051997168834083674), (2.043378661831241e-08, -4.767883554634976e-08), (2.4284984845301949e-07, -5.6664964618313709e-07), (-2.1240901767516362e-05, 4.4106596538995285e-05), (3.5782987684029877e-10, -8.3493658653566164e-10), (-6.3532512584174583e-13, 6.4527272414238707e-13), (-3.9875880375461745e-13, 8.8059559644193539e-13), (1.9356534153303072e-10, -1.6426453530726805e-10), (1.3685144129027548e-10, -3.1932008148771725e-10), (9.1346253894286629e-10, -1.9804929141109536e-09), (8.393441497389631e-11, -1.0963092655913441e-10), (4.1055447930204989e-11, -9.5795993360070495e-11), (2.0502292152890788e-08, -4.4041961277940795e-08), (1.5174363010572732e-08, 1.0491774826704158e-08), (-1.9336005807613077e-06, 4.5117346881839993e-06), (-6.8632662128864647e-06, 1.4377635554629898e-05), (2.6097704441951917e-09, 2.5258360292212954e-09), (4.1025239871927965e-09, 4.0614685392625914e-09), (-1.2411183192284623e-13, 2.7464697183177125e-13), (1.9779403448438867e-09, -3.0174287735107445e-09), (-1.0499379143880105e-13, 1.6382450951368809e-13), (-0.00011247933431155487, 0.00022830964826012765), (2.6049554957552345e-09, -6.0782290756122838e-09), (-1.9700356725271814e-06, -3.6435091765873752e-08), (2.8762159320905312e-10, -6.2584094573381317e-10), (7.8148674198530441e-10, -1.82346875376993e-09), (7.6084081257477008e-10, -1.7752951775307222e-09), (2.4688727862876014e-05, -4.8926828680218018e-05), (2.3444592933685723e-10, -5.4704081264844713e-10), (2.2825230594492038e-10, -5.3258850662984967e-10), (4.211132860199029e-08, -9.0033538668876655e-08), (5.4477286903775731e-09, 5.1259150257720876e-09), (-1.2631649171090941e-09, 2.9473847029670704e-09), (-5.1857315663816905e-09, 1.1045395431619198e-08), (-4.0545089803334377e-07, 5.7371535313599496e-07), (-1.7730321051345753e-07, 4.1370749119806761e-07), (-1.6506375488667401e-09, 3.5350940175149507e-09), (1.4535088688205633e-09, -1.7861652601425247e-09), (-3.1474822748123188e-14, 7.3518968690677859e-14), (-3.8624659026709194e-14, 8.5487172896137041e-14), (-1.551455762971443e-07, 2.5030532173619947e-07), (1.4199885711718707e-11, -3.3133196186696522e-11), (-8.5825946486561827e-05, 0.00017421993280257727), (5.4492632628466702e-11, -1.271495797539046e-10), (1.1076821682109993e-10, -2.5845896534093525e-10), (-1.1968204205459187e-14, 2.6656454821250005e-14)]
 
-emotions = []
-abs_td_error_relative_differences = []
-emotion_values = []
-
-
-
-for data in td_error_data:
-
-	new_qvalue = np.round(data[0], 3)
-	td_error = np.round(data[1], 3)
-
-	if td_error == 0:
-		emotions.append(NO_EMOTION)
-	elif td_error == new_qvalue or td_error == -np.inf:
-		emotions.append(FEAR)
-	else:
-		old_qvalue = new_qvalue-td_error
-		abs_qvalue_percetange_difference = abs((new_qvalue-old_qvalue)/abs(old_qvalue))
-		emotions.append(HOPE if abs_qvalue_percetange_difference <= PERCENTAGE_HOPE_TOLERANCE else FEAR)
-
-
-
-for data in td_error_delta_data:	
-
-	new_td_error = np.round(data[0], 3)
-	td_error_delta = np.round(data[1], 3)
-
-	if td_error_delta == 0:
-		abs_td_error_relative_differences.append(0.0)
-	elif td_error_delta == new_td_error or td_error_delta == np.inf:
-		abs_td_error_relative_differences.append(np.inf)
-	else:
-		old_td_error = new_td_error-td_error_delta
-		abs_td_error_relative_difference = abs((new_td_error-old_td_error)/abs(old_td_error))
-		abs_td_error_relative_differences.append(abs_td_error_relative_difference)
 
 
+td_error_data = np.array(td_error_data)
+td_error_delta_data = np.array(td_error_delta_data)
 
-for i in range(len(emotions)):
-	if emotions[i] == NO_EMOTION:
-		emotion_values.append(0)
-	else:
-		if 0 <= abs_td_error_relative_differences[i] < 0.25:
-			emotion_values.append(5 if emotions[i] == HOPE else -1)
-		elif 0.25 <= abs_td_error_relative_differences[i] < 0.5:
-			emotion_values.append(4 if emotions[i] == HOPE else -2)
-		elif 0.5 <= abs_td_error_relative_differences[i] < 0.75:
-			emotion_values.append(3 if emotions[i] == HOPE else -3)
-		elif 0.75 <= abs_td_error_relative_differences[i] < 1:
-			emotion_values.append(2 if emotions[i] == HOPE else -4)
-		else:
-			emotion_values.append(1 if emotions[i] == HOPE else -5)
+emotions = get_emotions(td_error_data[:, 0], td_error_data[:, 1])
+abs_td_error_relative_differences = get_intensities(td_error_delta_data[:, 0], td_error_delta_data[:, 1])
+emotion_values = get_emotion_values(emotions, abs_td_error_relative_differences)
 
 
 
@@ -6,8 +6,12 @@ import numpy as np
 import itertools
 import random
 import math
-from collections import OrderedDict
+import json
+import os
 from collections_extended import frozenbag
+from rl.qtable import QTable, SparseQTable, MappedQTable
+from rl.td_history import TDHistory, DEFAULT_MAX_SIZE
+from rl.emotion_stream import EmotionStream, EMOTION_SOURCES
 
 
 # constants------------------------------------------------------------------
@@ -17,6 +21,60 @@ EXPLORATION_MODES = [
 	'e_decaying'
 ]
 
+CHECKPOINT_VERSION = 1
+
+CHECKPOINT_ARRAYS = [
+	'qvalues',
+	'td_errors',
+	'td_errors_delta',
+	'visits'
+]
+
+
+# functions------------------------------------------------------------------
+
+def get_rng_state(rng):
+
+	"""
+	Restituisce lo stato di un generatore numpy in forma serializzabile (JSON)
+
+	Parameters
+	-----------------------------------
+	(numpy.random.RandomState|numpy.random.Generator|module) rng
+		Generatore (numpy.random per il generatore globale)
+
+	Returns
+	-----------------------------------
+	(dict) state
+		Stato del generatore
+	"""
+
+	if hasattr(rng, 'get_state'):
+		name, keys, pos, has_gauss, cached_gaussian = rng.get_state()
+		return {'type': 'RandomState', 'state': [name, keys.tolist(), pos, has_gauss, cached_gaussian]}
+	return {'type': 'Generator', 'state': rng.bit_generator.state}
+
+
+def set_rng_state(rng, state):
+
+	"""
+	Ripristina lo stato di un generatore numpy restituito da get_rng_state
+
+	Parameters
+	-----------------------------------
+	(numpy.random.RandomState|numpy.random.Generator|module) rng
+		Generatore (numpy.random per il generatore globale)
+
+	(dict) state
+		Stato del generatore
+	"""
+
+	if state['type'] == 'RandomState':
+		name, keys, pos, has_gauss, cached_gaussian = state['state']
+		rng.set_state((str(name), np.array(keys, dtype=np.uint32), pos, has_gauss, cached_gaussian))
+	else:
+		rng.bit_generator.state = state['state']
+
 
 # classes--------------------------------------------------------------------
 
@@ -59,18 +117,39 @@ class Agent:
 	(float) epsilon_low
 		Indica il valore minimo consentito di epsilon
 
-	(list) td_history
-		Lista dei TD riscontrati ad ogni aggiornamento
+	(TDHistory) td_history
+		Storico delle azioni eseguite (stato, azione, valore Q, errore TD e 
+		sua variazione al momento dell'azione)
+
+	(list) action_td_errors
+		Coppie (valore Q, errore TD) delle azioni in td_history (sola lettura)
+
+	(list) action_td_errors_delta
+		Coppie (errore TD, variazione) delle azioni in td_history (sola lettura)
 
-	(frozenbag) curr_state
-		Indica lo stato attuale dell'agente in env
+	(EmotionStream) emotion_stream
+		Flusso degli eventi emotivi prodotti ad ogni azione e ad ogni 
+		ricompensa (ref. EmotionStream.subscribe)
+
+	(frozenbag|int) curr_state
+		Indica lo stato attuale dell'agente in env (frozenbag o stato codificato)
 
 	(dict) reward_info
 		Indica l'ultima ricompensa utente fornita e 
 		la variazione rispetto alla precedente
 
-	(OrderedDict) qmatrix
-		Indica la matrice Q dell'agente
+	(bool) sparse_qmatrix
+		Indica se le righe della matrice Q sono allocate su richiesta
+
+	(int) max_qmatrix_rows
+		Indica il numero massimo di righe della matrice Q sparsa (None se illimitato)
+
+	(str) qmatrix_path
+		Indica il file su cui è mappata la matrice Q (None se in memoria)
+
+	(QTable) qmatrix
+		Indica la matrice Q dell'agente (array indicizzati per riga, ref. 
+		QTable.rows, qmatrix[state]['qvalues'] restituisce una vista sulla riga)
 
 	Methods
 	-----------------------------------
@@ -80,6 +159,9 @@ class Agent:
 	init_qmatrix()
 		Inizializza la matrice Q
 
+	get_qmatrix_entry(state)
+		Restituisce la riga della matrice Q relativa allo stato passato in ingresso
+
 	update_qmatrix(reward)
 		Aggiorna la matrice Q effettuando una propagazione della ricompensa all'indietro.
 		Tutti gli stati terminali simili allo stato corrente vengono ricompensati in 
@@ -107,10 +189,16 @@ class Agent:
 		passato in ingresso
 
 	get_optimal()
-		Restituisce la politica ottimale	
+		Restituisce la politica ottimale
+
+	save(path)
+		Salva lo stato dell'agente in formato binario (npz)
+
+	load(path)
+		Ripristina lo stato dell'agente salvato con save	
 	"""
 
-	def __init__(self, env, alpha=0.7, gamma=0.9, epsilon=0.999, beta=0.5, exploration_mode=EXPLORATION_MODES[1], epsilon_decay=0.7, epsilon_low=0.2):
+	def __init__(self, env, alpha=0.7, gamma=0.9, epsilon=0.999, beta=0.5, exploration_mode=EXPLORATION_MODES[1], epsilon_decay=0.7, epsilon_low=0.2, sparse_qmatrix=False, max_qmatrix_rows=None, qmatrix_path=None, td_history_size=DEFAULT_MAX_SIZE, td_history_path=None):
 
 		"""
 		Parameters
@@ -139,6 +227,28 @@ class Agent:
 		(float) epsilon_low [opt, default = 0.2]
 			Indica il valore minimo consentito di epsilon
 
+		(bool) sparse_qmatrix [opt, default = False]
+			Indica se allocare le righe della matrice Q soltanto per gli stati
+			visitati o raggiunti dalla propagazione (ref. SparseQTable)
+
+		(int) max_qmatrix_rows [opt, default = None]
+			Indica il numero massimo di righe della matrice Q sparsa
+
+		(str) qmatrix_path [opt, default = None]
+			Indica il file (anche sotto /dev/shm) su cui mappare la matrice Q
+			densa, leggibile da altri processi con MappedQTableReader. Se 
+			indicato sparse_qmatrix è ignorato
+
+		(int) td_history_size [opt, default = DEFAULT_MAX_SIZE]
+			Indica il numero massimo di azioni mantenute in td_history 
+			(illimitato se None): oltre tale numero le azioni più vecchie sono
+			rimosse, per cui action_td_errors e action_td_errors_delta
+			contengono soltanto le ultime azioni
+
+		(str) td_history_path [opt, default = None]
+			Indica il file a cui aggiungere le azioni prima che siano rimosse
+			da td_history (ref. TDHistory.flush)
+
 		Raises
 		-----------------------------------
 		InvalidAlphaError
@@ -152,6 +262,9 @@ class Agent:
 
 		InvalidEpsilonModeError
 			La strategia indicata non è supportata (non è indicata in EXPLORATION_MODES)
+
+		InvalidQTableSizeError
+			Il numero massimo di righe della matrice Q sparsa non è positivo
 		"""
 
 		if not 0 <= alpha <= 1:
@@ -175,15 +288,27 @@ class Agent:
 		self.exploration_mode = exploration_mode
 		self.epsilon_decay = epsilon_decay
 		self.epsilon_low = epsilon_low
+		self.sparse_qmatrix = sparse_qmatrix
+		self.max_qmatrix_rows = max_qmatrix_rows
+		self.qmatrix_path = qmatrix_path
 		self.curr_state = self.env.reset()
 		self.reward_info = {
 			'reward': 0,
 			'reward_delta': 0
 		}
 		self.qmatrix = self.init_qmatrix()
+		self.td_history = TDHistory(max_size=td_history_size, path=td_history_path)
+		self.emotion_stream = EmotionStream()
 
-		self.action_td_errors = []
-		self.action_td_errors_delta = []
+
+	@property
+	def action_td_errors(self):
+		return self.td_history.get_series('qvalue', 'td_error')
+
+
+	@property
+	def action_td_errors_delta(self):
+		return self.td_history.get_series('td_error', 'td_error_delta')
 
 		
 	def qmatrix_to_str(self):
@@ -193,12 +318,13 @@ class Agent:
 		"""
 
 		qmatrix_str = ''
-		for state in self.qmatrix.keys():
+		for state_id, state in enumerate(self.qmatrix.keys()):
+			row = self.qmatrix.rows(state_id)
 			qmatrix_str += ('   {0:>{1}}: '.format('{' + str(list(state))[1:-1] + '}', 10)
-				+ '\n\t\tqvalues         -> ' + str(self.qmatrix[state]['qvalues'])
-				+ '\n\t\ttd_errors       -> ' + str(self.qmatrix[state]['td_errors'])
-				+ '\n\t\ttd_errors_delta -> ' + str(self.qmatrix[state]['td_errors_delta'])
-				+ '\n\t\tvisits          -> ' + str(self.qmatrix[state]['visits']) + '\n\n'
+				+ '\n\t\tqvalues         -> ' + str(self.qmatrix.qvalues[row])
+				+ '\n\t\ttd_errors       -> ' + str(self.qmatrix.td_errors[row])
+				+ '\n\t\ttd_errors_delta -> ' + str(self.qmatrix.td_errors_delta[row])
+				+ '\n\t\tvisits          -> ' + str(self.qmatrix.visits[row]) + '\n\n'
 			)
 		return qmatrix_str
 
@@ -206,18 +332,39 @@ class Agent:
 	def init_qmatrix(self):
 		
 		"""
-		Inizializza la matrice Q
+		Inizializza la matrice Q (mappata su file, densa oppure sparsa, 
+		ref. qmatrix_path e sparse_qmatrix)
 		"""
 
-		qmatrix = OrderedDict()
-		for state in self.env.get_states():
-		    qmatrix[state] = {
-		    	'qvalues': np.full(self.env.action_space.n, 0, dtype=float),
-		    	'td_errors': np.full(self.env.action_space.n, -np.inf, dtype=float),
-		    	'td_errors_delta': np.full(self.env.action_space.n, -np.inf, dtype=float),
-		    	'visits': 0
-		    }
-		return qmatrix
+		if self.qmatrix_path is not None:
+			return MappedQTable(self.env.state_space, self.qmatrix_path)
+		if self.sparse_qmatrix:
+			return SparseQTable(self.env.state_space, max_rows=self.max_qmatrix_rows)
+		return QTable(self.env.state_space)
+
+
+	def get_qmatrix_entry(self, state):
+
+		"""
+		Restituisce la riga della matrice Q relativa allo stato passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(frozenbag|int) state
+			Stato (o stato codificato) di cui si vuole conoscere la riga
+
+		Raises
+		-----------------------------------
+		InvalidStateError
+			Lo stato passato in ingresso non è valido (è inesistente)
+
+		Returns
+		-----------------------------------
+		(QTableRow) entry
+			Riga della matrice Q (qvalues, td_errors, td_errors_delta, visits)
+		"""
+
+		return self.qmatrix[state]
 
 
 	def update_qmatrix(self, reward):
@@ -225,49 +372,94 @@ class Agent:
 		"""
 		Aggiorna la matrice Q effettuando una propagazione della ricompensa all'indietro.
 		Tutti gli stati terminali simili allo stato corrente vengono ricompensati in 
-		proporzione alla somiglianza (1, 2, ..., n numeri uguali)
+		proporzione alla somiglianza (1, 2, ..., n numeri uguali).
+		La propagazione procede per livelli (lunghezza degli stati coperti decrescente):
+		gli stati di uno stesso livello dipendono soltanto da quelli del livello
+		successivo e sono quindi aggiornati con un'unica operazione vettoriale
 
 		Parameters
 		-----------------------------------
 		(float) reward
 			Indica la ricompensa che l'utente ha assegnato allo stato (finale) raggiunto
+
+		Raises
+		-----------------------------------
+		QTableFullError
+			La matrice Q sparsa non può materializzare le righe necessarie
+			(la matrice rimane invariata)
 		"""
 
-		def update(state, reward):
-
-			coverage = self.env.get_coverage(state)
-			for covered_state in sorted(list(coverage), key=len, reverse=True):
-				if not self.env.is_terminal_state(covered_state):
-					for reachable_state in self.env.get_next_reachable_states(covered_state):
-						if reachable_state['state'] in coverage:
-							action = reachable_state['action']
-							td = self.alpha*(self.gamma*self.get_max_qvalue(reachable_state['state'])-self.qmatrix[covered_state]['qvalues'][action])
-							self.qmatrix[covered_state]['qvalues'][action] = self.qmatrix[covered_state]['qvalues'][action]+td
-							self.qmatrix[covered_state]['td_errors_delta'][action] = td-self.qmatrix[covered_state]['td_errors'][action]
-							self.qmatrix[covered_state]['td_errors'][action] = td
-				else:
-					if self.curr_state == state:
-						td = self.alpha*(reward-self.qmatrix[covered_state]['qvalues'][0])
-						self.qmatrix[covered_state]['td_errors_delta'][:] = td-self.qmatrix[covered_state]['td_errors'][0]
-						self.qmatrix[covered_state]['td_errors'][:] = td
-					else:
-						td = self.alpha*reward
-					self.qmatrix[covered_state]['qvalues'][:] = self.qmatrix[covered_state]['qvalues'][:]+td
-
-		if self.env.is_terminal_state(self.curr_state):
-			reward = reward if reward >= 0 else reward*3
-			self.reward_info['reward_delta'] = abs(self.reward_info['reward']-reward)
-			self.reward_info['reward'] = reward
-			for state in self.qmatrix.keys():
-				common_elements = len(self.curr_state&state)
-				if self.env.is_terminal_state(state) and self.qmatrix[state]['visits'] == 0 and (1 <= common_elements <= 2):
-					update(state, reward/self.env.get_terminal_state_len()*common_elements)
-			update(self.curr_state, reward)
-			if self.exploration_mode == EXPLORATION_MODES[1]:
-				self.epsilon = max(self.epsilon_low, self.epsilon*self.epsilon_decay)
-
-		for covered_state in self.env.get_coverage(self.curr_state):
-			self.qmatrix[covered_state]['visits'] += 1
+		state_space = self.env.state_space
+		state_lens = state_space.state_lens
+		terminal_state_len = self.env.get_terminal_state_len()
+
+		def update(state_id, reward):
+
+			# La materializzazione può riallocare gli array della matrice
+			coverage_ids = self.env.get_coverage_ids(state_id)
+			coverage_rows = self.qmatrix.materialize(coverage_ids)
+			qvalues = self.qmatrix.qvalues
+			td_errors = self.qmatrix.td_errors
+			td_errors_delta = self.qmatrix.td_errors_delta
+			max_qvalues = self.qmatrix.max_qvalues
+			level_offsets = np.flatnonzero(np.diff(state_lens[coverage_ids]))+1
+			levels = list(zip(np.split(coverage_ids, level_offsets), np.split(coverage_rows, level_offsets)))
+
+			# Stato terminale (unico stato del primo livello)
+			row = coverage_rows[0]
+			if curr_state_id == state_id:
+				td = self.alpha*(reward-qvalues[row, 0])
+				td_errors_delta[row, :] = td-td_errors[row, 0]
+				td_errors[row, :] = td
+			else:
+				td = self.alpha*reward
+			qvalues[row, :] = qvalues[row, :]+td
+			self.qmatrix.refresh(row)
+
+			# Livelli successivi: un'azione porta ad uno stato coperto se il piolo
+			# compare nello stato coperto meno volte che nello stato terminale
+			for covered_state_ids, covered_rows in levels[1:]:
+				covered, actions = np.nonzero(state_space.state_counts[covered_state_ids] < state_space.state_counts[state_id])
+				covered_rows = covered_rows[covered]
+				reachable_rows = self.qmatrix.rows(state_space.transitions[covered_state_ids[covered], actions])
+				td = self.alpha*(self.gamma*max_qvalues[reachable_rows]-qvalues[covered_rows, actions])
+				qvalues[covered_rows, actions] = qvalues[covered_rows, actions]+td
+				td_errors_delta[covered_rows, actions] = td-td_errors[covered_rows, actions]
+				td_errors[covered_rows, actions] = td
+				self.qmatrix.refresh(covered_rows)
+
+		event = None
+		with self.qmatrix.writing():
+			curr_state_id = self.env.get_state_id(self.curr_state)
+			is_terminal = self.env.is_terminal_state(self.curr_state)
+			updated_state_ids = [curr_state_id]
+			if is_terminal:
+				terminal_state_ids = state_space.terminal_state_ids
+				common_elements = state_space.get_common_elements(curr_state_id)
+				similar = (self.qmatrix.visits[self.qmatrix.rows(terminal_state_ids)] == 0) & (common_elements >= 1) & (common_elements <= 2)
+				updated_state_ids = terminal_state_ids[similar].tolist()+updated_state_ids
+
+			# Tutte le righe da aggiornare sono materializzate prima di ogni scrittura,
+			# così che QTableFullError lasci la matrice invariata
+			self.qmatrix.materialize(np.concatenate([self.env.get_coverage_ids(state_id) for state_id in updated_state_ids]))
+
+			if is_terminal:
+				reward = reward if reward >= 0 else reward*3
+				self.reward_info['reward_delta'] = abs(self.reward_info['reward']-reward)
+				self.reward_info['reward'] = reward
+				for state_id, state_common_elements in zip(terminal_state_ids[similar].tolist(), common_elements[similar].tolist()):
+					update(state_id, reward/self.env.get_terminal_state_len()*state_common_elements)
+				update(curr_state_id, reward)
+				row = self.qmatrix.rows(curr_state_id)
+				event = (curr_state_id, self.qmatrix.qvalues[row, 0], self.qmatrix.td_errors[row, 0], self.qmatrix.td_errors_delta[row, 0])
+				if self.exploration_mode == EXPLORATION_MODES[1]:
+					self.epsilon = max(self.epsilon_low, self.epsilon*self.epsilon_decay)
+
+			self.qmatrix.visits[self.qmatrix.materialize(self.env.get_coverage_ids(curr_state_id))] += 1
+
+		# Evento pubblicato fuori dalla sezione di scrittura
+		if event is not None:
+			self.emotion_stream.publish(EMOTION_SOURCES[1], self.td_history.total, event[0], None, *event[1:], reward=reward)
 
 
 	def shape_reward(self, state, reward):
@@ -292,7 +484,7 @@ class Agent:
 			Ricompensa modellata
 		"""
 
-		reward_penalty = -(math.sqrt(self.qmatrix[self.curr_state]['visits'])/self.beta)
+		reward_penalty = -(math.sqrt(self.qmatrix.visits[self.qmatrix.rows(self.env.get_state_id(self.curr_state))])/self.beta)
 		reward += reward_penalty
 		return reward
 
@@ -313,8 +505,13 @@ class Agent:
 			Indica se il nuovo stato è terminale
 		"""
 
-		self.action_td_errors.append((self.qmatrix[self.curr_state]['qvalues'][action], self.qmatrix[self.curr_state]['td_errors'][action]))
-		self.action_td_errors_delta.append((self.qmatrix[self.curr_state]['td_errors'][action], self.qmatrix[self.curr_state]['td_errors_delta'][action]))
+		state_id = self.env.get_state_id(self.curr_state)
+		row = self.qmatrix.rows(state_id)
+		qvalue = self.qmatrix.qvalues[row, action]
+		td_error = self.qmatrix.td_errors[row, action]
+		td_error_delta = self.qmatrix.td_errors_delta[row, action]
+		self.td_history.append(state_id, action, qvalue, td_error, td_error_delta)
+		self.emotion_stream.publish(EMOTION_SOURCES[0], self.td_history.total, state_id, action, qvalue, td_error, td_error_delta)
 		self.curr_state, done = self.env.step(action)
 		return done
 
@@ -332,11 +529,7 @@ class Agent:
 
 		if (np.random.uniform(0, 1.0) > (1-self.epsilon)):
 			return self.env.action_space.sample()
-		potential_actions = []
-		max_qvalue = self.get_max_qvalue(self.curr_state)
-		for action in range(0, self.env.action_space.n):
-			if max_qvalue == self.qmatrix[self.curr_state]['qvalues'][action]:
-				potential_actions.append(action)
+		potential_actions = self.qmatrix.get_max_actions(self.env.get_state_id(self.curr_state))
 		return random.choice(potential_actions)
 
 
@@ -347,7 +540,7 @@ class Agent:
 
 		Parameters
 		-----------------------------------
-		(frozenbag) state
+		(frozenbag|int) state
 			Indica lo stato di cui si vuole conoscere il valore Q massimo
 
 		Returns
@@ -356,7 +549,7 @@ class Agent:
 			Massimo valore Q in corrispondenza dello stato passato in ingresso
 		"""
 
-		return np.max(self.qmatrix[state]['qvalues'])
+		return self.qmatrix.max_qvalues[self.qmatrix.rows(self.env.get_state_id(state))]
 
 
 	def get_argmax_action(self, state):
@@ -366,7 +559,7 @@ class Agent:
 
 		Parameters
 		-----------------------------------
-		(frozenbag) state
+		(frozenbag|int) state
 			Indica lo stato di cui si vuole conoscere il valore Q massimo
 
 		Returns
@@ -375,7 +568,7 @@ class Agent:
 			Massimo valore Q in corrispondenza dello stato passato in ingresso
 		"""
 
-		return np.argmax(self.qmatrix[state]['qvalues'])
+		return self.qmatrix.get_argmax_action(self.env.get_state_id(state))
 
 
 	def get_optimal(self):
@@ -389,7 +582,132 @@ class Agent:
 			Politica ottimale appresa
 		"""
 
-		optimal = self.env.get_init_state()
-		while not self.env.is_terminal_state(optimal):
-			optimal = frozenbag(list(optimal) + [self.get_argmax_action(optimal)])
-		return optimal
\ No newline at end of file
+		state_space = self.env.state_space
+		optimal_id = self.env.get_state_id(self.env.get_init_state())
+		while state_space.state_lens[optimal_id] != self.env.get_terminal_state_len():
+			optimal_id = state_space.transitions[optimal_id, self.qmatrix.get_argmax_action(optimal_id)]
+		return self.env.get_state(optimal_id)
+
+
+	def save(self, path):
+
+		"""
+		Salva lo stato dell'agente in formato binario (npz non compresso):
+		gli array della matrice Q, epsilon, reward_info, gli iperparametri, lo
+		stato corrente, lo storico delle azioni in memoria e lo stato dei 
+		generatori casuali (random, numpy.random, action_space). Il file è 
+		scritto in modo atomico (file temporaneo rinominato al termine della 
+		scrittura). I record dello storico non ancora scritti sul file dello
+		storico (se previsto) vi sono aggiunti prima del salvataggio
+
+		Parameters
+		-----------------------------------
+		(str) path
+			Percorso del file
+		"""
+
+		meta = {
+			'version': CHECKPOINT_VERSION,
+			'no_pegs': self.env.action_space.n,
+			'secret': sorted(int(peg) for peg in self.env.secret),
+			'alpha': self.alpha,
+			'gamma': self.gamma,
+			'epsilon': self.epsilon,
+			'beta': self.beta,
+			'exploration_mode': self.exploration_mode,
+			'epsilon_decay': self.epsilon_decay,
+			'epsilon_low': self.epsilon_low,
+			'sparse_qmatrix': self.sparse_qmatrix,
+			'max_qmatrix_rows': self.max_qmatrix_rows,
+			'reward_info': self.reward_info,
+			'td_history_total': self.td_history.total,
+			'curr_state_id': self.env.get_state_id(self.curr_state),
+			'random_state': random.getstate(),
+			'np_random_state': get_rng_state(np.random),
+			'action_space_random_state': get_rng_state(self.env.action_space.np_random)
+		}
+		arrays = dict((key, getattr(self.qmatrix, key)) for key in CHECKPOINT_ARRAYS)
+		if isinstance(self.qmatrix, SparseQTable):
+			arrays['row_ids'] = self.qmatrix.row_ids
+		self.td_history.flush()
+		arrays['td_history'] = self.td_history.get_records()
+		arrays['meta'] = np.array(json.dumps(meta))
+
+		tmp_path = path + '.tmp'
+		with open(tmp_path, 'wb') as checkpoint_file:
+			np.savez(checkpoint_file, **arrays)
+			checkpoint_file.flush()
+			os.fsync(checkpoint_file.fileno())
+		os.rename(tmp_path, path)
+
+
+	def load(self, path):
+
+		"""
+		Ripristina lo stato dell'agente salvato con save. L'ambiente dell'agente
+		deve avere la stessa configurazione (pioli e codice segreto) di quello
+		dell'agente salvato; la modalità della matrice Q (densa o sparsa) è
+		quella dell'agente corrente. I record dello storico ripristinati sono
+		considerati già scritti sul file dello storico
+
+		Parameters
+		-----------------------------------
+		(str) path
+			Percorso del file
+
+		Raises
+		-----------------------------------
+		InvalidCheckpointError
+			Il file non è un salvataggio valido o la configurazione 
+			dell'ambiente non coincide
+		"""
+
+		try:
+			with np.load(path, allow_pickle=False) as npz:
+				checkpoint = dict((key, npz[key]) for key in npz.files)
+			meta = json.loads(str(checkpoint['meta']))
+		except (IOError, OSError, KeyError, ValueError):
+			raise rlexc.InvalidCheckpointError(path)
+		if meta.get('version') != CHECKPOINT_VERSION:
+			raise rlexc.InvalidCheckpointError(path, 'unsupported checkpoint version')
+		if any(key not in checkpoint for key in CHECKPOINT_ARRAYS+['td_history']):
+			raise rlexc.InvalidCheckpointError(path, 'missing checkpoint arrays')
+		if meta['no_pegs'] != self.env.action_space.n or meta['secret'] != sorted(int(peg) for peg in self.env.secret):
+			raise rlexc.InvalidCheckpointError(path, 'checkpoint environment does not match')
+
+		self.alpha = meta['alpha']
+		self.gamma = meta['gamma']
+		self.epsilon = meta['epsilon']
+		self.beta = meta['beta']
+		self.exploration_mode = meta['exploration_mode']
+		self.epsilon_decay = meta['epsilon_decay']
+		self.epsilon_low = meta['epsilon_low']
+		self.reward_info = meta['reward_info']
+
+		# Righe salvate (tutte se la matrice salvata era densa)
+		if 'row_ids' in checkpoint:
+			row_ids = checkpoint['row_ids']
+			state_ids = np.flatnonzero(row_ids != SparseQTable.DEFAULT_ROW)
+			saved_rows = row_ids[state_ids]
+		else:
+			state_ids = np.arange(self.env.get_no_states())
+			saved_rows = state_ids
+		# La matrice mappata in uso è riutilizzata: ricrearla sostituirebbe il
+		# file letto da altri processi (ref. MappedQTable.reset)
+		reuse = isinstance(self.qmatrix, MappedQTable) and self.qmatrix.path == self.qmatrix_path
+		if not reuse:
+			self.qmatrix = self.init_qmatrix()
+		with self.qmatrix.writing():
+			if reuse:
+				self.qmatrix.reset()
+			rows = self.qmatrix.materialize(state_ids)
+			for key in CHECKPOINT_ARRAYS:
+				getattr(self.qmatrix, key)[rows] = checkpoint[key][saved_rows]
+			self.qmatrix.refresh(rows)
+		self.td_history.restore(checkpoint['td_history'], meta['td_history_total'])
+
+		self.env.attempt_id = meta['curr_state_id']
+		self.curr_state = self.env.attempt
+		random.setstate((meta['random_state'][0], tuple(meta['random_state'][1]), meta['random_state'][2]))
+		set_rng_state(np.random, meta['np_random_state'])
+		set_rng_state(self.env.action_space.np_random, meta['action_space_random_state'])
\ No newline at end of file
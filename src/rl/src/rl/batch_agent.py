@@ -0,0 +1,435 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import rl.rl_exceptions as rlexc
+import numpy as np
+from rl.agent import EXPLORATION_MODES
+
+
+# classes--------------------------------------------------------------------
+
+class BatchAgent:
+
+	"""
+	Rappresenta K agenti indipendenti (stessi iperparametri, partite e semi
+	differenti) addestrati in parallelo su un MastermindVecEnv. Le matrici Q
+	sono impilate in tensori (K, no_states, no_actions) indicizzati per
+	identificativo di stato; selezione delle azioni ed aggiornamento sono
+	eseguiti con operazioni vettoriali su tutti gli agenti.
+	L'aggiornamento di ciascun agente coincide con Agent.update_qmatrix: gli
+	stati simili sono elaborati in turni (al turno j il j-esimo stato simile
+	di ciascun agente), all'interno di un turno la propagazione procede per
+	livelli come in Agent
+
+	Attributes
+	-----------------------------------
+	(MastermindVecEnv) env
+		Partite con cui gli agenti interagiscono (una per agente)
+
+	(int) no_agents
+		Indica il numero di agenti
+
+	(float) alpha
+		Indica il tasso di apprendimento
+
+	(float) gamma
+		Indica il tasso di sconto
+
+	(numpy.ndarray) epsilon
+		Indica il tasso di exploitation/exploration di ciascun agente
+
+	(float) beta
+		Indica il tasso di penalità
+
+	(str) exploration_mode
+		Indica quale strategia adottare nella selezione delle azioni da eseguire
+
+	(float) epsilon_decay
+		Indica il fattore di decadimento di epsilon
+
+	(float) epsilon_low
+		Indica il valore minimo consentito di epsilon
+
+	(dict) reward_info
+		Ultima ricompensa fornita a ciascun agente e variazione rispetto alla
+		precedente (array di no_agents elementi)
+
+	(numpy.ndarray) qvalues
+	(numpy.ndarray) td_errors
+	(numpy.ndarray) td_errors_delta
+		Tensori di dimensione (no_agents, no_states, no_actions)
+
+	(numpy.ndarray) visits
+	(numpy.ndarray) max_qvalues
+		Matrici di dimensione (no_agents, no_states)
+
+	(numpy.random.RandomState) np_random
+		Generatore utilizzato nella selezione delle azioni
+
+	Methods
+	-----------------------------------
+	get_actions()
+		Restituisce l'azione da intraprendere per ciascun agente
+
+	take_actions(actions, mask=None)
+		Effettua le azioni passate in ingresso
+
+	update_qmatrix(rewards, mask=None)
+		Aggiorna le matrici Q degli agenti indicati
+
+	shape_rewards(rewards)
+		Modella le ricompense in base al numero di visite dello stato corrente
+
+	reset(mask=None)
+		Riporta gli agenti indicati allo stato iniziale
+
+	get_optimal()
+		Restituisce la politica ottimale di ciascun agente
+	"""
+
+	def __init__(self, env, alpha=0.7, gamma=0.9, epsilon=0.999, beta=0.5, exploration_mode=EXPLORATION_MODES[1], epsilon_decay=0.7, epsilon_low=0.2, random_seed=None):
+
+		"""
+		Parameters
+		-----------------------------------
+		(MastermindVecEnv) env
+			Partite con cui gli agenti interagiscono (una per agente)
+
+		(float) alpha [opt, default = 0.7]
+			Indica il tasso di apprendimento
+
+		(float) gamma [opt, default = 0.9]
+			Indica il tasso di sconto
+
+		(float) epsilon [opt, default = 0.999]
+			Indica il tasso di exploitation/exploration iniziale
+
+		(float) beta [opt, default = 0.5]
+			Indica il tasso di penalità
+
+		(str) exploration_mode [opt, default = EXPLORATION_MODES[1]]
+			Indica quale strategia di esplorazione
+
+		(float) epsilon_decay [opt, default = 0.7]
+			Indica il fattore di decadimento di epsilon
+
+		(float) epsilon_low [opt, default = 0.2]
+			Indica il valore minimo consentito di epsilon
+
+		(int) random_seed [opt, default = None]
+			Seme del generatore utilizzato nella selezione delle azioni
+
+		Raises
+		-----------------------------------
+		InvalidAlphaError
+			Il valore di alpha non è compreso in [0, 1]
+
+		InvalidGammaError
+			Il valore di gamma non è compreso in [0, 1]
+
+		InvalidEpsilonError
+			Il valore di epsilon e/o epsilon_low non è compreso in [0, 1]
+
+		InvalidEpsilonModeError
+			La strategia indicata non è supportata (non è indicata in EXPLORATION_MODES)
+
+		InvalidBetaError
+			Il valore di beta è negativo
+		"""
+
+		if not 0 <= alpha <= 1:
+			raise rlexc.InvalidAlphaError(alpha)
+		if not 0 <= gamma <= 1:
+			raise rlexc.InvalidGammaError(gamma)
+		if not 0 <= epsilon <= 1:
+			raise rlexc.InvalidEpsilonError(epsilon)
+		if not exploration_mode in EXPLORATION_MODES:
+			raise rlexc.InvalidEpsilonModeError(exploration_mode, EXPLORATION_MODES)
+		if not 0 <= epsilon_low <= 1:
+			raise rlexc.InvalidEpsilonError(epsilon_low)
+		if not 0 <= beta:
+			raise rlexc.InvalidBetaError(beta)
+
+		self.env = env
+		self.no_agents = env.no_envs
+		self.alpha = alpha
+		self.gamma = gamma
+		self.epsilon = np.full(self.no_agents, epsilon, dtype=float)
+		self.beta = beta
+		self.exploration_mode = exploration_mode
+		self.epsilon_decay = epsilon_decay
+		self.epsilon_low = epsilon_low
+		self.reward_info = {
+			'reward': np.zeros(self.no_agents, dtype=float),
+			'reward_delta': np.zeros(self.no_agents, dtype=float)
+		}
+		self.np_random = np.random.RandomState(random_seed)
+
+		no_states = env.state_space.get_no_states()
+		no_actions = env.no_pegs
+		shape = (self.no_agents, no_states, no_actions)
+		self.qvalues = np.full(shape, 0, dtype=float)
+		self.td_errors = np.full(shape, -np.inf, dtype=float)
+		self.td_errors_delta = np.full(shape, -np.inf, dtype=float)
+		self.visits = np.zeros((self.no_agents, no_states), dtype=np.int64)
+		self.max_qvalues = np.zeros((self.no_agents, no_states), dtype=float)
+		self.env.reset()
+
+
+	def get_actions(self):
+
+		"""
+		Restituisce l'azione da intraprendere per ciascun agente: casuale con
+		probabilità epsilon, altrimenti una delle azioni aventi valore Q
+		massimo (scelta uniformemente tra quelle a pari merito)
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) actions
+			Azioni da intraprendere
+		"""
+
+		agent_ids = np.arange(self.no_agents)
+		state_ids = self.env.attempt_ids
+		qvalues = self.qvalues[agent_ids, state_ids]
+		keys = self.np_random.uniform(size=qvalues.shape)
+		keys[qvalues != self.max_qvalues[agent_ids, state_ids][:, np.newaxis]] = -1
+		actions = keys.argmax(axis=1)
+		explore = self.np_random.uniform(0, 1.0, size=self.no_agents) > (1-self.epsilon)
+		actions[explore] = self.np_random.randint(0, self.env.no_pegs, size=int(explore.sum()))
+		return actions
+
+
+	def take_actions(self, actions, mask=None):
+
+		"""
+		Effettua le azioni passate in ingresso
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) actions
+			Azioni da eseguire (una per agente)
+
+		(numpy.ndarray) mask [opt, default = None]
+			Indica gli agenti che eseguono l'azione (tutti se None)
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) done
+			Indica quali agenti si trovano in uno stato terminale
+		"""
+
+		_, done = self.env.step(actions, mask)
+		return done
+
+
+	def expand_coverage(self, agent_ids, state_ids):
+
+		"""
+		Concatena le coperture degli stati passati in ingresso (uno per agente)
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) agent_ids
+			Agenti
+
+		(numpy.ndarray) state_ids
+			Identificativi degli stati di cui si vuole la copertura
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) entries
+			Indice (in agent_ids) a cui appartiene ciascuno stato coperto
+
+		(numpy.ndarray) covered_state_ids
+			Identificativi degli stati coperti
+		"""
+
+		state_space = self.env.state_space
+		starts = state_space.coverage_offsets[state_ids]
+		sizes = state_space.coverage_offsets[state_ids+1]-starts
+		entries = np.repeat(np.arange(len(agent_ids)), sizes)
+		positions = np.arange(sizes.sum())-np.repeat(np.cumsum(sizes)-sizes, sizes)+starts[entries]
+		return entries, state_space.coverage_ids[positions]
+
+
+	def propagate(self, agent_ids, state_ids, rewards, curr_state_ids):
+
+		"""
+		Propaga all'indietro le ricompense assegnate agli stati terminali
+		passati in ingresso (uno per agente, ref. Agent.update_qmatrix)
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) agent_ids
+			Agenti da aggiornare (distinti)
+
+		(numpy.ndarray) state_ids
+			Stati terminali ricompensati
+
+		(numpy.ndarray) rewards
+			Ricompense assegnate agli stati terminali
+
+		(numpy.ndarray) curr_state_ids
+			Stati correnti degli agenti
+		"""
+
+		state_space = self.env.state_space
+		qvalues = self.qvalues
+		td_errors = self.td_errors
+		td_errors_delta = self.td_errors_delta
+		max_qvalues = self.max_qvalues
+
+		# Stati terminali
+		curr = state_ids == curr_state_ids
+		td = np.where(curr, self.alpha*(rewards-qvalues[agent_ids, state_ids, 0]), self.alpha*rewards)
+		curr_agent_ids, curr_ids = agent_ids[curr], state_ids[curr]
+		td_errors_delta[curr_agent_ids, curr_ids, :] = (td[curr]-td_errors[curr_agent_ids, curr_ids, 0])[:, np.newaxis]
+		td_errors[curr_agent_ids, curr_ids, :] = td[curr][:, np.newaxis]
+		qvalues[agent_ids, state_ids, :] = qvalues[agent_ids, state_ids, :]+td[:, np.newaxis]
+		max_qvalues[agent_ids, state_ids] = qvalues[agent_ids, state_ids].max(axis=-1)
+
+		# Livelli successivi, per lunghezza decrescente
+		entries, covered_state_ids = self.expand_coverage(agent_ids, state_ids)
+		covered_lens = state_space.state_lens[covered_state_ids]
+		for length in range(state_space.code_len-1, -1, -1):
+			level = np.flatnonzero(covered_lens == length)
+			level_agent_ids = agent_ids[entries[level]]
+			level_state_ids = covered_state_ids[level]
+			covered, actions = np.nonzero(state_space.state_counts[level_state_ids] < state_space.state_counts[state_ids[entries[level]]])
+			covered_agent_ids = level_agent_ids[covered]
+			covered_ids = level_state_ids[covered]
+			reachable_ids = state_space.transitions[covered_ids, actions]
+			td = self.alpha*(self.gamma*max_qvalues[covered_agent_ids, reachable_ids]-qvalues[covered_agent_ids, covered_ids, actions])
+			qvalues[covered_agent_ids, covered_ids, actions] = qvalues[covered_agent_ids, covered_ids, actions]+td
+			td_errors_delta[covered_agent_ids, covered_ids, actions] = td-td_errors[covered_agent_ids, covered_ids, actions]
+			td_errors[covered_agent_ids, covered_ids, actions] = td
+			max_qvalues[level_agent_ids, level_state_ids] = qvalues[level_agent_ids, level_state_ids].max(axis=-1)
+
+
+	def update_qmatrix(self, rewards, mask=None):
+
+		"""
+		Aggiorna le matrici Q degli agenti indicati che si trovano in uno stato
+		terminale (ref. Agent.update_qmatrix) ed incrementa le visite della
+		copertura dello stato corrente di tutti gli agenti indicati
+
+		Parameters
+		-----------------------------------
+		(list) rewards
+			Ricompense assegnate dall'utente (una per agente, ignorate per gli
+			agenti esclusi da mask)
+
+		(numpy.ndarray) mask [opt, default = None]
+			Indica gli agenti da aggiornare (tutti se None)
+		"""
+
+		state_space = self.env.state_space
+		terminal_state_len = state_space.code_len
+		agent_ids = np.arange(self.no_agents) if mask is None else np.flatnonzero(mask)
+		curr_state_ids = self.env.attempt_ids[agent_ids]
+		rewards = np.asarray(rewards).tolist()
+
+		terminal = state_space.state_lens[curr_state_ids] == terminal_state_len
+		updated_agent_ids = agent_ids[terminal]
+		updated_state_ids = curr_state_ids[terminal]
+		if len(updated_agent_ids) > 0:
+			common_elements = np.minimum(
+				state_space.terminal_state_counts[np.newaxis, :, :],
+				state_space.state_counts[updated_state_ids][:, np.newaxis, :]
+			).sum(axis=-1)
+			similar = (
+				(self.visits[updated_agent_ids[:, np.newaxis], state_space.terminal_state_ids[np.newaxis, :]] == 0) &
+				(common_elements >= 1) & (common_elements <= 2)
+			)
+
+			# Coda degli aggiornamenti di ciascun agente: stati simili in ordine
+			# crescente e infine lo stato corrente
+			queues = []
+			for entry, agent_id in enumerate(updated_agent_ids.tolist()):
+				reward = rewards[agent_id]
+				reward = reward if reward >= 0 else reward*3
+				self.reward_info['reward_delta'][agent_id] = abs(self.reward_info['reward'][agent_id]-reward)
+				self.reward_info['reward'][agent_id] = reward
+				similar_entries = np.flatnonzero(similar[entry])
+				queue = [
+					(state_id, reward/terminal_state_len*state_common_elements)
+					for state_id, state_common_elements in zip(
+						state_space.terminal_state_ids[similar_entries].tolist(),
+						common_elements[entry, similar_entries].tolist()
+					)
+				]
+				queue.append((int(updated_state_ids[entry]), reward))
+				queues.append(queue)
+
+			# Al turno j ogni agente elabora il proprio j-esimo aggiornamento
+			for j in range(max(len(queue) for queue in queues)):
+				entries = [entry for entry, queue in enumerate(queues) if len(queue) > j]
+				self.propagate(
+					updated_agent_ids[entries],
+					np.array([queues[entry][j][0] for entry in entries], dtype=np.int64),
+					np.array([queues[entry][j][1] for entry in entries], dtype=float),
+					updated_state_ids[entries]
+				)
+
+			if self.exploration_mode == EXPLORATION_MODES[1]:
+				self.epsilon[updated_agent_ids] = np.maximum(self.epsilon_low, self.epsilon[updated_agent_ids]*self.epsilon_decay)
+
+		entries, covered_state_ids = self.expand_coverage(agent_ids, curr_state_ids)
+		self.visits[agent_ids[entries], covered_state_ids] += 1
+
+
+	def shape_rewards(self, rewards):
+
+		"""
+		Modella le ricompense aggiungendo una penalità proporzionale al numero
+		di volte in cui lo stato corrente di ciascun agente è stato visitato
+		(ref. Agent.shape_reward)
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) rewards
+			Ricompense assegnate dall'utente (una per agente)
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) rewards
+			Ricompense modellate
+		"""
+
+		visits = self.visits[np.arange(self.no_agents), self.env.attempt_ids]
+		return np.asarray(rewards, dtype=float)-np.sqrt(visits)/self.beta
+
+
+	def reset(self, mask=None):
+
+		"""
+		Riporta gli agenti indicati allo stato iniziale
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) mask [opt, default = None]
+			Indica gli agenti da riportare allo stato iniziale (tutti se None)
+		"""
+
+		self.env.reset(mask)
+
+
+	def get_optimal(self):
+
+		"""
+		Restituisce la politica ottimale di ciascun agente
+
+		Returns
+		-----------------------------------
+		(list) optimal
+			Politiche ottimali apprese (frozenbag)
+		"""
+
+		state_space = self.env.state_space
+		agent_ids = np.arange(self.no_agents)
+		optimal_ids = np.full(self.no_agents, self.env.init_state_id, dtype=np.int64)
+		for _ in range(state_space.code_len):
+			actions = self.qvalues[agent_ids, optimal_ids].argmax(axis=-1)
+			optimal_ids = state_space.transitions[optimal_ids, actions]
+		return [state_space.states[optimal_id] for optimal_id in optimal_ids.tolist()]
\ No newline at end of file
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from collections import deque, namedtuple
+from rl.emotions import derive_emotion
+
+
+# constants------------------------------------------------------------------
+
+EMOTION_SOURCES = [
+	'action',
+	'update'
+]
+
+DEFAULT_QUEUE_SIZE = 256
+
+EmotionEvent = namedtuple('EmotionEvent', [
+	'source',
+	'step',
+	'state_id',
+	'action',
+	'reward',
+	'qvalue',
+	'td_error',
+	'td_error_delta',
+	'emotion',
+	'intensity',
+	'value',
+	'time'
+])
+
+
+# classes--------------------------------------------------------------------
+
+class EmotionStream:
+
+	"""
+	Distribuisce ai sottoscrittori gli eventi emotivi prodotti dall'agente
+	(uno per azione eseguita ed uno per ogni aggiornamento con ricompensa).
+	Ogni sottoscrittore riceve gli eventi in una coda limitata: se la coda è
+	piena l'evento più vecchio viene scartato, per cui la pubblicazione non
+	attende mai i consumatori. In assenza di sottoscrittori la pubblicazione
+	non calcola alcun evento
+
+	Methods
+	-----------------------------------
+	subscribe(maxsize=DEFAULT_QUEUE_SIZE)
+		Registra un nuovo sottoscrittore
+
+	unsubscribe(subscription)
+		Rimuove un sottoscrittore
+
+	has_subscribers()
+		Verifica se esistono sottoscrittori
+
+	publish(source, step, state_id, action, qvalue, td_error, td_error_delta, reward=None)
+		Calcola e distribuisce un evento
+	"""
+
+	def __init__(self):
+		self.subscriptions = ()
+		self.lock = threading.Lock()
+
+
+	def subscribe(self, maxsize=DEFAULT_QUEUE_SIZE):
+
+		"""
+		Registra un nuovo sottoscrittore
+
+		Parameters
+		-----------------------------------
+		(int) maxsize [opt, default = DEFAULT_QUEUE_SIZE]
+			Numero massimo di eventi in attesa di essere letti
+
+		Returns
+		-----------------------------------
+		(EmotionSubscription) subscription
+			Coda da cui leggere gli eventi
+		"""
+
+		subscription = EmotionSubscription(self, maxsize)
+		with self.lock:
+			self.subscriptions = self.subscriptions + (subscription,)
+		return subscription
+
+
+	def unsubscribe(self, subscription):
+
+		"""
+		Rimuove un sottoscrittore
+
+		Parameters
+		-----------------------------------
+		(EmotionSubscription) subscription
+			Sottoscrittore da rimuovere
+		"""
+
+		with self.lock:
+			self.subscriptions = tuple(s for s in self.subscriptions if s is not subscription)
+
+
+	def has_subscribers(self):
+
+		"""
+		Verifica se esistono sottoscrittori
+
+		Returns
+		-----------------------------------
+		(bool) subscribers
+			Indica se esiste almeno un sottoscrittore
+		"""
+
+		return len(self.subscriptions) > 0
+
+
+	def publish(self, source, step, state_id, action, qvalue, td_error, td_error_delta, reward=None):
+
+		"""
+		Calcola l'emozione associata ai valori passati in ingresso (ref.
+		derive_emotion) e la distribuisce a tutti i sottoscrittori
+
+		Parameters
+		-----------------------------------
+		(str) source
+			Origine dell'evento (EMOTION_SOURCES)
+
+		(int) step
+			Numero di azioni eseguite dall'agente
+
+		(int) state_id
+			Identificativo dello stato
+
+		(int) action
+			Azione eseguita (None per gli aggiornamenti)
+
+		(float) qvalue
+			Valore Q
+
+		(float) td_error
+			Errore TD
+
+		(float) td_error_delta
+			Variazione dell'errore TD
+
+		(float) reward [opt, default = None]
+			Ricompensa ricevuta (None per le azioni)
+		"""
+
+		subscriptions = self.subscriptions
+		if len(subscriptions) == 0:
+			return
+		emotion, intensity, value = derive_emotion(qvalue, td_error, td_error_delta)
+		event = EmotionEvent(
+			source, step, state_id, action, reward,
+			float(qvalue), float(td_error), float(td_error_delta),
+			emotion, intensity, value, time.time()
+		)
+		for subscription in subscriptions:
+			subscription.put(event)
+
+
+
+class EmotionSubscription:
+
+	"""
+	Coda limitata degli eventi destinati ad un sottoscrittore. Gli eventi
+	scartati perché la coda era piena sono conteggiati in dropped
+
+	Attributes
+	-----------------------------------
+	(int) maxsize
+		Numero massimo di eventi in attesa
+
+	(int) dropped
+		Numero di eventi scartati
+
+	Methods
+	-----------------------------------
+	get(timeout=None)
+		Restituisce il prossimo evento attendendo al più timeout secondi
+
+	get_nowait()
+		Restituisce il prossimo evento se disponibile
+
+	drain()
+		Restituisce tutti gli eventi in attesa
+
+	close()
+		Annulla la sottoscrizione
+	"""
+
+	def __init__(self, stream, maxsize=DEFAULT_QUEUE_SIZE):
+		self.stream = stream
+		self.maxsize = maxsize
+		self.dropped = 0
+		self.events = deque(maxlen=maxsize)
+		self.condition = threading.Condition(threading.Lock())
+
+
+	def __len__(self):
+		return len(self.events)
+
+
+	def put(self, event):
+		with self.condition:
+			if len(self.events) == self.maxsize:
+				self.dropped += 1
+			self.events.append(event)
+			self.condition.notify()
+
+
+	def get(self, timeout=None):
+
+		"""
+		Restituisce il prossimo evento attendendo al più timeout secondi
+
+		Parameters
+		-----------------------------------
+		(float) timeout [opt, default = None]
+			Tempo massimo di attesa in secondi (illimitato se None)
+
+		Returns
+		-----------------------------------
+		(EmotionEvent) event
+			Prossimo evento, None se nessun evento è arrivato entro timeout
+		"""
+
+		with self.condition:
+			if timeout is None:
+				while len(self.events) == 0:
+					self.condition.wait()
+			else:
+				end_time = time.time()+timeout
+				while len(self.events) == 0:
+					remaining = end_time-time.time()
+					if remaining <= 0:
+						return None
+					self.condition.wait(remaining)
+			return self.events.popleft()
+
+
+	def get_nowait(self):
+
+		"""
+		Restituisce il prossimo evento se disponibile
+
+		Returns
+		-----------------------------------
+		(EmotionEvent) event
+			Prossimo evento, None se la coda è vuota
+		"""
+
+		with self.condition:
+			if len(self.events) == 0:
+				return None
+			return self.events.popleft()
+
+
+	def drain(self):
+
+		"""
+		Restituisce tutti gli eventi in attesa (ad esempio da un callback
+		periodico dell'interfaccia grafica)
+
+		Returns
+		-----------------------------------
+		(list) events
+			Eventi in ordine di arrivo
+		"""
+
+		with self.condition:
+			events = list(self.events)
+			self.events.clear()
+		return events
+
+
+	def close(self):
+
+		"""
+		Annulla la sottoscrizione
+		"""
+
+		self.stream.unsubscribe(self)
\ No newline at end of file
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+# constants------------------------------------------------------------------
+
+PERCENTAGE_HOPE_TOLERANCE = 0.1
+
+NO_EMOTION = 0
+
+HOPE = 1
+
+FEAR = -1
+
+DECIMALS = 3
+
+INTENSITY_THRESHOLDS = np.array([0.25, 0.5, 0.75, 1])
+
+HOPE_VALUES = np.array([5, 4, 3, 2, 1])
+
+FEAR_VALUES = np.array([-1, -2, -3, -4, -5])
+
+
+# functions------------------------------------------------------------------
+
+def get_emotions(qvalues, td_errors, tolerance=PERCENTAGE_HOPE_TOLERANCE):
+
+	"""
+	Calcola l'emozione (HOPE, FEAR, NO_EMOTION) associata a ciascuna azione.
+	Valori arrotondati a DECIMALS cifre: errore TD nullo -> NO_EMOTION, errore
+	TD pari al valore Q o -inf -> FEAR, altrimenti HOPE se la variazione
+	percentuale del valore Q non supera tolerance, FEAR in caso contrario
+
+	Parameters
+	-----------------------------------
+	(numpy.ndarray) qvalues
+		Valori Q delle azioni
+
+	(numpy.ndarray) td_errors
+		Errori TD delle azioni
+
+	(float) tolerance [opt, default = PERCENTAGE_HOPE_TOLERANCE]
+		Massima variazione percentuale del valore Q associata a HOPE
+
+	Returns
+	-----------------------------------
+	(numpy.ndarray) emotions
+		Emozioni (interi)
+	"""
+
+	new_qvalues = np.round(np.asarray(qvalues, dtype=float), DECIMALS)
+	td_errors = np.round(np.asarray(td_errors, dtype=float), DECIMALS)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		old_qvalues = new_qvalues-td_errors
+		differences = np.abs((new_qvalues-old_qvalues)/np.abs(old_qvalues))
+	emotions = np.where(differences <= tolerance, HOPE, FEAR)
+	emotions[(td_errors == new_qvalues) | (td_errors == -np.inf)] = FEAR
+	emotions[td_errors == 0] = NO_EMOTION
+	return emotions
+
+
+def get_intensities(td_errors, td_errors_delta):
+
+	"""
+	Calcola la variazione relativa (in valore assoluto) dell'errore TD di
+	ciascuna azione. Valori arrotondati a DECIMALS cifre: variazione nulla -> 0,
+	variazione pari all'errore TD o +inf -> +inf
+
+	Parameters
+	-----------------------------------
+	(numpy.ndarray) td_errors
+		Errori TD delle azioni
+
+	(numpy.ndarray) td_errors_delta
+		Variazioni degli errori TD delle azioni
+
+	Returns
+	-----------------------------------
+	(numpy.ndarray) intensities
+		Variazioni relative degli errori TD
+	"""
+
+	new_td_errors = np.round(np.asarray(td_errors, dtype=float), DECIMALS)
+	td_errors_delta = np.round(np.asarray(td_errors_delta, dtype=float), DECIMALS)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		old_td_errors = new_td_errors-td_errors_delta
+		intensities = np.abs((new_td_errors-old_td_errors)/np.abs(old_td_errors))
+	intensities[(td_errors_delta == new_td_errors) | (td_errors_delta == np.inf)] = np.inf
+	intensities[td_errors_delta == 0] = 0.0
+	return intensities
+
+
+def get_emotion_values(emotions, intensities):
+
+	"""
+	Calcola il valore (-5..5) di ciascuna emozione: l'intensità è suddivisa
+	negli intervalli [0, 0.25), [0.25, 0.5), [0.5, 0.75), [0.75, 1) e [1, +inf]
+	(NaN compreso), a cui corrispondono 5..1 per HOPE e -1..-5 per FEAR;
+	NO_EMOTION vale 0
+
+	Parameters
+	-----------------------------------
+	(numpy.ndarray) emotions
+		Emozioni (ref. get_emotions)
+
+	(numpy.ndarray) intensities
+		Intensità (ref. get_intensities)
+
+	Returns
+	-----------------------------------
+	(numpy.ndarray) values
+		Valori delle emozioni
+	"""
+
+	emotions = np.asarray(emotions)
+	buckets = np.searchsorted(INTENSITY_THRESHOLDS, np.asarray(intensities, dtype=float), side='right')
+	values = np.where(emotions == HOPE, HOPE_VALUES[buckets], FEAR_VALUES[buckets])
+	values[emotions == NO_EMOTION] = 0
+	return values
+
+
+def derive_emotions(qvalues, td_errors, td_errors_delta, tolerance=PERCENTAGE_HOPE_TOLERANCE):
+
+	"""
+	Calcola emozioni, intensità e valori di una serie di azioni (ad esempio
+	i campi qvalue, td_error e td_error_delta di TDHistory.get_records())
+
+	Parameters
+	-----------------------------------
+	(numpy.ndarray) qvalues
+		Valori Q delle azioni
+
+	(numpy.ndarray) td_errors
+		Errori TD delle azioni
+
+	(numpy.ndarray) td_errors_delta
+		Variazioni degli errori TD delle azioni
+
+	(float) tolerance [opt, default = PERCENTAGE_HOPE_TOLERANCE]
+		Massima variazione percentuale del valore Q associata a HOPE
+
+	Returns
+	-----------------------------------
+	(numpy.ndarray) emotions
+		Emozioni
+
+	(numpy.ndarray) intensities
+		Variazioni relative degli errori TD
+
+	(numpy.ndarray) values
+		Valori delle emozioni
+	"""
+
+	emotions = get_emotions(qvalues, td_errors, tolerance)
+	intensities = get_intensities(td_errors, td_errors_delta)
+	return emotions, intensities, get_emotion_values(emotions, intensities)
+
+
+def derive_emotion(qvalue, td_error, td_error_delta, tolerance=PERCENTAGE_HOPE_TOLERANCE):
+
+	"""
+	Calcola emozione, intensità e valore di una singola azione in tempo
+	costante (stesso risultato di derive_emotions, da usare passo per passo)
+
+	Parameters
+	-----------------------------------
+	(float) qvalue
+		Valore Q dell'azione
+
+	(float) td_error
+		Errore TD dell'azione
+
+	(float) td_error_delta
+		Variazione dell'errore TD dell'azione
+
+	(float) tolerance [opt, default = PERCENTAGE_HOPE_TOLERANCE]
+		Massima variazione percentuale del valore Q associata a HOPE
+
+	Returns
+	-----------------------------------
+	(int) emotion
+		Emozione
+
+	(float) intensity
+		Variazione relativa dell'errore TD
+
+	(int) value
+		Valore dell'emozione
+	"""
+
+	new_qvalue = _round(qvalue)
+	new_td_error = _round(td_error)
+	td_error_delta = _round(td_error_delta)
+
+	if new_td_error == 0:
+		emotion = NO_EMOTION
+	elif new_td_error == new_qvalue or new_td_error == -np.inf:
+		emotion = FEAR
+	else:
+		old_qvalue = new_qvalue-new_td_error
+		emotion = HOPE if _relative_difference(new_qvalue, old_qvalue) <= tolerance else FEAR
+
+	if td_error_delta == 0:
+		intensity = 0.0
+	elif td_error_delta == new_td_error or td_error_delta == np.inf:
+		intensity = np.inf
+	else:
+		old_td_error = new_td_error-td_error_delta
+		intensity = _relative_difference(new_td_error, old_td_error)
+
+	if emotion == NO_EMOTION:
+		return emotion, intensity, 0
+	bucket = int(np.searchsorted(INTENSITY_THRESHOLDS, intensity, side='right'))
+	return emotion, intensity, int(HOPE_VALUES[bucket] if emotion == HOPE else FEAR_VALUES[bucket])
+
+
+def _round(value):
+	return float(np.rint(float(value)*10**DECIMALS))/10**DECIMALS
+
+
+def _relative_difference(new_value, old_value):
+	with np.errstate(divide='ignore', invalid='ignore'):
+		return float(abs((np.float64(new_value)-old_value)/abs(np.float64(old_value))))
\ No newline at end of file
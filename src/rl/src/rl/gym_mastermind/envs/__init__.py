@@ -1,4 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from rl.gym_mastermind.envs.mastermind_env import MastermindEnv
\ No newline at end of file
+from rl.gym_mastermind.envs.mastermind_env import MastermindEnv
+from rl.gym_mastermind.envs.mastermind_state_space import MastermindStateSpace, get_state_space
+from rl.gym_mastermind.envs.mastermind_vec_env import MastermindVecEnv
+from rl.gym_mastermind.envs.packed_state import PackedStateCodec
\ No newline at end of file
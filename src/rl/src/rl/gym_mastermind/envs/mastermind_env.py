@@ -6,7 +6,7 @@ import gym
 from gym import error, spaces, utils
 from gym.utils import seeding
 from collections_extended import frozenbag
-import itertools
+from rl.gym_mastermind.envs.mastermind_state_space import get_state_space, NO_TRANSITION
 
 
 # classes--------------------------------------------------------------------
@@ -27,6 +27,17 @@ class MastermindEnv(gym.Env):
 	(frozenbag) attempt
 		Indica lo stato attuale dell'agente
 
+	(int) attempt_id
+		Indica l'identificativo dello stato attuale dell'agente
+
+	(MastermindStateSpace) state_space
+		Indica lo spazio degli stati (condiviso tra gli ambienti aventi la
+		stessa configurazione). I metodi che ricevono uno stato accettano sia
+		frozenbag che stati codificati (ref. PackedStateCodec)
+
+	(int) packed_secret
+		Indica il codice segreto codificato
+
 	Methods
 	-----------------------------------
 	step(action)
@@ -45,6 +56,18 @@ class MastermindEnv(gym.Env):
 	get_states()
 		Restituisce tutti i possibili stati
 
+	get_no_states()
+		Restituisce il numero degli stati
+
+	get_state(state_id)
+		Restituisce lo stato avente l'identificativo passato in ingresso
+
+	get_state_id(state)
+		Restituisce l'identificativo dello stato passato in ingresso
+
+	get_packed_state(state_id)
+		Restituisce lo stato codificato avente l'identificativo passato in ingresso
+
 	get_terminal_states()
 		Restituisce tutti i possibili stati terminali
 
@@ -52,10 +75,18 @@ class MastermindEnv(gym.Env):
 		Restituisce la copertura (tutti gli stati che possono raggiungere in 
 		modo diretto o indiretto) dello stato passato in ingresso
 
+	get_coverage_ids(state_id)
+		Restituisce gli identificativi degli stati appartenenti alla copertura
+		dello stato passato in ingresso, ordinati per lunghezza decrescente
+
 	get_next_reachable_states(state)
 		Restituisce tutti i possibili stati immediatamente successivi 
 		(raggiungibili con una sola azione) allo stato passato in ingresso
 
+	get_next_reachable_state_ids(state_id)
+		Restituisce gli identificativi degli stati immediatamente successivi
+		allo stato passato in ingresso, indicizzati per azione
+
 	get_init_state()
 		Restituisce lo stato iniziale
 
@@ -101,7 +132,19 @@ class MastermindEnv(gym.Env):
 		self.action_space = spaces.Discrete(no_pegs)
 		self.action_space.seed(random_seed)
 		self.secret = secret
-		self.attempt = frozenbag()
+		self.state_space = get_state_space(no_pegs, len(secret))
+		self.packed_secret = self.state_space.codec.pack(secret)
+		self.attempt_id = self.state_space.get_state_id(frozenbag())
+
+
+	@property
+	def attempt(self):
+		return self.state_space.states[self.attempt_id]
+
+
+	@attempt.setter
+	def attempt(self, state):
+		self.attempt_id = self.state_space.get_state_id(state)
 
 
 	def step(self, action):
@@ -120,6 +163,9 @@ class MastermindEnv(gym.Env):
 		InvalidActionError
 			L'azione che l'agente vuole intraprendere è inesistente
 
+		InvalidStateError
+			L'agente si trova già in uno stato terminale
+
 		Returns
 		-----------------------------------
 		(frozenbag) attempt
@@ -129,9 +175,12 @@ class MastermindEnv(gym.Env):
 			Indica se il nuovo stato è terminale
 		"""
 
-		if not 0 <= action <= self.action_space.n:
+		if not 0 <= action < self.action_space.n:
 			raise rlexc.InvalidActionError(action)
-		self.attempt = frozenbag(list(self.attempt) + [action])
+		next_attempt_id = self.state_space.transitions[self.attempt_id, action]
+		if next_attempt_id == NO_TRANSITION:
+			raise rlexc.InvalidStateError(self.attempt)
+		self.attempt_id = int(next_attempt_id)
 		return self.attempt, self.is_done()
 
 
@@ -146,7 +195,7 @@ class MastermindEnv(gym.Env):
 			Stato iniziale dell'agente
 		"""
 
-		self.attempt = frozenbag()
+		self.attempt_id = self.state_space.get_state_id(frozenbag())
 		return self.attempt
 
 
@@ -185,11 +234,89 @@ class MastermindEnv(gym.Env):
 			Lista degli stati
 		"""
 
-		states = []
-		for k in range(len(self.secret)+1):
-			for state in itertools.combinations_with_replacement(range(self.action_space.n), k): 
-				states.append(frozenbag(state))
-		return states
+		return self.state_space.get_states()
+
+
+	def get_no_states(self):
+
+		"""
+		Restituisce il numero degli stati
+
+		Returns
+		-----------------------------------
+		(int) no_states
+			Numero degli stati
+		"""
+
+		return self.state_space.get_no_states()
+
+
+	def get_state(self, state_id):
+
+		"""
+		Restituisce lo stato avente l'identificativo passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Raises
+		-----------------------------------
+		InvalidStateError
+			L'identificativo passato in ingresso non è valido
+
+		Returns
+		-----------------------------------
+		(frozenbag) state
+			Stato corrispondente all'identificativo
+		"""
+
+		return self.state_space.get_state(state_id)
+
+
+	def get_state_id(self, state):
+
+		"""
+		Restituisce l'identificativo (intero in [0, no_states)) dello stato
+		passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(frozenbag|int) state
+			Stato di cui si vuole conoscere l'identificativo
+
+		Raises
+		-----------------------------------
+		InvalidStateError
+			Lo stato passato in ingresso non è valido (è inesistente)
+
+		Returns
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+		"""
+
+		return self.state_space.get_state_id(state)
+
+
+	def get_packed_state(self, state_id):
+
+		"""
+		Restituisce lo stato codificato avente l'identificativo passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Returns
+		-----------------------------------
+		(int) packed_state
+			Stato codificato
+		"""
+
+		return self.state_space.get_packed_state(state_id)
 
 
 	def get_terminal_states(self):
@@ -203,9 +330,8 @@ class MastermindEnv(gym.Env):
 			Lista degli stati terminali
 		"""
 
-		states = self.get_states()
 		terminal_states = []
-		for state in states:
+		for state in self.state_space.states:
 			if len(state) == self.get_terminal_state_len():
 				terminal_states.append(state)
 		return terminal_states
@@ -219,7 +345,7 @@ class MastermindEnv(gym.Env):
 
 		Parameters
 		-----------------------------------
-		(frozenbag) state
+		(frozenbag|int) state
 			Indica lo stato di cui si vuole conoscere la copertura
 
 		Raises
@@ -233,13 +359,29 @@ class MastermindEnv(gym.Env):
 			Copertura dello stato passato in ingresso
 		"""
 
-		if not state in self.get_states():
-			raise rlexc.InvalidStateError(state)
-		coverage = {state}
-		for k in range(0, len(state)):
-			for covered_state in itertools.combinations(state, k):
-				coverage.add(frozenbag(covered_state))
-		return coverage
+		states = self.state_space.states
+		return set(states[covered_state_id] for covered_state_id in self.get_coverage_ids(self.get_state_id(state)))
+
+
+	def get_coverage_ids(self, state_id):
+
+		"""
+		Restituisce gli identificativi degli stati appartenenti alla copertura
+		dello stato passato in ingresso, ordinati per lunghezza decrescente
+		(slice del reticolo precalcolato, nessuna copia)
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato di cui si vuole conoscere la copertura
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) coverage_ids
+			Identificativi degli stati coperti
+		"""
+
+		return self.state_space.get_coverage_ids(state_id)
 
 
 	def get_next_reachable_states(self, state):
@@ -250,7 +392,7 @@ class MastermindEnv(gym.Env):
 
 		Parameters
 		-----------------------------------
-		(frozenbag) state
+		(frozenbag|int) state
 			Indica lo stato di cui si vogliono conoscere gli stati 
 			immediatamente raggiungibili
 
@@ -265,19 +407,39 @@ class MastermindEnv(gym.Env):
 			Stati immediatamente raggiungibili
 		"""
 
-		if not state in self.get_states():
-			raise rlexc.InvalidStateError(state)
 		reachable_states = []
-		if not self.is_terminal_state(state):
-			for action in range(self.action_space.n):
-				reachable_state = frozenbag(list(state) + [action])
+		for action, reachable_state_id in enumerate(self.get_next_reachable_state_ids(self.get_state_id(state))):
+			if reachable_state_id != NO_TRANSITION:
 				reachable_states.append({
 					'action': action, 
-					'state': reachable_state
+					'state': self.state_space.states[reachable_state_id]
 				})
 		return reachable_states
 
 
+	def get_next_reachable_state_ids(self, state_id):
+
+		"""
+		Restituisce gli identificativi degli stati immediatamente successivi
+		allo stato passato in ingresso, indicizzati per azione (riga della
+		tabella delle transizioni, nessuna copia)
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato di cui si vogliono conoscere gli stati 
+			immediatamente raggiungibili
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) reachable_state_ids
+			Identificativi degli stati immediatamente raggiungibili, 
+			NO_TRANSITION se lo stato passato in ingresso è terminale
+		"""
+
+		return self.state_space.transitions[state_id]
+
+
 	def get_init_state(self):
 
 		"""
@@ -303,7 +465,7 @@ class MastermindEnv(gym.Env):
 			Indica se l'agente si trova in uno stato terminale
 		"""
 
-		return self.is_terminal_state(self.attempt)
+		return len(self.attempt) == len(self.secret)
 
 
 	def is_terminal_state(self, state):
@@ -313,7 +475,7 @@ class MastermindEnv(gym.Env):
 
 		Parameters
 		-----------------------------------
-		(frozenbag) state
+		(frozenbag|int) state
 
 		Raises
 		-----------------------------------
@@ -326,9 +488,7 @@ class MastermindEnv(gym.Env):
 			Indica se lo stato passato in ingresso è terminale
 		"""
 
-		if not state in self.get_states():
-			raise rlexc.InvalidStateError(state)
-		return len(self.secret) == len(state)
+		return len(self.secret) == int(self.state_space.state_lens[self.get_state_id(state)])
 
 
 	def is_guessed(self):
@@ -341,4 +501,4 @@ class MastermindEnv(gym.Env):
 		(bool) guessed
 			Indica se la sequenza segreta è stata indovinata
 		"""
-		return sorted(list(self.attempt)) == sorted(self.secret)
\ No newline at end of file
+		return self.state_space.packed_states[self.attempt_id] == self.packed_secret
\ No newline at end of file
@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import rl.rl_exceptions as rlexc
+from collections_extended import frozenbag
+from rl.gym_mastermind.envs.packed_state import PackedStateCodec
+import numpy as np
+import numbers
+import itertools
+
+
+# constants------------------------------------------------------------------
+
+NO_TRANSITION = -1
+
+_STATE_SPACES = {}
+
+
+# functions------------------------------------------------------------------
+
+def get_state_space(no_pegs, code_len):
+
+	"""
+	Restituisce lo spazio degli stati associato alla configurazione passata in
+	ingresso. Lo spazio è costruito una sola volta e condiviso da tutti gli
+	ambienti aventi la stessa configurazione
+
+	Parameters
+	-----------------------------------
+	(int) no_pegs
+		Indica il numero di pioli disponibili
+
+	(int) code_len
+		Indica la lunghezza del codice segreto
+
+	Returns
+	-----------------------------------
+	(MastermindStateSpace) state_space
+		Spazio degli stati
+	"""
+
+	key = (no_pegs, code_len)
+	if key not in _STATE_SPACES:
+		_STATE_SPACES[key] = MastermindStateSpace(no_pegs, code_len)
+	return _STATE_SPACES[key]
+
+
+# classes--------------------------------------------------------------------
+
+class MastermindStateSpace:
+
+	"""
+	Rappresenta lo spazio degli stati del gioco Mastermind. Ad ogni stato
+	(multiset di pioli) è associato un identificativo intero denso in
+	[0, no_states), l'ordinamento è lo stesso di MastermindEnv.get_states()
+	(per lunghezza e poi lessicografico). Gli stati possono essere indicati
+	sia come frozenbag che come interi codificati (ref. PackedStateCodec)
+
+	Attributes
+	-----------------------------------
+	(int) no_pegs
+		Indica il numero di pioli disponibili
+
+	(int) code_len
+		Indica la lunghezza del codice segreto (e quindi degli stati terminali)
+
+	(list) states
+		Lista degli stati indicizzata per identificativo
+
+	(dict) state_ids
+		Associa ad ogni stato il proprio identificativo
+
+	(PackedStateCodec) codec
+		Codifica degli stati in interi
+
+	(list) packed_states
+		Lista degli stati codificati indicizzata per identificativo
+
+	(dict) packed_ids
+		Associa ad ogni stato codificato il proprio identificativo
+
+	(numpy.ndarray) state_counts
+		Matrice di dimensione (no_states, no_pegs) contenente, per ogni stato,
+		il numero di occorrenze di ciascun piolo
+
+	(numpy.ndarray) state_lens
+		Lunghezza di ciascuno stato
+
+	(numpy.ndarray) terminal_state_ids
+		Identificativi degli stati terminali (in ordine crescente)
+
+	(numpy.ndarray) terminal_state_counts
+		Matrice delle occorrenze dei pioli dei soli stati terminali
+
+	(numpy.ndarray) transitions
+		Tabella delle transizioni di dimensione (no_states, no_pegs): l'elemento
+		[state_id, action] è l'identificativo dello stato raggiunto eseguendo
+		action a partire da state_id, NO_TRANSITION se state_id è terminale
+
+	(numpy.ndarray) coverage_offsets
+	(numpy.ndarray) coverage_ids
+		Reticolo dei sotto-multiset in formato CSR: la copertura dello stato
+		state_id è coverage_ids[coverage_offsets[state_id]:coverage_offsets[state_id+1]],
+		ordinata per lunghezza decrescente
+
+	Methods
+	-----------------------------------
+	get_no_states()
+		Restituisce il numero degli stati
+
+	get_states()
+		Restituisce tutti i possibili stati
+
+	get_state(state_id)
+		Restituisce lo stato avente l'identificativo passato in ingresso
+
+	get_state_id(state)
+		Restituisce l'identificativo dello stato passato in ingresso
+
+	get_packed_state(state_id)
+		Restituisce lo stato codificato avente l'identificativo passato in ingresso
+
+	get_coverage_ids(state_id)
+		Restituisce gli identificativi degli stati appartenenti alla copertura
+		dello stato passato in ingresso
+
+	get_common_elements(state_id)
+		Restituisce il numero di elementi comuni tra lo stato passato in ingresso
+		e ciascuno stato terminale
+
+	get_next_state_id(state_id, action)
+		Restituisce l'identificativo dello stato raggiunto eseguendo l'azione
+		passata in ingresso
+
+	is_valid_state(state)
+		Verifica se lo stato passato in ingresso appartiene allo spazio
+	"""
+
+	def __init__(self, no_pegs, code_len):
+
+		"""
+		Parameters
+		-----------------------------------
+		(int) no_pegs
+			Indica il numero di pioli disponibili
+
+		(int) code_len
+			Indica la lunghezza del codice segreto
+		"""
+
+		self.no_pegs = no_pegs
+		self.code_len = code_len
+
+		# Le tabelle sono costruite a partire dai vettori delle occorrenze (tuple),
+		# le operazioni sui frozenbag sono limitate alla creazione degli stati
+		sorted_states = [
+			state
+			for k in range(code_len+1)
+			for state in itertools.combinations_with_replacement(range(no_pegs), k)
+		]
+		self.states = [frozenbag(state) for state in sorted_states]
+		self.state_ids = dict((state, state_id) for state_id, state in enumerate(self.states))
+		self.codec = PackedStateCodec(no_pegs, code_len)
+		self.packed_states = [self.codec.pack(state) for state in self.states]
+		self.packed_ids = dict((packed_state, state_id) for state_id, packed_state in enumerate(self.packed_states))
+		self.state_counts = np.zeros((len(self.states), no_pegs), dtype=np.uint8)
+		for state_id, state in enumerate(sorted_states):
+			for peg in state:
+				self.state_counts[state_id, peg] += 1
+		count_ids = dict((tuple(counts), state_id) for state_id, counts in enumerate(self.state_counts.tolist()))
+		self.transitions = np.full((len(self.states), no_pegs), NO_TRANSITION, dtype=np.int32)
+		for state_id, counts in enumerate(self.state_counts.tolist()):
+			if sum(counts) < code_len:
+				for action in range(no_pegs):
+					counts[action] += 1
+					self.transitions[state_id, action] = count_ids[tuple(counts)]
+					counts[action] -= 1
+		self.transitions.setflags(write=False)
+		self.state_lens = self.state_counts.sum(axis=1).astype(np.int32)
+		self.state_counts.setflags(write=False)
+		self.state_lens.setflags(write=False)
+		self.terminal_state_ids = np.flatnonzero(self.state_lens == code_len).astype(np.int32)
+		self.terminal_state_counts = self.state_counts[self.terminal_state_ids]
+		self.terminal_state_ids.setflags(write=False)
+		self.terminal_state_counts.setflags(write=False)
+		self.coverage_offsets, self.coverage_ids = self.init_coverage()
+
+
+	def init_coverage(self):
+
+		"""
+		Costruisce il reticolo dei sotto-multiset in formato CSR. Per ogni stato
+		sono enumerati, a partire dal vettore delle occorrenze dei pioli, i soli
+		sotto-multiset distinti (prodotto cartesiano di range(count+1))
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) coverage_offsets
+			Offset delle coperture (no_states+1 elementi)
+
+		(numpy.ndarray) coverage_ids
+			Identificativi degli stati coperti, ordinati per lunghezza decrescente
+		"""
+
+		count_ids = dict((tuple(counts), state_id) for state_id, counts in enumerate(self.state_counts.tolist()))
+		state_lens = self.state_lens.tolist()
+		coverage_offsets = np.zeros(len(self.states)+1, dtype=np.int64)
+		coverage_ids = []
+		for state_id, counts in enumerate(self.state_counts.tolist()):
+			covered_state_ids = [
+				count_ids[covered_counts] 
+				for covered_counts in itertools.product(*[range(count+1) for count in counts])
+			]
+			covered_state_ids.sort(key=lambda covered_state_id: -state_lens[covered_state_id])
+			coverage_ids.extend(covered_state_ids)
+			coverage_offsets[state_id+1] = len(coverage_ids)
+		coverage_ids = np.array(coverage_ids, dtype=np.int32)
+		coverage_offsets.setflags(write=False)
+		coverage_ids.setflags(write=False)
+		return coverage_offsets, coverage_ids
+
+
+	def __len__(self):
+		return len(self.states)
+
+
+	def __contains__(self, state):
+		return self.is_valid_state(state)
+
+
+	def get_no_states(self):
+
+		"""
+		Restituisce il numero degli stati
+
+		Returns
+		-----------------------------------
+		(int) no_states
+			Numero degli stati
+		"""
+
+		return len(self.states)
+
+
+	def get_states(self):
+
+		"""
+		Restituisce tutti i possibili stati
+
+		Returns
+		-----------------------------------
+		(list) states
+			Lista degli stati ordinata per identificativo
+		"""
+
+		return list(self.states)
+
+
+	def get_state(self, state_id):
+
+		"""
+		Restituisce lo stato avente l'identificativo passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Raises
+		-----------------------------------
+		InvalidStateError
+			L'identificativo passato in ingresso non è valido
+
+		Returns
+		-----------------------------------
+		(frozenbag) state
+			Stato corrispondente all'identificativo
+		"""
+
+		if not 0 <= state_id < len(self.states):
+			raise rlexc.InvalidStateError(state_id)
+		return self.states[state_id]
+
+
+	def get_state_id(self, state):
+
+		"""
+		Restituisce l'identificativo dello stato passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(frozenbag|int) state
+			Stato (o stato codificato) di cui si vuole conoscere l'identificativo
+
+		Raises
+		-----------------------------------
+		InvalidStateError
+			Lo stato passato in ingresso non è valido (è inesistente)
+
+		Returns
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+		"""
+
+		try:
+			if isinstance(state, numbers.Integral):
+				return self.packed_ids[state]
+			return self.state_ids[state]
+		except (KeyError, TypeError):
+			raise rlexc.InvalidStateError(state)
+
+
+	def get_packed_state(self, state_id):
+
+		"""
+		Restituisce lo stato codificato avente l'identificativo passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Returns
+		-----------------------------------
+		(int) packed_state
+			Stato codificato
+		"""
+
+		return self.packed_states[state_id]
+
+
+	def get_coverage_ids(self, state_id):
+
+		"""
+		Restituisce gli identificativi degli stati appartenenti alla copertura
+		dello stato passato in ingresso (slice del reticolo, nessuna copia)
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato di cui si vuole conoscere la copertura
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) coverage_ids
+			Identificativi degli stati coperti ordinati per lunghezza decrescente
+		"""
+
+		return self.coverage_ids[self.coverage_offsets[state_id]:self.coverage_offsets[state_id+1]]
+
+
+	def get_common_elements(self, state_id):
+
+		"""
+		Restituisce il numero di elementi comuni tra lo stato passato in ingresso
+		e ciascuno stato terminale (minimo delle occorrenze piolo per piolo,
+		calcolato in un'unica operazione sulla matrice terminal_state_counts)
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) common_elements
+			Numero di elementi comuni, allineato a terminal_state_ids
+		"""
+
+		return np.minimum(self.terminal_state_counts, self.state_counts[state_id]).sum(axis=1)
+
+
+	def get_next_state_id(self, state_id, action):
+
+		"""
+		Restituisce l'identificativo dello stato raggiunto eseguendo l'azione
+		passata in ingresso
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato di partenza
+
+		(int) action
+			Azione da eseguire
+
+		Returns
+		-----------------------------------
+		(int) next_state_id
+			Identificativo dello stato raggiunto, NO_TRANSITION se lo stato
+			di partenza è terminale
+		"""
+
+		return int(self.transitions[state_id, action])
+
+
+	def is_valid_state(self, state):
+
+		"""
+		Verifica se lo stato passato in ingresso appartiene allo spazio
+
+		Parameters
+		-----------------------------------
+		(frozenbag|int) state
+
+		Returns
+		-----------------------------------
+		(bool) valid
+			Indica se lo stato passato in ingresso è valido
+		"""
+
+		try:
+			if isinstance(state, numbers.Integral):
+				return state in self.packed_ids
+			return state in self.state_ids
+		except TypeError:
+			return False
\ No newline at end of file
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import rl.rl_exceptions as rlexc
+import numpy as np
+from collections_extended import frozenbag
+from rl.gym_mastermind.envs.mastermind_state_space import get_state_space, NO_TRANSITION
+
+
+# classes--------------------------------------------------------------------
+
+class MastermindVecEnv:
+
+	"""
+	Rappresenta N partite indipendenti del gioco Mastermind eseguite in
+	parallelo. Le tabelle degli stati (indice, transizioni, coperture) sono
+	condivise con MastermindEnv, per ogni partita sono memorizzati soltanto
+	lo stato attuale ed il codice segreto
+
+	Attributes
+	-----------------------------------
+	(int) no_envs
+		Indica il numero di partite
+
+	(int) no_pegs
+		Indica il numero di pioli disponibili
+
+	(int) code_len
+		Indica la lunghezza del codice segreto
+
+	(MastermindStateSpace) state_space
+		Indica lo spazio degli stati condiviso
+
+	(numpy.ndarray) secrets
+		Matrice (no_envs, no_pegs) delle occorrenze dei pioli nei codici segreti
+
+	(numpy.ndarray) secret_ids
+		Identificativi degli stati corrispondenti ai codici segreti
+
+	(numpy.ndarray) attempts
+		Matrice (no_envs, no_pegs) delle occorrenze dei pioli negli stati attuali
+
+	(numpy.ndarray) attempt_ids
+		Identificativi degli stati attuali
+
+	(numpy.random.RandomState) np_random
+		Generatore utilizzato per il campionamento delle azioni
+
+	Methods
+	-----------------------------------
+	step(actions, mask=None)
+		Esegue un'azione in ciascuna partita
+
+	reset(mask=None)
+		Resetta le partite indicate al loro stato iniziale
+
+	sample_actions()
+		Campiona un'azione casuale per ciascuna partita
+
+	is_done()
+		Verifica quali partite si trovano in uno stato terminale
+
+	is_guessed()
+		Verifica in quali partite la sequenza è stata indovinata
+	"""
+
+	def __init__(self, no_pegs, secrets, random_seed=None):
+
+		"""
+		Parameters
+		-----------------------------------
+		(int) no_pegs
+			Indica il numero di pioli disponibili
+
+		(list) secrets
+			Lista dei codici segreti (uno per partita, tutti della stessa lunghezza)
+
+		(int) random_seed [opt, default = None]
+			Seme del generatore utilizzato per il campionamento delle azioni
+
+		Raises
+		-----------------------------------
+		InvalidSecretError
+			Nessun codice segreto fornito, codici di lunghezza 0 o differente
+
+		InvalidActionError
+			In un codice è presente un'azione inesistente (piolo inesistente)
+		"""
+
+		secrets = [list(secret) for secret in secrets]
+		if len(secrets) == 0 or len(secrets[0]) == 0:
+			raise rlexc.InvalidSecretError()
+		if any(len(secret) != len(secrets[0]) for secret in secrets):
+			raise rlexc.InvalidSecretError('secrets must have the same length')
+		for secret in secrets:
+			for peg in secret:
+				if not 0 <= peg < no_pegs:
+					raise rlexc.InvalidActionError(peg)
+
+		self.no_envs = len(secrets)
+		self.no_pegs = no_pegs
+		self.code_len = len(secrets[0])
+		self.state_space = get_state_space(no_pegs, self.code_len)
+		self.np_random = np.random.RandomState(random_seed)
+		self.secrets = np.zeros((self.no_envs, no_pegs), dtype=np.uint8)
+		for env, secret in enumerate(secrets):
+			np.add.at(self.secrets[env], secret, 1)
+		self.secret_ids = np.array(
+			[self.state_space.get_state_id(frozenbag(secret)) for secret in secrets],
+			dtype=np.int32
+		)
+		self.init_state_id = self.state_space.get_state_id(frozenbag())
+		self.attempts = np.zeros((self.no_envs, no_pegs), dtype=np.uint8)
+		self.attempt_ids = np.full(self.no_envs, self.init_state_id, dtype=np.int32)
+
+
+	def step(self, actions, mask=None):
+
+		"""
+		Esegue un'azione in ciascuna partita. Le partite che si trovano in
+		uno stato terminale (o escluse da mask) rimangono invariate
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) actions
+			Azioni da eseguire (una per partita)
+
+		(numpy.ndarray) mask [opt, default = None]
+			Indica le partite in cui eseguire l'azione (tutte se None)
+
+		Raises
+		-----------------------------------
+		InvalidActionError
+			Almeno una delle azioni è inesistente
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) attempts
+			Occorrenze dei pioli negli stati raggiunti
+
+		(numpy.ndarray) done
+			Indica quali partite si trovano in uno stato terminale
+		"""
+
+		actions = np.asarray(actions)
+		if actions.shape != (self.no_envs,):
+			raise rlexc.InvalidActionError(actions, 'actions must have shape ' + str((self.no_envs,)))
+		if ((actions < 0) | (actions >= self.no_pegs)).any():
+			raise rlexc.InvalidActionError(actions)
+		next_attempt_ids = self.state_space.transitions[self.attempt_ids, actions]
+		stepped = next_attempt_ids != NO_TRANSITION
+		if mask is not None:
+			stepped &= mask
+		envs = np.flatnonzero(stepped)
+		self.attempt_ids[envs] = next_attempt_ids[envs]
+		self.attempts[envs, actions[envs]] += 1
+		return self.attempts, self.is_done()
+
+
+	def reset(self, mask=None):
+
+		"""
+		Resetta le partite indicate al loro stato iniziale
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) mask [opt, default = None]
+			Indica le partite da resettare (tutte se None)
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) attempts
+			Occorrenze dei pioli negli stati attuali
+		"""
+
+		if mask is None:
+			mask = slice(None)
+		self.attempt_ids[mask] = self.init_state_id
+		self.attempts[mask] = 0
+		return self.attempts
+
+
+	def sample_actions(self):
+
+		"""
+		Campiona un'azione casuale per ciascuna partita
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) actions
+			Azioni campionate
+		"""
+
+		return self.np_random.randint(0, self.no_pegs, size=self.no_envs)
+
+
+	def is_done(self):
+
+		"""
+		Verifica quali partite si trovano in uno stato terminale
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) done
+			Indica quali partite si trovano in uno stato terminale
+		"""
+
+		return self.state_space.state_lens[self.attempt_ids] == self.code_len
+
+
+	def is_guessed(self):
+
+		"""
+		Verifica in quali partite la sequenza è stata indovinata
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) guessed
+			Indica in quali partite la sequenza segreta è stata indovinata
+		"""
+
+		return self.attempt_ids == self.secret_ids
\ No newline at end of file
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections_extended import frozenbag
+
+
+# classes--------------------------------------------------------------------
+
+class PackedStateCodec:
+
+	"""
+	Codifica gli stati (multiset di pioli) in un unico intero: il numero di
+	occorrenze del piolo p occupa il campo di peg_bits bit che inizia al bit
+	p*field_bits. Ogni campo è seguito da un bit di guardia (sempre a 0 negli
+	stati codificati) che consente di confrontare tutti i campi in parallelo.
+	Se no_pegs*field_bits <= 64 gli stati codificati sono rappresentabili
+	come numpy.uint64
+
+	Attributes
+	-----------------------------------
+	(int) no_pegs
+		Indica il numero di pioli disponibili
+
+	(int) code_len
+		Indica la lunghezza massima degli stati
+
+	(int) peg_bits
+		Indica il numero di bit necessari a rappresentare le occorrenze di un piolo
+
+	(int) field_bits
+		Indica l'ampiezza di un campo (peg_bits più il bit di guardia)
+
+	Methods
+	-----------------------------------
+	pack(state)
+		Codifica lo stato passato in ingresso
+
+	unpack(packed_state)
+		Decodifica lo stato passato in ingresso
+
+	get_count(packed_state, peg)
+		Restituisce il numero di occorrenze del piolo nello stato codificato
+
+	add_peg(packed_state, peg)
+		Aggiunge un piolo allo stato codificato
+
+	length(packed_state)
+		Restituisce la lunghezza dello stato codificato
+
+	intersection_size(packed_state_a, packed_state_b)
+		Restituisce il numero di elementi comuni ai due stati codificati
+
+	is_submultiset(packed_state_a, packed_state_b)
+		Verifica se il primo stato codificato è contenuto nel secondo
+	"""
+
+	def __init__(self, no_pegs, code_len):
+
+		"""
+		Parameters
+		-----------------------------------
+		(int) no_pegs
+			Indica il numero di pioli disponibili
+
+		(int) code_len
+			Indica la lunghezza massima degli stati
+		"""
+
+		self.no_pegs = no_pegs
+		self.code_len = code_len
+		self.peg_bits = max(1, code_len.bit_length())
+		self.field_bits = self.peg_bits+1
+		self.peg_mask = (1 << self.peg_bits)-1
+		self.field_mask = (1 << self.field_bits)-1
+		self.guard_mask = 0
+		self.ones = 0
+		for peg in range(no_pegs):
+			self.guard_mask |= 1 << (peg*self.field_bits+self.peg_bits)
+			self.ones |= 1 << (peg*self.field_bits)
+		self.low_mask = self.ones*self.peg_mask
+		self.sum_shift = (no_pegs-1)*self.field_bits
+
+
+	def pack(self, state):
+
+		"""
+		Codifica lo stato passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(iterable) state
+			Stato (frozenbag o sequenza di pioli) da codificare
+
+		Returns
+		-----------------------------------
+		(int) packed_state
+			Stato codificato
+		"""
+
+		packed_state = 0
+		for peg in state:
+			packed_state += 1 << (int(peg)*self.field_bits)
+		return packed_state
+
+
+	def unpack(self, packed_state):
+
+		"""
+		Decodifica lo stato passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(int) packed_state
+			Stato codificato
+
+		Returns
+		-----------------------------------
+		(frozenbag) state
+			Stato decodificato
+		"""
+
+		pegs = []
+		for peg in range(self.no_pegs):
+			pegs.extend([peg]*self.get_count(packed_state, peg))
+		return frozenbag(pegs)
+
+
+	def get_count(self, packed_state, peg):
+
+		"""
+		Restituisce il numero di occorrenze del piolo nello stato codificato
+
+		Parameters
+		-----------------------------------
+		(int) packed_state
+			Stato codificato
+
+		(int) peg
+			Piolo di cui si vuole conoscere il numero di occorrenze
+
+		Returns
+		-----------------------------------
+		(int) count
+			Numero di occorrenze del piolo
+		"""
+
+		return (packed_state >> (peg*self.field_bits)) & self.peg_mask
+
+
+	def add_peg(self, packed_state, peg):
+
+		"""
+		Aggiunge un piolo allo stato codificato
+
+		Parameters
+		-----------------------------------
+		(int) packed_state
+			Stato codificato
+
+		(int) peg
+			Piolo da aggiungere
+
+		Returns
+		-----------------------------------
+		(int) packed_state
+			Stato codificato risultante
+		"""
+
+		return packed_state+(1 << (peg*self.field_bits))
+
+
+	def length(self, packed_state):
+
+		"""
+		Restituisce la lunghezza dello stato codificato (somma dei campi
+		ottenuta con un'unica moltiplicazione)
+
+		Parameters
+		-----------------------------------
+		(int) packed_state
+			Stato codificato
+
+		Returns
+		-----------------------------------
+		(int) length
+			Lunghezza dello stato
+		"""
+
+		return ((packed_state*self.ones) >> self.sum_shift) & self.field_mask
+
+
+	def intersection_size(self, packed_state_a, packed_state_b):
+
+		"""
+		Restituisce il numero di elementi comuni ai due stati codificati
+		(minimo campo per campo calcolato in parallelo sui bit di guardia)
+
+		Parameters
+		-----------------------------------
+		(int) packed_state_a
+			Primo stato codificato
+
+		(int) packed_state_b
+			Secondo stato codificato
+
+		Returns
+		-----------------------------------
+		(int) size
+			Numero di elementi comuni
+		"""
+
+		ge = ((packed_state_b | self.guard_mask)-packed_state_a) & self.guard_mask
+		ge_mask = ge-(ge >> self.peg_bits)
+		minimum = (packed_state_a & ge_mask) | (packed_state_b & ~ge_mask & self.low_mask)
+		return self.length(minimum)
+
+
+	def is_submultiset(self, packed_state_a, packed_state_b):
+
+		"""
+		Verifica se il primo stato codificato è contenuto nel secondo
+
+		Parameters
+		-----------------------------------
+		(int) packed_state_a
+			Primo stato codificato
+
+		(int) packed_state_b
+			Secondo stato codificato
+
+		Returns
+		-----------------------------------
+		(bool) submultiset
+			Indica se ogni piolo compare in packed_state_a al più quante volte
+			compare in packed_state_b
+		"""
+
+		return ((packed_state_b | self.guard_mask)-packed_state_a) & self.guard_mask == self.guard_mask
\ No newline at end of file
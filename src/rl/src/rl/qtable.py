@@ -0,0 +1,818 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import rl.rl_exceptions as rlexc
+import numpy as np
+import contextlib
+import time
+import os
+
+
+# constants------------------------------------------------------------------
+
+MAPPED_MAGIC = 0x454c424154514c52
+
+MAPPED_VERSION = 1
+
+MAPPED_HEADER_FIELDS = [
+	'magic',
+	'version',
+	'no_pegs',
+	'code_len',
+	'no_states',
+	'no_actions',
+	'sequence'
+]
+
+MAPPED_ARRAYS = [
+	'qvalues',
+	'td_errors',
+	'td_errors_delta',
+	'visits',
+	'max_qvalues'
+]
+
+
+# functions------------------------------------------------------------------
+
+def get_mapped_layout(no_states, no_actions):
+
+	"""
+	Restituisce la disposizione degli array nel file di una MappedQTable:
+	intestazione (MAPPED_HEADER_FIELDS, uint64) seguita dagli array
+	MAPPED_ARRAYS, ciascuno allineato a 64 byte
+
+	Parameters
+	-----------------------------------
+	(int) no_states
+		Numero degli stati
+
+	(int) no_actions
+		Numero delle azioni
+
+	Returns
+	-----------------------------------
+	(dict) layout
+		arrays -> lista di (nome, dtype, shape, offset), size -> dimensione del file
+	"""
+
+	specs = [
+		('qvalues', np.float64, (no_states, no_actions)),
+		('td_errors', np.float64, (no_states, no_actions)),
+		('td_errors_delta', np.float64, (no_states, no_actions)),
+		('visits', np.int64, (no_states,)),
+		('max_qvalues', np.float64, (no_states,))
+	]
+	offset = 64
+	arrays = []
+	for key, dtype, shape in specs:
+		arrays.append((key, dtype, shape, offset))
+		offset += -(-int(np.prod(shape))*np.dtype(dtype).itemsize//64)*64
+	return {'arrays': arrays, 'size': offset}
+
+
+# classes--------------------------------------------------------------------
+
+class QTable:
+
+	"""
+	Rappresenta la matrice Q dell'agente in forma structure-of-arrays: le
+	righe sono indicizzate per identificativo di stato (ref. MastermindStateSpace).
+	L'accesso per stato (qtable[state]['qvalues']) è mantenuto per compatibilità
+	e restituisce viste sulle righe degli array.
+	Il massimo valore Q, l'azione corrispondente e l'insieme delle azioni a pari
+	merito sono mantenuti in cache: chi modifica qvalues direttamente deve
+	invocare refresh(rows) sulle righe modificate.
+	Gli array sono indicizzati per riga: rows(state_ids) restituisce le righe
+	da cui leggere, materialize(state_ids) quelle in cui scrivere. Nella matrice
+	densa entrambe coincidono con gli identificativi di stato (ref. SparseQTable)
+
+	Attributes
+	-----------------------------------
+	(MastermindStateSpace) state_space
+		Spazio degli stati su cui è definita la matrice
+
+	(numpy.ndarray) qvalues
+		Valori Q di dimensione (no_rows, no_actions)
+
+	(numpy.ndarray) td_errors
+		Ultimi errori TD di dimensione (no_rows, no_actions)
+
+	(numpy.ndarray) td_errors_delta
+		Variazioni degli errori TD di dimensione (no_rows, no_actions)
+
+	(numpy.ndarray) visits
+		Numero di visite di ciascuna riga
+
+	(numpy.ndarray) max_qvalues
+		Massimo valore Q di ciascuna riga (cache)
+
+	(list) max_actions
+		Azioni aventi valore Q massimo in ciascuna riga (cache, ricalcolata
+		alla prima richiesta successiva ad una modifica della riga)
+
+	Methods
+	-----------------------------------
+	rows(state_ids)
+		Restituisce le righe da cui leggere i valori degli stati indicati
+
+	materialize(state_ids)
+		Restituisce le righe in cui scrivere i valori degli stati indicati
+
+	is_materialized(state_id)
+		Verifica se lo stato indicato possiede una propria riga
+
+	refresh(rows)
+		Aggiorna la cache delle righe indicate
+
+	writing()
+		Delimita un blocco di scritture (ref. MappedQTable)
+
+	get_max_actions(state_id)
+		Restituisce le azioni aventi valore Q massimo nello stato indicato
+
+	get_argmax_action(state_id)
+		Restituisce la prima azione avente valore Q massimo nello stato indicato
+
+	get_no_rows()
+		Restituisce il numero di righe allocate
+
+	get_memory_usage()
+		Restituisce la memoria occupata dagli array, in byte
+
+	keys()
+		Restituisce gli stati ordinati per identificativo
+
+	items()
+		Restituisce le coppie (stato, riga) ordinate per identificativo
+	"""
+
+	def __init__(self, state_space):
+
+		"""
+		Parameters
+		-----------------------------------
+		(MastermindStateSpace) state_space
+			Spazio degli stati su cui è definita la matrice
+		"""
+
+		no_states = state_space.get_no_states()
+		no_actions = state_space.no_pegs
+		self.state_space = state_space
+		self.qvalues = np.full((no_states, no_actions), 0, dtype=float)
+		self.td_errors = np.full((no_states, no_actions), -np.inf, dtype=float)
+		self.td_errors_delta = np.full((no_states, no_actions), -np.inf, dtype=float)
+		self.visits = np.zeros(no_states, dtype=np.int64)
+		self.max_qvalues = np.zeros(no_states, dtype=float)
+		self.max_actions = [tuple(range(no_actions))]*no_states
+		self.max_actions_valid = np.ones(no_states, dtype=bool)
+
+
+	def __len__(self):
+		return self.state_space.get_no_states()
+
+
+	def __iter__(self):
+		return iter(self.state_space.states)
+
+
+	def __contains__(self, state):
+		return self.state_space.is_valid_state(state)
+
+
+	def __getitem__(self, state):
+		return QTableRow(self, self.state_space.get_state_id(state))
+
+
+	def rows(self, state_ids):
+
+		"""
+		Restituisce le righe da cui leggere i valori degli stati indicati
+
+		Parameters
+		-----------------------------------
+		(int|numpy.ndarray) state_ids
+			Identificativi degli stati
+
+		Returns
+		-----------------------------------
+		(int|numpy.ndarray) rows
+			Righe corrispondenti (gli identificativi stessi)
+		"""
+
+		return state_ids
+
+
+	def materialize(self, state_ids):
+
+		"""
+		Restituisce le righe in cui scrivere i valori degli stati indicati
+
+		Parameters
+		-----------------------------------
+		(int|numpy.ndarray) state_ids
+			Identificativi degli stati
+
+		Returns
+		-----------------------------------
+		(int|numpy.ndarray) rows
+			Righe corrispondenti (gli identificativi stessi)
+		"""
+
+		return state_ids
+
+
+	def is_materialized(self, state_id):
+
+		"""
+		Verifica se lo stato indicato possiede una propria riga
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Returns
+		-----------------------------------
+		(bool) materialized
+			Sempre True nella matrice densa
+		"""
+
+		return True
+
+
+	def refresh(self, rows):
+
+		"""
+		Aggiorna la cache delle righe indicate: il massimo è ricalcolato subito,
+		le azioni a pari merito soltanto quando richieste
+
+		Parameters
+		-----------------------------------
+		(int|numpy.ndarray) rows
+			Righe modificate
+		"""
+
+		self.max_qvalues[rows] = self.qvalues[rows].max(axis=-1)
+		self.max_actions_valid[rows] = False
+
+
+	@contextlib.contextmanager
+	def writing(self):
+
+		"""
+		Delimita un blocco di scritture sulla matrice: i lettori di una
+		MappedQTable non osservano stati intermedi del blocco. Nessun effetto
+		nelle altre matrici
+		"""
+
+		yield
+
+
+	def get_max_actions(self, state_id):
+
+		"""
+		Restituisce le azioni aventi valore Q massimo nello stato indicato
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Returns
+		-----------------------------------
+		(tuple) actions
+			Azioni a pari merito, in ordine crescente
+		"""
+
+		row = self.rows(state_id)
+		if not self.max_actions_valid[row]:
+			self.max_actions[row] = tuple(np.flatnonzero(self.qvalues[row] == self.max_qvalues[row]).tolist())
+			self.max_actions_valid[row] = True
+		return self.max_actions[row]
+
+
+	def get_argmax_action(self, state_id):
+
+		"""
+		Restituisce la prima azione avente valore Q massimo nello stato indicato
+		(equivalente a numpy.argmax sulla riga)
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato
+
+		Returns
+		-----------------------------------
+		(int) action
+			Azione avente valore Q massimo
+		"""
+
+		return self.get_max_actions(state_id)[0]
+
+
+	def get_no_rows(self):
+
+		"""
+		Restituisce il numero di righe allocate
+
+		Returns
+		-----------------------------------
+		(int) no_rows
+			Numero di righe
+		"""
+
+		return len(self.visits)
+
+
+	def get_memory_usage(self):
+
+		"""
+		Restituisce la memoria occupata dagli array, in byte
+
+		Returns
+		-----------------------------------
+		(int) nbytes
+			Memoria occupata
+		"""
+
+		return sum(array.nbytes for array in (
+			self.qvalues, self.td_errors, self.td_errors_delta, 
+			self.visits, self.max_qvalues, self.max_actions_valid
+		))
+
+
+	def keys(self):
+
+		"""
+		Restituisce gli stati ordinati per identificativo
+
+		Returns
+		-----------------------------------
+		(list) states
+			Lista degli stati
+		"""
+
+		return self.state_space.get_states()
+
+
+	def items(self):
+
+		"""
+		Restituisce le coppie (stato, riga) ordinate per identificativo
+
+		Returns
+		-----------------------------------
+		(list) items
+			Lista delle coppie (stato, riga)
+		"""
+
+		return [(state, QTableRow(self, state_id)) for state_id, state in enumerate(self.state_space.states)]
+
+
+
+class SparseQTable(QTable):
+
+	"""
+	Matrice Q con righe allocate su richiesta: uno stato riceve una propria
+	riga soltanto quando viene visitato o raggiunto dalla propagazione 
+	(materialize). Gli stati non materializzati condividono la riga 0, che
+	contiene i valori iniziali (Q 0, TD -inf) e non viene mai modificata.
+	Le righe sono allocate in blocchi di dimensione crescente fino a max_rows,
+	oltre il quale materialize solleva QTableFullError.
+	Gli array possono essere riallocati da materialize: non vanno conservati
+	riferimenti ad essi attraverso una materializzazione.
+	Il risparmio di memoria riguarda le sole righe della matrice Q e si riduce
+	rapidamente: la propagazione di una ricompensa raggiunge le coperture di
+	tutti gli stati terminali simili non visitati, per cui con 10 pioli e
+	codice di lunghezza 6 il primo feedback materializza 6005 righe su 8008
+	(circa 1.6 MB contro 2.1 MB della matrice densa). Lo spazio degli stati
+	(MastermindStateSpace: stati, transizioni, coperture) è comunque costruito
+	per intero e occupa più della matrice Q
+
+	Attributes
+	-----------------------------------
+	(numpy.ndarray) row_ids
+		Riga associata a ciascuno stato (DEFAULT_ROW se non materializzato)
+
+	(int) max_rows
+		Numero massimo di righe materializzabili (None se illimitato)
+	"""
+
+	DEFAULT_ROW = 0
+
+	def __init__(self, state_space, max_rows=None, initial_rows=1024):
+
+		"""
+		Parameters
+		-----------------------------------
+		(MastermindStateSpace) state_space
+			Spazio degli stati su cui è definita la matrice
+
+		(int) max_rows [opt, default = None]
+			Numero massimo di righe materializzabili (None se illimitato)
+
+		(int) initial_rows [opt, default = 1024]
+			Numero di righe allocate inizialmente
+
+		Raises
+		-----------------------------------
+		InvalidQTableSizeError
+			max_rows non è positivo
+		"""
+
+		if max_rows is not None and max_rows < 1:
+			raise rlexc.InvalidQTableSizeError(max_rows)
+		self.state_space = state_space
+		self.max_rows = max_rows
+		self.row_ids = np.full(state_space.get_no_states(), SparseQTable.DEFAULT_ROW, dtype=np.int32)
+		self.no_rows = 1
+		capacity = 1+min(initial_rows, state_space.get_no_states(), max_rows or initial_rows)
+		no_actions = state_space.no_pegs
+		self.qvalues = np.full((capacity, no_actions), 0, dtype=float)
+		self.td_errors = np.full((capacity, no_actions), -np.inf, dtype=float)
+		self.td_errors_delta = np.full((capacity, no_actions), -np.inf, dtype=float)
+		self.visits = np.zeros(capacity, dtype=np.int64)
+		self.max_qvalues = np.zeros(capacity, dtype=float)
+		self.max_actions = [tuple(range(no_actions))]*capacity
+		self.max_actions_valid = np.ones(capacity, dtype=bool)
+
+
+	def grow(self, no_rows):
+
+		"""
+		Rialloca gli array in modo che possano contenere almeno no_rows righe
+		(la capacità è almeno raddoppiata, le nuove righe hanno i valori iniziali)
+
+		Parameters
+		-----------------------------------
+		(int) no_rows
+			Numero di righe richieste (riga 0 inclusa)
+
+		Raises
+		-----------------------------------
+		QTableFullError
+			Il numero di righe richieste supera max_rows
+		"""
+
+		if self.max_rows is not None and no_rows-1 > self.max_rows:
+			raise rlexc.QTableFullError(self.max_rows)
+		capacity = len(self.visits)
+		if no_rows <= capacity:
+			return
+		capacity = min(max(no_rows, 2*capacity), self.state_space.get_no_states()+1)
+		if self.max_rows is not None:
+			capacity = min(capacity, self.max_rows+1)
+		def resize(array, fill_value):
+			resized = np.full((capacity,)+array.shape[1:], fill_value, dtype=array.dtype)
+			resized[:len(array)] = array
+			return resized
+		self.qvalues = resize(self.qvalues, 0)
+		self.td_errors = resize(self.td_errors, -np.inf)
+		self.td_errors_delta = resize(self.td_errors_delta, -np.inf)
+		self.visits = resize(self.visits, 0)
+		self.max_qvalues = resize(self.max_qvalues, 0)
+		self.max_actions_valid = resize(self.max_actions_valid, True)
+		self.max_actions.extend([tuple(range(self.state_space.no_pegs))]*(capacity-len(self.max_actions)))
+
+
+	def rows(self, state_ids):
+		return self.row_ids[state_ids]
+
+
+	def materialize(self, state_ids):
+		rows = self.row_ids[state_ids]
+		if np.all(rows != SparseQTable.DEFAULT_ROW):
+			return rows
+		new_state_ids = np.unique(np.atleast_1d(state_ids)[np.atleast_1d(rows) == SparseQTable.DEFAULT_ROW])
+		self.grow(self.no_rows+len(new_state_ids))
+		self.row_ids[new_state_ids] = np.arange(self.no_rows, self.no_rows+len(new_state_ids))
+		self.no_rows += len(new_state_ids)
+		return self.row_ids[state_ids]
+
+
+	def is_materialized(self, state_id):
+		return self.row_ids[state_id] != SparseQTable.DEFAULT_ROW
+
+
+	def get_no_rows(self):
+		return self.no_rows-1
+
+
+	def get_memory_usage(self):
+		return QTable.get_memory_usage(self)+self.row_ids.nbytes
+
+
+
+class MappedQTable(QTable):
+
+	"""
+	Matrice Q densa i cui array risiedono in un file mappato in memoria
+	(un percorso sotto /dev/shm equivale ad un blocco di memoria condivisa),
+	così che altri processi possano leggerla senza copie (ref. MappedQTableReader).
+	L'intestazione del file contiene un contatore di versione (seqlock): è
+	dispari durante una scrittura e viene incrementato all'inizio e alla fine
+	del blocco writing() più esterno (i blocchi annidati non lo modificano),
+	per cui un lettore che osserva lo stesso valore pari prima e dopo la
+	lettura ha letto uno stato consistente.
+	La cache delle azioni a pari merito rimane privata del processo
+
+	Attributes
+	-----------------------------------
+	(str) path
+		Percorso del file
+
+	(numpy.memmap) header
+		Intestazione del file (MAPPED_HEADER_FIELDS)
+
+	(int) writing_depth
+		Numero di blocchi writing() aperti
+	"""
+
+	def __init__(self, state_space, path):
+
+		"""
+		Crea (o sovrascrive) il file e vi alloca la matrice con i valori iniziali.
+		Il file è preparato con un nome temporaneo e rinominato al termine: i
+		processi che leggono un file preesistente continuano a leggere il
+		precedente (per riutilizzare il file in uso ref. reset)
+
+		Parameters
+		-----------------------------------
+		(MastermindStateSpace) state_space
+			Spazio degli stati su cui è definita la matrice
+
+		(str) path
+			Percorso del file
+		"""
+
+		no_states = state_space.get_no_states()
+		no_actions = state_space.no_pegs
+		self.state_space = state_space
+		self.path = path
+		layout = get_mapped_layout(no_states, no_actions)
+		tmp_path = path + '.tmp'
+		with open(tmp_path, 'wb') as mapped_file:
+			mapped_file.truncate(layout['size'])
+		self.header = np.memmap(tmp_path, dtype=np.uint64, mode='r+', shape=(len(MAPPED_HEADER_FIELDS),))
+		self.header[:] = [MAPPED_MAGIC, MAPPED_VERSION, state_space.no_pegs, state_space.code_len, no_states, no_actions, 0]
+		for key, dtype, shape, offset in layout['arrays']:
+			setattr(self, key, np.memmap(tmp_path, dtype=dtype, mode='r+', offset=offset, shape=shape))
+		self.td_errors[:] = -np.inf
+		self.td_errors_delta[:] = -np.inf
+		self.max_actions = [tuple(range(no_actions))]*no_states
+		self.max_actions_valid = np.ones(no_states, dtype=bool)
+		self.writing_depth = 0
+		self.flush()
+		os.rename(tmp_path, path)
+
+
+	@contextlib.contextmanager
+	def writing(self):
+		sequence = MAPPED_HEADER_FIELDS.index('sequence')
+		if self.writing_depth == 0:
+			self.header[sequence] += np.uint64(1)
+		self.writing_depth += 1
+		try:
+			yield
+		finally:
+			self.writing_depth -= 1
+			if self.writing_depth == 0:
+				self.header[sequence] += np.uint64(1)
+
+
+	def reset(self):
+
+		"""
+		Riporta la matrice ai valori iniziali senza ricreare il file, così che i
+		processi che la leggono continuino a seguirla
+		"""
+
+		with self.writing():
+			self.qvalues[:] = 0
+			self.td_errors[:] = -np.inf
+			self.td_errors_delta[:] = -np.inf
+			self.visits[:] = 0
+			self.max_qvalues[:] = 0
+			self.max_actions = [tuple(range(self.state_space.no_pegs))]*len(self.visits)
+			self.max_actions_valid[:] = True
+
+
+	def get_version(self):
+
+		"""
+		Restituisce il contatore di versione (pari se nessuna scrittura è in corso)
+
+		Returns
+		-----------------------------------
+		(int) version
+			Contatore di versione
+		"""
+
+		return int(self.header[MAPPED_HEADER_FIELDS.index('sequence')])
+
+
+	def flush(self):
+
+		"""
+		Scrive su disco le modifiche ancora in memoria
+		"""
+
+		self.header.flush()
+		for key in MAPPED_ARRAYS:
+			getattr(self, key).flush()
+
+
+
+class MappedQTableReader:
+
+	"""
+	Lettore di una MappedQTable scritta da un altro processo. Gli array sono
+	viste in sola lettura sul file: read(func) esegue func sulle viste e ne
+	restituisce il risultato soltanto se nessuna scrittura è avvenuta nel
+	frattempo (altrimenti ripete la lettura)
+
+	Attributes
+	-----------------------------------
+	(str) path
+		Percorso del file
+
+	(int) no_pegs
+	(int) code_len
+		Configurazione della partita
+
+	(numpy.memmap) qvalues
+	(numpy.memmap) td_errors
+	(numpy.memmap) td_errors_delta
+	(numpy.memmap) visits
+	(numpy.memmap) max_qvalues
+		Viste in sola lettura sugli array della matrice
+
+	Methods
+	-----------------------------------
+	get_version()
+		Restituisce il contatore di versione
+
+	read(func, timeout=None)
+		Esegue una lettura consistente
+
+	snapshot(timeout=None)
+		Restituisce una copia consistente degli array
+	"""
+
+	def __init__(self, path):
+
+		"""
+		Parameters
+		-----------------------------------
+		(str) path
+			Percorso del file
+
+		Raises
+		-----------------------------------
+		InvalidMappedQTableError
+			Il file non contiene una MappedQTable
+		"""
+
+		self.path = path
+		try:
+			self.header = np.memmap(path, dtype=np.uint64, mode='r', shape=(len(MAPPED_HEADER_FIELDS),))
+		except (IOError, OSError, ValueError):
+			raise rlexc.InvalidMappedQTableError(path)
+		fields = dict(zip(MAPPED_HEADER_FIELDS, self.header.tolist()))
+		if fields['magic'] != MAPPED_MAGIC or fields['version'] != MAPPED_VERSION:
+			raise rlexc.InvalidMappedQTableError(path)
+		self.no_pegs = int(fields['no_pegs'])
+		self.code_len = int(fields['code_len'])
+		for key, dtype, shape, offset in get_mapped_layout(int(fields['no_states']), int(fields['no_actions']))['arrays']:
+			setattr(self, key, np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape))
+
+
+	def get_version(self):
+
+		"""
+		Restituisce il contatore di versione (pari se nessuna scrittura è in corso)
+
+		Returns
+		-----------------------------------
+		(int) version
+			Contatore di versione
+		"""
+
+		return int(self.header[MAPPED_HEADER_FIELDS.index('sequence')])
+
+
+	def read(self, func, timeout=None):
+
+		"""
+		Esegue una lettura consistente: func(reader) è invocata sulle viste
+		degli array (nessuna copia) e ripetuta finché il contatore di versione
+		rimane invariato e pari durante l'esecuzione. func non deve conservare
+		riferimenti alle viste oltre la propria esecuzione
+
+		Parameters
+		-----------------------------------
+		(callable) func
+			Funzione che riceve il lettore e restituisce il risultato
+
+		(float) timeout [opt, default = None]
+			Tempo massimo di attesa in secondi (illimitato se None)
+
+		Raises
+		-----------------------------------
+		MappedQTableTimeoutError
+			Non è stato possibile ottenere una lettura consistente entro timeout
+
+		Returns
+		-----------------------------------
+		(object) result
+			Risultato di func
+
+		(int) version
+			Versione a cui si riferisce il risultato
+		"""
+
+		start_time = time.time()
+		while True:
+			version = self.get_version()
+			if version%2 == 0:
+				result = func(self)
+				if self.get_version() == version:
+					return result, version
+			if timeout is not None and time.time()-start_time > timeout:
+				raise rlexc.MappedQTableTimeoutError(self.path)
+			time.sleep(0)
+
+
+	def snapshot(self, timeout=None):
+
+		"""
+		Restituisce una copia consistente degli array della matrice
+
+		Parameters
+		-----------------------------------
+		(float) timeout [opt, default = None]
+			Tempo massimo di attesa in secondi (illimitato se None)
+
+		Raises
+		-----------------------------------
+		MappedQTableTimeoutError
+			Non è stato possibile ottenere una lettura consistente entro timeout
+
+		Returns
+		-----------------------------------
+		(dict) arrays
+			Copie di qvalues, td_errors, td_errors_delta, visits e max_qvalues
+
+		(int) version
+			Versione a cui si riferisce la copia
+		"""
+
+		return self.read(
+			lambda reader: dict((key, np.array(getattr(reader, key))) for key in MAPPED_ARRAYS),
+			timeout
+		)
+
+
+
+class QTableRow:
+
+	"""
+	Vista su una riga di QTable con la stessa interfaccia del dizionario
+	utilizzato in precedenza ('qvalues', 'td_errors', 'td_errors_delta', 'visits').
+	Gli array restituiti sono viste, le modifiche sono riportate sulla matrice
+	(copie per gli stati non materializzati di SparseQTable, che vanno
+	modificati tramite assegnamento)
+	"""
+
+	KEYS = ('qvalues', 'td_errors', 'td_errors_delta', 'visits')
+
+	def __init__(self, qtable, state_id):
+		self.qtable = qtable
+		self.state_id = state_id
+
+
+	def __getitem__(self, key):
+		row = self.qtable.rows(self.state_id)
+		if key == 'visits':
+			return int(self.qtable.visits[row])
+		if key not in QTableRow.KEYS:
+			raise KeyError(key)
+		if not self.qtable.is_materialized(self.state_id):
+			return getattr(self.qtable, key)[row].copy()
+		return getattr(self.qtable, key)[row]
+
+
+	def __setitem__(self, key, value):
+		if key not in QTableRow.KEYS:
+			raise KeyError(key)
+		with self.qtable.writing():
+			row = self.qtable.materialize(self.state_id)
+			getattr(self.qtable, key)[row] = value
+			if key == 'qvalues':
+				self.qtable.refresh(row)
+
+
+	def keys(self):
+		return list(QTableRow.KEYS)
\ No newline at end of file
@@ -101,3 +101,72 @@ class UnsupportedOperationError(Exception):
     def __init__(self, message='unsupported operation'):
         self.message = message
         super(Exception, self).__init__(self.message)
+
+
+
+class InvalidQTableSizeError(ValueError):
+
+	def __init__(self, max_rows, message='max_rows must be greater than 0'):
+		self.max_rows = max_rows
+		self.message = message
+		super(ValueError, self).__init__(self.message)
+
+	def __str__(self):
+		return '\'{max_rows}\' -> {message}'.format(max_rows=self.max_rows, message=self.message)
+
+
+
+class QTableFullError(Exception):
+
+	def __init__(self, max_rows, message='the Q matrix cannot hold more rows'):
+		self.max_rows = max_rows
+		self.message = message
+		super(Exception, self).__init__(self.message)
+
+	def __str__(self):
+		return '\'{max_rows}\' -> {message}'.format(max_rows=self.max_rows, message=self.message)
+
+
+class InvalidSweepSpecError(ValueError):
+
+	def __init__(self, key, message='invalid sweep specification'):
+		self.key = key
+		self.message = message
+		super(ValueError, self).__init__(self.message)
+
+	def __str__(self):
+		return '\'{key}\' -> {message}'.format(key=self.key, message=self.message)
+
+
+class InvalidCheckpointError(ValueError):
+
+	def __init__(self, path, message='invalid checkpoint'):
+		self.path = path
+		self.message = message
+		super(ValueError, self).__init__(self.message)
+
+	def __str__(self):
+		return '\'{path}\' -> {message}'.format(path=self.path, message=self.message)
+
+
+class InvalidMappedQTableError(ValueError):
+
+	def __init__(self, path, message='file does not contain a mapped Q matrix'):
+		self.path = path
+		self.message = message
+		super(ValueError, self).__init__(self.message)
+
+	def __str__(self):
+		return '\'{path}\' -> {message}'.format(path=self.path, message=self.message)
+
+
+
+class MappedQTableTimeoutError(Exception):
+
+	def __init__(self, path, message='no consistent snapshot within the timeout'):
+		self.path = path
+		self.message = message
+		super(Exception, self).__init__(self.message)
+
+	def __str__(self):
+		return '\'{path}\' -> {message}'.format(path=self.path, message=self.message)
\ No newline at end of file
@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import multiprocessing
+import argparse
+import random
+import time
+from collections_extended import frozenbag
+from rl.gym_mastermind.envs import MastermindEnv, MastermindVecEnv
+from rl.agent import Agent
+from rl.batch_agent import BatchAgent
+
+
+# constants------------------------------------------------------------------
+
+DEFAULT_MIN_EVALUATION = -1
+
+DEFAULT_MAX_EVALUATION = 3
+
+DEFAULT_MAX_ATTEMPTS = 1000
+
+
+# classes--------------------------------------------------------------------
+
+class OverlapOracle:
+
+	"""
+	Simula la valutazione dell'utente: il tentativo è valutato in proporzione
+	al numero di pioli in comune con il codice segreto, scalato linearmente
+	in [min_evaluation, max_evaluation] ed arrotondato all'intero (come i
+	valori del cursore dell'applicazione)
+
+	Attributes
+	-----------------------------------
+	(int) min_evaluation
+		Valutazione di un tentativo privo di pioli in comune con il codice
+
+	(int) max_evaluation
+		Valutazione di un tentativo uguale al codice
+	"""
+
+	def __init__(self, min_evaluation=DEFAULT_MIN_EVALUATION, max_evaluation=DEFAULT_MAX_EVALUATION):
+
+		"""
+		Parameters
+		-----------------------------------
+		(int) min_evaluation [opt, default = DEFAULT_MIN_EVALUATION]
+			Valutazione di un tentativo privo di pioli in comune con il codice
+
+		(int) max_evaluation [opt, default = DEFAULT_MAX_EVALUATION]
+			Valutazione di un tentativo uguale al codice
+		"""
+
+		self.min_evaluation = min_evaluation
+		self.max_evaluation = max_evaluation
+
+
+	def __call__(self, secret, attempt):
+
+		"""
+		Valuta il tentativo passato in ingresso
+
+		Parameters
+		-----------------------------------
+		(list) secret
+			Codice segreto
+
+		(frozenbag) attempt
+			Tentativo (stato terminale) da valutare
+
+		Returns
+		-----------------------------------
+		(int) evaluation
+			Valutazione del tentativo
+		"""
+
+		common_elements = len(frozenbag(secret) & frozenbag(attempt))
+		evaluation = self.min_evaluation+(self.max_evaluation-self.min_evaluation)*float(common_elements)/len(secret)
+		return int(round(evaluation))
+
+
+# functions------------------------------------------------------------------
+
+def run_session(no_pegs, secret, agent_params=None, oracle=None, max_evaluation=DEFAULT_MAX_EVALUATION, max_attempts=DEFAULT_MAX_ATTEMPTS, random_seed=None):
+
+	"""
+	Esegue una sessione completa senza interfaccia grafica, replicando il
+	ciclo dell'applicazione: al termine di ogni tentativo la matrice Q è
+	aggiornata con la valutazione dell'oracolo (max_evaluation se il codice
+	è stato indovinato, nel qual caso la sessione termina)
+
+	Parameters
+	-----------------------------------
+	(int) no_pegs
+		Indica il numero di pioli disponibili
+
+	(list) secret
+		Indica la sequenza che l'agente deve indovinare
+
+	(dict) agent_params [opt, default = None]
+		Parametri passati al costruttore di Agent
+
+	(callable) oracle [opt, default = None]
+		Funzione (secret, attempt) -> evaluation che simula l'utente
+		(OverlapOracle() se None)
+
+	(int) max_evaluation [opt, default = DEFAULT_MAX_EVALUATION]
+		Valutazione assegnata al tentativo corretto
+
+	(int) max_attempts [opt, default = DEFAULT_MAX_ATTEMPTS]
+		Numero massimo di tentativi prima di interrompere la sessione
+
+	(int) random_seed [opt, default = None]
+		Seme dei generatori casuali (ambiente, agente)
+
+	Returns
+	-----------------------------------
+	(dict) result
+		Esito della sessione (secret, guessed, attempts, steps, optimal,
+		epsilon, time in secondi)
+	"""
+
+	if oracle is None:
+		oracle = OverlapOracle(max_evaluation=max_evaluation)
+	random.seed(random_seed)
+	np.random.seed(random_seed)
+	start_time = time.time()
+	env = MastermindEnv(no_pegs, list(secret), random_seed)
+	agent = Agent(env, **(agent_params or {}))
+	attempts = 0
+	steps = 0
+	guessed = False
+	while attempts < max_attempts:
+		done = agent.take_action(agent.get_action())
+		steps += 1
+		if done:
+			attempts += 1
+			if env.is_guessed():
+				agent.update_qmatrix(max_evaluation)
+				guessed = True
+				break
+			agent.update_qmatrix(oracle(secret, agent.curr_state))
+			agent.curr_state = env.reset()
+	return {
+		'secret': sorted(list(secret)),
+		'guessed': guessed,
+		'attempts': attempts,
+		'steps': steps,
+		'optimal': sorted(list(agent.get_optimal())),
+		'epsilon': agent.epsilon,
+		'time': time.time()-start_time
+	}
+
+
+def run_batch_session(no_pegs, secrets, agent_params=None, oracle=None, max_evaluation=DEFAULT_MAX_EVALUATION, max_attempts=DEFAULT_MAX_ATTEMPTS, random_seed=None):
+
+	"""
+	Esegue una sessione per ciascun codice segreto addestrando gli agenti in
+	parallelo con BatchAgent (stesso ciclo di run_session). Gli agenti che
+	indovinano il codice o esauriscono i tentativi vengono esclusi dai passi
+	successivi
+
+	Parameters
+	-----------------------------------
+	(int) no_pegs
+		Indica il numero di pioli disponibili
+
+	(list) secrets
+		Lista dei codici segreti (uno per agente, tutti della stessa lunghezza)
+
+	(dict) agent_params [opt, default = None]
+		Parametri passati al costruttore di BatchAgent
+
+	(callable) oracle [opt, default = None]
+		Funzione (secret, attempt) -> evaluation che simula l'utente
+		(OverlapOracle() se None)
+
+	(int) max_evaluation [opt, default = DEFAULT_MAX_EVALUATION]
+		Valutazione assegnata al tentativo corretto
+
+	(int) max_attempts [opt, default = DEFAULT_MAX_ATTEMPTS]
+		Numero massimo di tentativi di ciascun agente
+
+	(int) random_seed [opt, default = None]
+		Seme dei generatori casuali (partite, agenti)
+
+	Returns
+	-----------------------------------
+	(list) results
+		Esito di ciascuna sessione (ref. run_session), time è il tempo
+		complessivo diviso per il numero di agenti
+	"""
+
+	if oracle is None:
+		oracle = OverlapOracle(max_evaluation=max_evaluation)
+	start_time = time.time()
+	env = MastermindVecEnv(no_pegs, secrets, random_seed)
+	agent = BatchAgent(env, random_seed=random_seed, **(agent_params or {}))
+	attempts = np.zeros(agent.no_agents, dtype=int)
+	steps = np.zeros(agent.no_agents, dtype=int)
+	guessed = np.zeros(agent.no_agents, dtype=bool)
+	active = np.ones(agent.no_agents, dtype=bool)
+	while active.any():
+		done = agent.take_actions(agent.get_actions(), active)
+		steps[active] += 1
+		terminal = done & active
+		if not terminal.any():
+			continue
+		attempts[terminal] += 1
+		hit = terminal & env.is_guessed()
+		rewards = [0]*agent.no_agents
+		for agent_id in np.flatnonzero(terminal).tolist():
+			if hit[agent_id]:
+				rewards[agent_id] = max_evaluation
+			else:
+				rewards[agent_id] = oracle(secrets[agent_id], env.state_space.states[env.attempt_ids[agent_id]])
+		agent.update_qmatrix(rewards, terminal)
+		guessed |= hit
+		active &= ~hit & (attempts < max_attempts)
+		agent.reset(terminal & ~hit)
+	elapsed_time = time.time()-start_time
+	optimal = agent.get_optimal()
+	return [
+		{
+			'secret': sorted(list(secrets[agent_id])),
+			'guessed': bool(guessed[agent_id]),
+			'attempts': int(attempts[agent_id]),
+			'steps': int(steps[agent_id]),
+			'optimal': sorted(list(optimal[agent_id])),
+			'epsilon': float(agent.epsilon[agent_id]),
+			'time': elapsed_time/agent.no_agents
+		}
+		for agent_id in range(agent.no_agents)
+	]
+
+
+def _run_session(session):
+	return run_session(**session)
+
+
+def run_sessions(sessions, processes=None):
+
+	"""
+	Esegue le sessioni passate in ingresso distribuendole su un pool di
+	processi. I risultati sono restituiti nello stesso ordine delle sessioni,
+	man mano che sono disponibili
+
+	Parameters
+	-----------------------------------
+	(list) sessions
+		Lista di dizionari contenenti i parametri di run_session
+
+	(int) processes [opt, default = None]
+		Numero di processi (numero di core se None, 1 per eseguire le
+		sessioni nel processo corrente)
+
+	Returns
+	-----------------------------------
+	(generator) results
+		Esiti delle sessioni (ref. run_session)
+	"""
+
+	if processes == 1:
+		for session in sessions:
+			yield run_session(**session)
+		return
+	pool = multiprocessing.Pool(processes)
+	try:
+		for result in pool.imap(_run_session, sessions):
+			yield result
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+
+
+def make_sessions(no_pegs, code_len, no_sessions, random_seed=None, **kwargs):
+
+	"""
+	Genera no_sessions sessioni con codici segreti casuali ed un seme
+	distinto per ciascuna sessione
+
+	Parameters
+	-----------------------------------
+	(int) no_pegs
+		Indica il numero di pioli disponibili
+
+	(int) code_len
+		Indica la lunghezza del codice segreto
+
+	(int) no_sessions
+		Numero di sessioni
+
+	(int) random_seed [opt, default = None]
+		Seme utilizzato per generare codici e semi delle sessioni
+
+	(dict) kwargs
+		Ulteriori parametri di run_session, comuni a tutte le sessioni
+
+	Returns
+	-----------------------------------
+	(list) sessions
+		Lista di dizionari contenenti i parametri di run_session
+	"""
+
+	rng = np.random.RandomState(random_seed)
+	sessions = []
+	for _ in range(no_sessions):
+		session = dict(kwargs)
+		session['no_pegs'] = no_pegs
+		session['secret'] = rng.randint(0, no_pegs, size=code_len).tolist()
+		session['random_seed'] = int(rng.randint(np.iinfo(np.int32).max))
+		sessions.append(session)
+	return sessions
+
+
+def summarize(results, wall_time=None):
+
+	"""
+	Riassume gli esiti di un insieme di sessioni
+
+	Parameters
+	-----------------------------------
+	(list) results
+		Esiti delle sessioni (ref. run_session)
+
+	(float) wall_time [opt, default = None]
+		Tempo complessivo di esecuzione in secondi
+
+	Returns
+	-----------------------------------
+	(dict) summary
+		Numero di sessioni, percentuale di successo, media e mediana dei
+		tentativi, tempo medio per sessione e sessioni al secondo
+	"""
+
+	attempts = np.array([result['attempts'] for result in results], dtype=float)
+	times = np.array([result['time'] for result in results], dtype=float)
+	summary = {
+		'sessions': len(results),
+		'guessed': float(np.mean([result['guessed'] for result in results])) if results else 0.0,
+		'mean_attempts': float(attempts.mean()) if results else 0.0,
+		'median_attempts': float(np.median(attempts)) if results else 0.0,
+		'mean_time': float(times.mean()) if results else 0.0
+	}
+	if wall_time is not None:
+		summary['wall_time'] = wall_time
+		summary['sessions_per_sec'] = len(results)/wall_time if wall_time > 0 else 0.0
+	return summary
+
+
+def main(argv=None):
+
+	"""
+	Esegue da riga di comando un insieme di sessioni con codici casuali e ne
+	stampa gli esiti ed il riepilogo
+	"""
+
+	parser = argparse.ArgumentParser(description='Headless Mastermind RL sessions with simulated feedback')
+	parser.add_argument('--no-pegs', type=int, default=4)
+	parser.add_argument('--code-len', type=int, default=3)
+	parser.add_argument('--sessions', type=int, default=10)
+	parser.add_argument('--processes', type=int, default=None)
+	parser.add_argument('--seed', type=int, default=None)
+	parser.add_argument('--min-evaluation', type=int, default=DEFAULT_MIN_EVALUATION)
+	parser.add_argument('--max-evaluation', type=int, default=DEFAULT_MAX_EVALUATION)
+	parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS)
+	parser.add_argument('--sparse', action='store_true', help='use a sparse Q matrix (not supported with --batch)')
+	parser.add_argument('--batch', action='store_true', help='train all sessions in lockstep with BatchAgent')
+	args = parser.parse_args(argv)
+	if args.batch and args.sparse:
+		parser.error('--sparse is not supported with --batch (BatchAgent uses dense Q tensors)')
+
+	sessions = make_sessions(
+		args.no_pegs,
+		args.code_len,
+		args.sessions,
+		random_seed=args.seed,
+		agent_params={'sparse_qmatrix': args.sparse},
+		oracle=OverlapOracle(args.min_evaluation, args.max_evaluation),
+		max_evaluation=args.max_evaluation,
+		max_attempts=args.max_attempts
+	)
+	start_time = time.time()
+	results = []
+	if args.batch:
+		batch_results = run_batch_session(
+			args.no_pegs,
+			[session['secret'] for session in sessions],
+			oracle=OverlapOracle(args.min_evaluation, args.max_evaluation),
+			max_evaluation=args.max_evaluation,
+			max_attempts=args.max_attempts,
+			random_seed=args.seed
+		)
+	else:
+		batch_results = run_sessions(sessions, args.processes)
+	for result in batch_results:
+		results.append(result)
+		print('{secret} -> attempts: {attempts}, guessed: {guessed}, time: {time:.3f}s'.format(**result))
+	summary = summarize(results, time.time()-start_time)
+	print(
+		'sessions: {sessions}, guessed: {guessed:.2%}, attempts: {mean_attempts:.2f} '
+		'(median {median_attempts:.1f}), time: {mean_time:.3f}s/session, '
+		'wall: {wall_time:.3f}s ({sessions_per_sec:.2f} sessions/s)'.format(**summary)
+	)
+
+
+if __name__ == '__main__':
+	main()
\ No newline at end of file
@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import rl.rl_exceptions as rlexc
+import numpy as np
+import multiprocessing
+import itertools
+import argparse
+import json
+import os
+import time
+from rl.runner import run_session, OverlapOracle, DEFAULT_MIN_EVALUATION, DEFAULT_MAX_EVALUATION, DEFAULT_MAX_ATTEMPTS
+
+
+# constants------------------------------------------------------------------
+
+SEARCH_MODES = [
+	'grid',
+	'random'
+]
+
+AGENT_PARAMS = [
+	'alpha',
+	'gamma',
+	'epsilon',
+	'beta',
+	'exploration_mode',
+	'epsilon_decay',
+	'epsilon_low'
+]
+
+
+# functions------------------------------------------------------------------
+
+def load_spec(path):
+
+	"""
+	Carica una specifica di ricerca da file JSON. La specifica contiene:
+		search        -> 'grid' (prodotto cartesiano) o 'random'
+		params        -> parametri di Agent da esplorare: una lista di valori
+		                 oppure (solo in 'random') {"low": a, "high": b}
+		seeds         -> numero di sessioni per punto (o lista dei semi)
+		samples       -> numero di punti estratti ('random')
+		random_seed   -> seme per l'estrazione dei punti ('random')
+		no_pegs, code_len, min_evaluation, max_evaluation, max_attempts
+
+	Parameters
+	-----------------------------------
+	(str) path
+		Percorso del file
+
+	Returns
+	-----------------------------------
+	(dict) spec
+		Specifica di ricerca
+	"""
+
+	with open(path) as spec_file:
+		return json.load(spec_file)
+
+
+def get_points(spec):
+
+	"""
+	Restituisce i punti (combinazioni di parametri di Agent) da valutare
+
+	Parameters
+	-----------------------------------
+	(dict) spec
+		Specifica di ricerca (ref. load_spec)
+
+	Raises
+	-----------------------------------
+	InvalidSweepSpecError
+		Modalità di ricerca o parametri non supportati
+
+	Returns
+	-----------------------------------
+	(list) points
+		Lista di dizionari parametro -> valore
+	"""
+
+	search = spec.get('search', SEARCH_MODES[0])
+	if search not in SEARCH_MODES:
+		raise rlexc.InvalidSweepSpecError(search, 'search must be one of ' + str(SEARCH_MODES))
+	params = spec.get('params', {})
+	for param in params:
+		if param not in AGENT_PARAMS:
+			raise rlexc.InvalidSweepSpecError(param, 'param must be one of ' + str(AGENT_PARAMS))
+	names = sorted(params.keys())
+
+	if search == SEARCH_MODES[0]:
+		for name in names:
+			if not isinstance(params[name], list):
+				raise rlexc.InvalidSweepSpecError(name, 'grid values must be a list')
+		return [dict(zip(names, values)) for values in itertools.product(*[params[name] for name in names])]
+
+	rng = np.random.RandomState(spec.get('random_seed', 0))
+	points = []
+	for _ in range(spec.get('samples', 1)):
+		point = {}
+		for name in names:
+			values = params[name]
+			if isinstance(values, list):
+				point[name] = values[rng.randint(len(values))]
+			elif isinstance(values, dict) and 'low' in values and 'high' in values:
+				point[name] = float(rng.uniform(values['low'], values['high']))
+			else:
+				raise rlexc.InvalidSweepSpecError(name, 'random values must be a list or {"low": a, "high": b}')
+		points.append(point)
+	return points
+
+
+def get_seeds(spec):
+
+	"""
+	Restituisce i semi delle sessioni da eseguire per ciascun punto (gli
+	stessi per tutti i punti, così che i punti siano confrontati sugli
+	stessi codici segreti)
+
+	Parameters
+	-----------------------------------
+	(dict) spec
+		Specifica di ricerca (ref. load_spec)
+
+	Returns
+	-----------------------------------
+	(list) seeds
+		Lista dei semi
+	"""
+
+	seeds = spec.get('seeds', 10)
+	if isinstance(seeds, list):
+		return seeds
+	return list(range(seeds))
+
+
+def get_environment(spec):
+
+	"""
+	Restituisce la configurazione della partita e della valutazione indicata
+	nella specifica (con i valori predefiniti per i campi assenti)
+
+	Parameters
+	-----------------------------------
+	(dict) spec
+		Specifica di ricerca (ref. load_spec)
+
+	Returns
+	-----------------------------------
+	(dict) environment
+		no_pegs, code_len, min_evaluation, max_evaluation, max_attempts
+	"""
+
+	return {
+		'no_pegs': spec.get('no_pegs', 4),
+		'code_len': spec.get('code_len', 3),
+		'min_evaluation': spec.get('min_evaluation', DEFAULT_MIN_EVALUATION),
+		'max_evaluation': spec.get('max_evaluation', DEFAULT_MAX_EVALUATION),
+		'max_attempts': spec.get('max_attempts', DEFAULT_MAX_ATTEMPTS)
+	}
+
+
+def get_point_key(point):
+
+	"""
+	Restituisce la chiave (stringa canonica) del punto passato in ingresso
+
+	Parameters
+	-----------------------------------
+	(dict) point
+		Punto della ricerca
+
+	Returns
+	-----------------------------------
+	(str) key
+		Chiave del punto
+	"""
+
+	return json.dumps(point, sort_keys=True, separators=(',', ':'))
+
+
+def load_results(results_path):
+
+	"""
+	Carica i risultati già presenti nel file. Le righe incomplete (ad esempio
+	scritte solo in parte a causa di un'interruzione) sono ignorate
+
+	Parameters
+	-----------------------------------
+	(str) results_path
+		Percorso del file dei risultati (JSON lines)
+
+	Returns
+	-----------------------------------
+	(list) results
+		Lista dei risultati
+	"""
+
+	results = []
+	if not os.path.isfile(results_path):
+		return results
+	with open(results_path) as results_file:
+		for line in results_file:
+			try:
+				results.append(json.loads(line))
+			except ValueError:
+				continue
+	return results
+
+
+def filter_results(results, spec):
+
+	"""
+	Restituisce i risultati che appartengono alla specifica passata in ingresso:
+	stessa configurazione (ref. get_environment) e punto tra quelli della
+	specifica. I risultati privi di configurazione sono esclusi
+
+	Parameters
+	-----------------------------------
+	(list) results
+		Risultati della ricerca
+
+	(dict) spec
+		Specifica di ricerca (ref. load_spec)
+
+	Raises
+	-----------------------------------
+	InvalidSweepSpecError
+		Modalità di ricerca o parametri non supportati
+
+	Returns
+	-----------------------------------
+	(list) results
+		Risultati della specifica
+	"""
+
+	environment = get_environment(spec)
+	point_keys = set(get_point_key(point) for point in get_points(spec))
+	return [
+		result for result in results
+		if result.get('environment') == environment and get_point_key(result['point']) in point_keys
+	]
+
+
+def _run_task(task):
+	point, seed, spec = task
+	environment = get_environment(spec)
+	secret = np.random.RandomState(seed).randint(0, environment['no_pegs'], size=environment['code_len']).tolist()
+	result = run_session(
+		environment['no_pegs'],
+		secret,
+		agent_params=point,
+		oracle=OverlapOracle(environment['min_evaluation'], environment['max_evaluation']),
+		max_evaluation=environment['max_evaluation'],
+		max_attempts=environment['max_attempts'],
+		random_seed=seed
+	)
+	return {
+		'environment': environment,
+		'point': point,
+		'seed': seed,
+		'secret': result['secret'],
+		'guessed': result['guessed'],
+		'attempts': result['attempts'],
+		'steps': result['steps'],
+		'time': round(result['time'], 6)
+	}
+
+
+def run_sweep(spec, results_path, processes=None):
+
+	"""
+	Esegue la ricerca distribuendo le sessioni su un pool di processi. Ogni
+	risultato è aggiunto al file non appena disponibile, insieme alla
+	configurazione della partita (ref. get_environment): rieseguendo la ricerca
+	sullo stesso file le coppie (punto, seme) già presenti con la stessa
+	configurazione sono saltate. I risultati di specifiche diverse restano nel
+	file ma non sono restituiti
+
+	Parameters
+	-----------------------------------
+	(dict) spec
+		Specifica di ricerca (ref. load_spec)
+
+	(str) results_path
+		Percorso del file dei risultati (JSON lines)
+
+	(int) processes [opt, default = None]
+		Numero di processi (numero di core se None)
+
+	Raises
+	-----------------------------------
+	InvalidSweepSpecError
+		Modalità di ricerca o parametri non supportati
+
+	Returns
+	-----------------------------------
+	(list) results
+		Risultati della specifica (precedenti e nuovi)
+	"""
+
+	results = filter_results(load_results(results_path), spec)
+	done = set((get_point_key(result['point']), result['seed']) for result in results)
+	tasks = [
+		(point, seed, spec)
+		for point in get_points(spec)
+		for seed in get_seeds(spec)
+		if (get_point_key(point), seed) not in done
+	]
+	if len(tasks) == 0:
+		return results
+
+	# Completa l'ultima riga se il file è stato troncato
+	needs_newline = False
+	if os.path.isfile(results_path) and os.path.getsize(results_path) > 0:
+		with open(results_path, 'rb') as results_file:
+			results_file.seek(-1, os.SEEK_END)
+			needs_newline = results_file.read(1) != b'\n'
+
+	pool = multiprocessing.Pool(processes)
+	try:
+		with open(results_path, 'a') as results_file:
+			if needs_newline:
+				results_file.write('\n')
+			for result in pool.imap_unordered(_run_task, tasks):
+				results_file.write(json.dumps(result, sort_keys=True, separators=(',', ':')) + '\n')
+				results_file.flush()
+				results.append(result)
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+	return results
+
+
+def get_point_stats(results, spec=None):
+
+	"""
+	Calcola le statistiche di convergenza di ciascun punto
+
+	Parameters
+	-----------------------------------
+	(list) results
+		Risultati della ricerca
+
+	(dict) spec [opt, default = None]
+		Specifica di ricerca: se indicata sono considerati soltanto i risultati
+		che le appartengono (ref. filter_results)
+
+	Returns
+	-----------------------------------
+	(list) stats
+		Statistiche per punto (sessioni, percentuale di successo, media,
+		deviazione standard, intervallo di confidenza al 95%, mediana e 90°
+		percentile dei tentativi, tempo medio), ordinate per media dei tentativi
+	"""
+
+	if spec is not None:
+		results = filter_results(results, spec)
+	grouped = {}
+	for result in results:
+		grouped.setdefault(get_point_key(result['point']), []).append(result)
+	stats = []
+	for key, point_results in grouped.items():
+		attempts = np.array([result['attempts'] for result in point_results], dtype=float)
+		std = float(attempts.std(ddof=1)) if len(attempts) > 1 else 0.0
+		stats.append({
+			'point': point_results[0]['point'],
+			'sessions': len(point_results),
+			'guessed': float(np.mean([result['guessed'] for result in point_results])),
+			'mean_attempts': float(attempts.mean()),
+			'std_attempts': std,
+			'ci95_attempts': 1.96*std/np.sqrt(len(attempts)),
+			'median_attempts': float(np.median(attempts)),
+			'p90_attempts': float(np.percentile(attempts, 90)),
+			'mean_time': float(np.mean([result['time'] for result in point_results]))
+		})
+	stats.sort(key=lambda point_stats: (-point_stats['guessed'], point_stats['mean_attempts']))
+	return stats
+
+
+def main(argv=None):
+
+	"""
+	Esegue da riga di comando la ricerca descritta nel file di specifica e
+	stampa le statistiche di ciascun punto
+	"""
+
+	parser = argparse.ArgumentParser(description='Parallel hyperparameter sweep over Agent parameters')
+	parser.add_argument('spec', help='JSON search specification')
+	parser.add_argument('results', help='JSON lines results file (appended, resumable)')
+	parser.add_argument('--processes', type=int, default=None)
+	args = parser.parse_args(argv)
+
+	start_time = time.time()
+	spec = load_spec(args.spec)
+	results = run_sweep(spec, args.results, args.processes)
+	for point_stats in get_point_stats(results, spec):
+		print(
+			'{key} -> sessions: {sessions}, guessed: {guessed:.2%}, '
+			'attempts: {mean_attempts:.2f} +/- {ci95_attempts:.2f} '
+			'(std {std_attempts:.2f}, median {median_attempts:.1f}, p90 {p90_attempts:.1f}), '
+			'time: {mean_time:.3f}s'.format(key=get_point_key(point_stats['point']), **point_stats)
+		)
+	print('wall: {0:.3f}s'.format(time.time()-start_time))
+
+
+if __name__ == '__main__':
+	main()
\ No newline at end of file
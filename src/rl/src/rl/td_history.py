@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+# constants------------------------------------------------------------------
+
+TD_HISTORY_DTYPE = np.dtype([
+	('state_id', np.int32),
+	('action', np.int32),
+	('qvalue', np.float64),
+	('td_error', np.float64),
+	('td_error_delta', np.float64)
+])
+
+DEFAULT_MAX_SIZE = 65536
+
+
+# functions------------------------------------------------------------------
+
+def load_td_history(path):
+
+	"""
+	Carica i record scritti su file da TDHistory.flush
+
+	Parameters
+	-----------------------------------
+	(str) path
+		Percorso del file
+
+	Returns
+	-----------------------------------
+	(numpy.ndarray) records
+		Record in ordine cronologico (TD_HISTORY_DTYPE)
+	"""
+
+	return np.fromfile(path, dtype=TD_HISTORY_DTYPE)
+
+
+# classes--------------------------------------------------------------------
+
+class TDHistory:
+
+	"""
+	Storico delle azioni eseguite dall'agente (stato, azione, valore Q, errore
+	TD e sua variazione al momento dell'azione) memorizzato in un array
+	strutturato preallocato. L'array cresce raddoppiando fino a max_size
+	record, dopodiché è gestito come buffer circolare: i record più vecchi
+	sono sovrascritti, dopo essere stati aggiunti al file path se indicato.
+	Per default la memoria occupata è limitata (DEFAULT_MAX_SIZE record, 2 MB):
+	senza path lo storico in memoria contiene soltanto le ultime azioni
+
+	Attributes
+	-----------------------------------
+	(numpy.ndarray) records
+		Buffer dei record (TD_HISTORY_DTYPE)
+
+	(int) max_size
+		Numero massimo di record mantenuti in memoria (None se illimitato)
+
+	(str) path
+		File a cui sono aggiunti i record (None se non previsto)
+
+	(int) total
+		Numero di record aggiunti dalla creazione
+
+	(int) flushed
+		Numero di record scritti su file
+
+	Methods
+	-----------------------------------
+	append(state_id, action, qvalue, td_error, td_error_delta)
+		Aggiunge un record
+
+	extend(records)
+		Aggiunge i record passati in ingresso
+
+	restore(records, total)
+		Sostituisce i record in memoria con record già scritti su file
+
+	get_records()
+		Restituisce i record in memoria in ordine cronologico
+
+	get_views()
+		Restituisce i record in memoria come viste sul buffer
+
+	get_series(*fields)
+		Restituisce i campi indicati come lista di tuple
+
+	flush()
+		Aggiunge al file i record non ancora scritti
+
+	clear()
+		Elimina i record in memoria
+	"""
+
+	def __init__(self, capacity=1024, max_size=DEFAULT_MAX_SIZE, path=None):
+
+		"""
+		Parameters
+		-----------------------------------
+		(int) capacity [opt, default = 1024]
+			Numero di record allocati inizialmente
+
+		(int) max_size [opt, default = DEFAULT_MAX_SIZE]
+			Numero massimo di record mantenuti in memoria (None se illimitato)
+
+		(str) path [opt, default = None]
+			File a cui aggiungere i record prima che siano sovrascritti
+		"""
+
+		self.records = np.zeros(max(1, min(capacity, max_size or capacity)), dtype=TD_HISTORY_DTYPE)
+		self.max_size = max_size
+		self.path = path
+		self.start = 0
+		self.size = 0
+		self.total = 0
+		self.flushed = 0
+
+
+	def __len__(self):
+		return self.size
+
+
+	def grow(self):
+
+		"""
+		Raddoppia la capacità del buffer (al più max_size), i record sono
+		riportati in ordine cronologico
+		"""
+
+		capacity = 2*len(self.records)
+		if self.max_size is not None:
+			capacity = min(capacity, self.max_size)
+		records = np.zeros(capacity, dtype=TD_HISTORY_DTYPE)
+		records[:self.size] = self.get_records()
+		self.records = records
+		self.start = 0
+
+
+	def append(self, state_id, action, qvalue, td_error, td_error_delta):
+
+		"""
+		Aggiunge un record
+
+		Parameters
+		-----------------------------------
+		(int) state_id
+			Identificativo dello stato in cui è stata eseguita l'azione
+
+		(int) action
+			Azione eseguita
+
+		(float) qvalue
+			Valore Q dell'azione
+
+		(float) td_error
+			Ultimo errore TD dell'azione
+
+		(float) td_error_delta
+			Variazione dell'errore TD dell'azione
+		"""
+
+		capacity = len(self.records)
+		if self.size == capacity:
+			if self.max_size is None or capacity < self.max_size:
+				self.grow()
+				capacity = len(self.records)
+			else:
+				if self.path is not None and self.flushed < self.total-self.size+1:
+					self.flush()
+				self.start = (self.start+1)%capacity
+				self.size -= 1
+		self.records[(self.start+self.size)%capacity] = (state_id, action, qvalue, td_error, td_error_delta)
+		self.size += 1
+		self.total += 1
+
+
+	def extend(self, records):
+
+		"""
+		Aggiunge i record passati in ingresso
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) records
+			Record da aggiungere (TD_HISTORY_DTYPE)
+		"""
+
+		for record in records.tolist():
+			self.append(*record)
+
+
+	def restore(self, records, total):
+
+		"""
+		Sostituisce i record in memoria con quelli passati in ingresso (ad esempio
+		ripristinati da un salvataggio), considerandoli già scritti su file: flush
+		non li aggiunge nuovamente. Sono mantenuti al più gli ultimi max_size record
+
+		Parameters
+		-----------------------------------
+		(numpy.ndarray) records
+			Record da ripristinare in ordine cronologico (TD_HISTORY_DTYPE)
+
+		(int) total
+			Numero di record aggiunti dalla creazione dello storico salvato
+		"""
+
+		if self.max_size is not None:
+			records = records[max(0, len(records)-self.max_size):]
+		self.records = np.zeros(max(len(self.records), len(records)), dtype=TD_HISTORY_DTYPE)
+		self.records[:len(records)] = records
+		self.start = 0
+		self.size = len(records)
+		self.total = total
+		self.flushed = total
+
+
+	def get_views(self):
+
+		"""
+		Restituisce i record in memoria come viste sul buffer (nessuna copia):
+		una sola vista se il buffer non ha ancora compiuto un giro, altrimenti
+		due viste da concatenare in quest'ordine
+
+		Returns
+		-----------------------------------
+		(tuple) views
+			Viste in ordine cronologico
+		"""
+
+		end = self.start+self.size
+		if end <= len(self.records):
+			return (self.records[self.start:end],)
+		return (self.records[self.start:], self.records[:end-len(self.records)])
+
+
+	def get_records(self):
+
+		"""
+		Restituisce i record in memoria in ordine cronologico (vista sul buffer
+		se contigui, altrimenti copia)
+
+		Returns
+		-----------------------------------
+		(numpy.ndarray) records
+			Record (TD_HISTORY_DTYPE)
+		"""
+
+		views = self.get_views()
+		if len(views) == 1:
+			return views[0]
+		return np.concatenate(views)
+
+
+	def get_series(self, *fields):
+
+		"""
+		Restituisce i campi indicati dei record in memoria come lista di tuple
+		(formato delle serie consumate da plot.py)
+
+		Parameters
+		-----------------------------------
+		(str) fields
+			Nomi dei campi (ref. TD_HISTORY_DTYPE)
+
+		Returns
+		-----------------------------------
+		(list) series
+			Lista di tuple, una per record
+		"""
+
+		records = self.get_records()
+		return list(zip(*[records[field].tolist() for field in fields]))
+
+
+	def flush(self):
+
+		"""
+		Aggiunge al file i record non ancora scritti (nessun effetto se path
+		non è indicato). I record già sovrascritti senza file non sono recuperabili
+		"""
+
+		if self.path is None:
+			return
+		pending = min(self.total-self.flushed, self.size)
+		if pending > 0:
+			records = self.get_records()
+			with open(self.path, 'ab') as history_file:
+				history_file.write(records[self.size-pending:].tobytes())
+		self.flushed = self.total
+
+
+	def clear(self):
+
+		"""
+		Elimina i record in memoria (quelli non ancora scritti su file sono persi)
+		"""
+
+		self.start = 0
+		self.size = 0
+		self.flushed = self.total
\ No newline at end of file
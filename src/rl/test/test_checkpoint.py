@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+import unittest
+import numpy as np
+from rl.gym_mastermind.envs import MastermindEnv
+from rl.qtable import MappedQTableReader, MAPPED_ARRAYS
+from rl.agent import Agent
+
+
+# constants------------------------------------------------------------------
+
+SECRET = [0, 1, 3]
+
+NO_LOADS = 50
+
+
+# functions------------------------------------------------------------------
+
+def run_steps(agent, no_steps):
+	for _ in range(no_steps):
+		if agent.take_action(agent.get_action()):
+			agent.update_qmatrix(float(len(set(agent.curr_state) & set(SECRET)))-1.0)
+			agent.curr_state = agent.env.reset()
+
+
+# classes--------------------------------------------------------------------
+
+class TestCheckpoint(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_path = tempfile.mkdtemp()
+		self.checkpoint_path = os.path.join(self.tmp_path, 'agent.npz')
+		np.random.seed(0)
+		random.seed(0)
+
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_path)
+
+
+	def test_load_mapped_while_reading(self):
+		qmatrix_path = os.path.join(self.tmp_path, 'qmatrix.bin')
+		agent = Agent(MastermindEnv(4, SECRET, 0), qmatrix_path=qmatrix_path)
+		run_steps(agent, 60)
+		agent.save(self.checkpoint_path)
+		reader = MappedQTableReader(qmatrix_path)
+		expected, version = reader.snapshot(timeout=1.0)
+		inode = os.stat(qmatrix_path).st_ino
+
+		def load():
+			for _ in range(NO_LOADS):
+				agent.load(self.checkpoint_path)
+
+		loader = threading.Thread(target=load)
+		loader.start()
+		while loader.is_alive():
+			arrays, version = reader.snapshot(timeout=5.0)
+			for key in MAPPED_ARRAYS:
+				np.testing.assert_array_equal(arrays[key], expected[key], err_msg=key)
+		loader.join()
+		self.assertEqual(os.stat(qmatrix_path).st_ino, inode)
+		self.assertGreater(reader.get_version(), version)
+		arrays, _ = reader.snapshot(timeout=1.0)
+		for key in MAPPED_ARRAYS:
+			np.testing.assert_array_equal(arrays[key], expected[key], err_msg=key)
+
+
+
+	def test_td_history_total(self):
+		agent = Agent(MastermindEnv(4, SECRET, 0), td_history_size=4)
+		run_steps(agent, 6)
+		agent.save(self.checkpoint_path)
+		agent.load(self.checkpoint_path)
+		self.assertEqual(agent.td_history.total, 6)
+		self.assertEqual(len(agent.td_history), 4)
+		loaded_agent = Agent(MastermindEnv(4, SECRET, 0), td_history_size=4)
+		loaded_agent.load(self.checkpoint_path)
+		self.assertEqual(loaded_agent.td_history.total, 6)
+		np.testing.assert_array_equal(loaded_agent.td_history.get_records(), agent.td_history.get_records())
+
+if __name__ == '__main__':
+	unittest.main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import numpy as np
+import rl.rl_exceptions as rlexc
+from rl.gym_mastermind.envs import get_state_space
+from rl.qtable import MappedQTable, MappedQTableReader
+
+
+# constants------------------------------------------------------------------
+
+NO_WRITES = 200
+
+
+# classes--------------------------------------------------------------------
+
+class TestMappedQTable(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_path = tempfile.mkdtemp()
+		self.state_space = get_state_space(4, 3)
+		self.qtable = MappedQTable(self.state_space, os.path.join(self.tmp_path, 'qmatrix.bin'))
+		self.reader = MappedQTableReader(self.qtable.path)
+		self.states = self.state_space.get_states()[:8]
+
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_path)
+
+
+	def test_nested_writing(self):
+		with self.qtable.writing():
+			self.qtable[self.states[0]]['qvalues'] = 1.0
+			self.assertEqual(self.reader.get_version()%2, 1)
+			with self.assertRaises(rlexc.MappedQTableTimeoutError):
+				self.reader.snapshot(timeout=0.05)
+			self.qtable[self.states[1]]['qvalues'] = 1.0
+		arrays, version = self.reader.snapshot(timeout=1.0)
+		self.assertEqual(version, 2)
+		for state in self.states[:2]:
+			self.assertTrue(np.all(arrays['qvalues'][self.state_space.get_state_id(state)] == 1.0))
+
+
+	def test_snapshot_during_nested_writes(self):
+
+		def write():
+			for value in range(1, NO_WRITES+1):
+				with self.qtable.writing():
+					for state in self.states:
+						self.qtable[state]['qvalues'] = float(value)
+
+		writer = threading.Thread(target=write)
+		writer.start()
+		state_ids = [self.state_space.get_state_id(state) for state in self.states]
+		while writer.is_alive():
+			arrays, version = self.reader.snapshot(timeout=5.0)
+			self.assertEqual(version%2, 0)
+			self.assertEqual(len(np.unique(arrays['qvalues'][state_ids])), 1)
+		writer.join()
+		self.assertEqual(self.reader.get_version(), 2*NO_WRITES)
+
+
+if __name__ == '__main__':
+	unittest.main()
\ No newline at end of file
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+import numpy as np
+from rl.gym_mastermind.envs import MastermindEnv
+from rl.agent import Agent
+
+
+# constants------------------------------------------------------------------
+
+# (no_pegs, secret, alpha, gamma, sparse_qmatrix)
+CONFIGS = [
+	(4, [0, 1, 3], 0.7, 0.9, False),
+	(5, [0, 0, 2, 4], 0.7, 0.9, False),
+	(3, [1, 1], 0.7, 0.9, False),
+	(6, [0, 1, 3, 5], 0.7, 0.9, False),
+	(4, [2, 2, 2], 0.3, 0.5, False),
+	(5, [1, 3, 4], 1.0, 1.0, False),
+	(4, [0, 1, 3], 0.7, 0.9, True),
+	(5, [0, 0, 2, 4], 0.5, 0.8, True)
+]
+
+NO_STEPS = 80
+
+
+# functions------------------------------------------------------------------
+
+def reference_update_qmatrix(env, curr_state, qvalues, td_errors, td_errors_delta, visits, reward, alpha, gamma):
+
+	"""
+	Implementazione originale (stato per stato) di Agent.update_qmatrix sugli
+	array densi (righe indicizzate per identificativo di stato)
+	"""
+
+	state_lens = env.state_space.state_lens
+	terminal_state_len = env.get_terminal_state_len()
+
+	def update(state_id, reward):
+
+		coverage_ids = env.get_coverage_ids(state_id)
+		coverage = set(coverage_ids.tolist())
+		for covered_state_id in coverage_ids:
+			if state_lens[covered_state_id] != terminal_state_len:
+				reachable_state_ids = env.get_next_reachable_state_ids(covered_state_id)
+				for action, reachable_state_id in enumerate(reachable_state_ids):
+					if reachable_state_id in coverage:
+						td = alpha*(gamma*np.max(qvalues[reachable_state_id])-qvalues[covered_state_id, action])
+						qvalues[covered_state_id, action] = qvalues[covered_state_id, action]+td
+						td_errors_delta[covered_state_id, action] = td-td_errors[covered_state_id, action]
+						td_errors[covered_state_id, action] = td
+			else:
+				if curr_state_id == state_id:
+					td = alpha*(reward-qvalues[covered_state_id, 0])
+					td_errors_delta[covered_state_id, :] = td-td_errors[covered_state_id, 0]
+					td_errors[covered_state_id, :] = td
+				else:
+					td = alpha*reward
+				qvalues[covered_state_id, :] = qvalues[covered_state_id, :]+td
+
+	curr_state_id = env.get_state_id(curr_state)
+	if env.is_terminal_state(curr_state):
+		reward = reward if reward >= 0 else reward*3
+		codec = env.state_space.codec
+		curr_packed_state = env.get_packed_state(curr_state_id)
+		for state_id in range(len(visits)):
+			common_elements = codec.intersection_size(curr_packed_state, env.get_packed_state(state_id))
+			if state_lens[state_id] == terminal_state_len and visits[state_id] == 0 and (1 <= common_elements <= 2):
+				update(state_id, reward/env.get_terminal_state_len()*common_elements)
+		update(curr_state_id, reward)
+
+	visits[env.get_coverage_ids(curr_state_id)] += 1
+
+
+def get_dense_arrays(qmatrix):
+
+	"""
+	Restituisce copie dense (righe indicizzate per identificativo di stato)
+	di valori Q, errori TD, variazioni degli errori TD e visite
+	"""
+
+	rows = qmatrix.rows(np.arange(qmatrix.state_space.get_no_states()))
+	return [
+		qmatrix.qvalues[rows].copy(),
+		qmatrix.td_errors[rows].copy(),
+		qmatrix.td_errors_delta[rows].copy(),
+		qmatrix.visits[rows].copy()
+	]
+
+
+# classes--------------------------------------------------------------------
+
+class TestUpdateQMatrix(unittest.TestCase):
+
+	def test_matches_reference(self):
+		for no_pegs, secret, alpha, gamma, sparse_qmatrix in CONFIGS:
+			np.random.seed(0)
+			random.seed(0)
+			env = MastermindEnv(no_pegs, secret, 0)
+			agent = Agent(env, alpha=alpha, gamma=gamma, sparse_qmatrix=sparse_qmatrix)
+			updates = 0
+			for _ in range(NO_STEPS):
+				if not agent.take_action(agent.get_action()):
+					continue
+				reward = float(len(set(agent.curr_state) & set(secret)))-1.0
+				expected = get_dense_arrays(agent.qmatrix)
+				reference_update_qmatrix(env, agent.curr_state, *(expected+[reward, alpha, gamma]))
+				agent.update_qmatrix(reward)
+				for name, expected_array, array in zip(['qvalues', 'td_errors', 'td_errors_delta', 'visits'], expected, get_dense_arrays(agent.qmatrix)):
+					np.testing.assert_array_equal(array, expected_array, err_msg='{0} {1} {2}'.format(name, no_pegs, secret))
+				agent.curr_state = env.reset()
+				updates += 1
+			self.assertGreater(updates, 0)
+
+
+if __name__ == '__main__':
+	unittest.main()
\ No newline at end of file
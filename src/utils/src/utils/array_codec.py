@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import base64
+import numpy as np
+
+
+# constants------------------------------------------------------------------
+
+QMATRIX_FORMAT = 'base64'
+
+QMATRIX_ARRAYS = [
+    'qvalues',
+    'td_errors',
+    'td_errors_variations',
+    'visits'
+]
+
+
+# functions------------------------------------------------------------------
+
+def encode_array(array):
+
+    """
+    Codifica un array numpy in un dizionario serializzabile in JSON (tipo con
+    ordine dei byte esplicito, forma e dati in base64). La decodifica
+    restituisce esattamente gli stessi valori (float64 compresi)
+
+    Parameters
+    -----------------------------------
+    (numpy.ndarray) array
+        Array da codificare
+
+    Returns
+    -----------------------------------
+    (dict) encoded
+        Array codificato (chiavi dtype, shape e data)
+    """
+
+    array = np.ascontiguousarray(array)
+    return {
+        'dtype': array.dtype.str,
+        'shape': list(array.shape),
+        'data': base64.b64encode(array.tobytes()).decode('ascii')
+    }
+
+
+def decode_array(encoded):
+
+    """
+    Decodifica un array codificato da encode_array
+
+    Parameters
+    -----------------------------------
+    (dict) encoded
+        Array codificato
+
+    Returns
+    -----------------------------------
+    (numpy.ndarray) array
+        Array decodificato (nell'ordine dei byte nativo)
+    """
+
+    dtype = np.dtype(str(encoded['dtype']))
+    array = np.frombuffer(base64.b64decode(encoded['data']), dtype=dtype).reshape(encoded['shape'])
+    return array.astype(dtype.newbyteorder('='))
+
+
+def encode_qmatrix(state_counts, qvalues, td_errors, td_errors_variations, visits):
+
+    """
+    Codifica la matrice Q di una sessione: una riga per stato, nell'ordine
+    degli identificativi degli stati
+
+    Parameters
+    -----------------------------------
+    (numpy.ndarray) state_counts
+        Numero di occorrenze di ciascun piolo negli stati (stati x pioli)
+
+    (numpy.ndarray) qvalues
+        Valori Q (stati x azioni)
+
+    (numpy.ndarray) td_errors
+        Errori TD (stati x azioni)
+
+    (numpy.ndarray) td_errors_variations
+        Variazioni degli errori TD (stati x azioni)
+
+    (numpy.ndarray) visits
+        Visite degli stati
+
+    Returns
+    -----------------------------------
+    (dict) qmatrix
+        Matrice Q codificata (ref. decode_qmatrix)
+    """
+
+    return {
+        'format': QMATRIX_FORMAT,
+        'state_counts': encode_array(np.asarray(state_counts, dtype=np.uint8)),
+        'qvalues': encode_array(np.asarray(qvalues, dtype=np.float64)),
+        'td_errors': encode_array(np.asarray(td_errors, dtype=np.float64)),
+        'td_errors_variations': encode_array(np.asarray(td_errors_variations, dtype=np.float64)),
+        'visits': encode_array(np.asarray(visits, dtype=np.int64))
+    }
+
+
+def decode_qmatrix(qmatrix, no_pegs):
+
+    """
+    Decodifica la matrice Q di una sessione, sia nel formato codificato da
+    encode_qmatrix sia nel formato testuale delle sessioni precedenti
+    ({"{0, 0, 1}": {"qvalues": "[...]", ...}}, righe riordinate come gli
+    identificativi degli stati: per lunghezza e poi per pioli)
+
+    Parameters
+    -----------------------------------
+    (dict) qmatrix
+        Matrice Q della sessione (result.qmatrix)
+
+    (int) no_pegs
+        Numero di pioli (config.no_pegs)
+
+    Returns
+    -----------------------------------
+    (dict) arrays
+        Array state_counts, qvalues, td_errors, td_errors_variations e visits
+    """
+
+    if qmatrix.get('format') == QMATRIX_FORMAT:
+        arrays = dict((name, decode_array(qmatrix[name])) for name in QMATRIX_ARRAYS)
+        arrays['state_counts'] = decode_array(qmatrix['state_counts'])
+        return arrays
+
+    states = [
+        (sorted(int(peg) for peg in state_str.strip('{}').split(',') if peg.strip()), state_str)
+        for state_str in qmatrix
+    ]
+    states.sort(key=lambda state: (len(state[0]), state[0]))
+    entries = [qmatrix[state_str] for _, state_str in states]
+    arrays = {
+        'state_counts': np.array([np.bincount(np.array(pegs, dtype=np.int64), minlength=no_pegs) for pegs, _ in states], dtype=np.uint8).reshape(-1, no_pegs),
+        'visits': np.array([entry['visits'] for entry in entries], dtype=np.int64)
+    }
+    for name in QMATRIX_ARRAYS[:-1]:
+        arrays[name] = np.array([_parse_list(entry[name]) for entry in entries], dtype=np.float64).reshape(len(entries), -1)
+    return arrays
+
+
+def _parse_list(list_str):
+    return [float(value) for value in list_str.strip('[]').split(',') if value.strip()]
\ No newline at end of file
@@ -56,7 +56,12 @@ class FeedbackHighlighter:
 
     (deque) feedback_frames
         Tiene traccia dei frame indicati come frame di feedback e del corrispondente
-        feedback_id. I suoi elementi sono coppie del tipo (frame, feedback_id)
+        feedback_id. I suoi elementi sono coppie del tipo (frame_seq, feedback_id)
+
+    (int) frame_seq
+        Numero di sequenza dell'ultimo frame passato alla funzione scroll (i frame
+        sono numerati a partire da 1). Il frame mediano di sliding_window_frames ha
+        numero di sequenza frame_seq - len(sliding_window_frames)//2
 
     Methods
     -----------------------------------
@@ -120,6 +125,7 @@ class FeedbackHighlighter:
         sliding_window_maxlen = fps*duration/1000 if (fps*duration/1000)%2==1 else fps*duration/1000-1
         self.sliding_window_frames = collections.deque([None]*sliding_window_maxlen, maxlen=sliding_window_maxlen)
         self.feedback_frames = collections.deque()
+        self.frame_seq = 0
 
 
     def scroll(self, frame, is_feedback_frame=False, feedback_id=None):
@@ -161,11 +167,13 @@ class FeedbackHighlighter:
 
         if is_feedback_frame and feedback_id is None:
             raise uexc.InvalidFeedbackIdError()
+        self.frame_seq += 1
         self.sliding_window_frames.append(frame)
         if is_feedback_frame:
-            self.feedback_frames.append((frame, feedback_id))
+            self.feedback_frames.append((self.frame_seq, feedback_id))
+        # Confronto tra numeri di sequenza: nessun confronto tra i pixel dei frame
         if (len(self.feedback_frames) > 0 and 
-            (self.feedback_frames[0][0] == self.sliding_window_frames[int(len(self.sliding_window_frames)/2)]).all()):
+            self.feedback_frames[0][0] <= self.frame_seq-len(self.sliding_window_frames)//2):
             try:
                 return self.save_video(self.feedback_frames.popleft()[1])
             except:
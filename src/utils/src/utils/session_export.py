@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import argparse
+import numpy as np
+from session_storage import open_storage, STORAGE_BACKENDS
+from session_query import get_index_values, parse_duration
+from array_codec import decode_qmatrix
+
+
+# constants------------------------------------------------------------------
+
+EXPORT_VERSION = 1
+
+MANIFEST_NAME = 'manifest.json'
+
+PART_PREFIX = 'part_'
+
+DEFAULT_PART_SIZE = 1000
+
+TABLES = [
+    'sessions',
+    'qmatrix',
+    'feedback'
+]
+
+CONFIG_COLUMNS = [
+    'alpha',
+    'gamma',
+    'epsilon',
+    'beta',
+    'epsilon_decay',
+    'epsilon_low'
+]
+
+QMATRIX_COLUMNS = [
+    'qvalues',
+    'td_errors',
+    'td_errors_variations'
+]
+
+
+# functions------------------------------------------------------------------
+
+def get_tables(sessions, first_session=0):
+
+    """
+    Converte le sessioni in tre tabelle colonnari (dizionari colonna -> array):
+        sessions -> una riga per sessione (configurazione e risultato)
+        qmatrix  -> una riga per stato di ciascuna sessione
+        feedback -> una riga per feedback di ciascuna sessione
+    Le colonne session di qmatrix e feedback indicano il numero della sessione
+    (a partire da first_session). I valori mancanti sono -1 (interi), NaN
+    (reali) o '' (stringhe); le colonne a più valori per riga (secret, attempt,
+    state_counts, qvalues, ...) sono completate con gli stessi valori
+
+    Parameters
+    -----------------------------------
+    (list) sessions
+        Sessioni da convertire
+
+    (int) first_session [opt, default = 0]
+        Numero della prima sessione
+
+    Returns
+    -----------------------------------
+    (dict) tables
+        Tabella -> colonna -> array
+    """
+
+    rows = {'sessions': [], 'qmatrix': [], 'feedback': []}
+    for session_no, session in enumerate(sessions, first_session):
+        values = get_index_values(session)
+        config = session.get('config', {})
+        result = session.get('result', {})
+        rows['sessions'].append((session_no, values, config))
+        if result.get('qmatrix') and values['no_pegs'] is not None:
+            rows['qmatrix'].append((session_no, decode_qmatrix(result['qmatrix'], values['no_pegs'])))
+        for feedback_id in sorted(session.get('feedback') or {}):
+            rows['feedback'].append((session_no, feedback_id, session['feedback'][feedback_id]))
+
+    sessions_rows = rows['sessions']
+    tables = {
+        'sessions': {
+            'session': np.array([row[0] for row in sessions_rows], dtype=np.int32),
+            'session_id': _strings([row[1]['session_id'] for row in sessions_rows]),
+            'timestamp': _integers([row[1]['timestamp'] for row in sessions_rows], np.int64),
+            'no_pegs': _integers([row[1]['no_pegs'] for row in sessions_rows]),
+            'code_len': _integers([row[1]['code_len'] for row in sessions_rows]),
+            'secret': _pad([row[1]['secret'] or () for row in sessions_rows], -1, np.int16),
+            'exploration_mode': _strings([row[1]['exploration_mode'] for row in sessions_rows]),
+            'guessed': _integers([row[1]['guessed'] for row in sessions_rows], np.int8),
+            'attempts': _integers([row[1]['attempts'] for row in sessions_rows]),
+            'duration': _integers([row[1]['duration'] for row in sessions_rows])
+        }
+    }
+    for column in CONFIG_COLUMNS:
+        tables['sessions'][column] = np.array(
+            [np.nan if row[2].get(column) is None else row[2][column] for row in sessions_rows],
+            dtype=np.float64
+        )
+
+    qmatrix_rows = rows['qmatrix']
+    tables['qmatrix'] = {
+        'session': np.array([session_no for session_no, arrays in qmatrix_rows for _ in arrays['visits']], dtype=np.int32),
+        'state_counts': _stack([arrays['state_counts'] for _, arrays in qmatrix_rows], 0, np.uint8),
+        'visits': np.array([visits for _, arrays in qmatrix_rows for visits in arrays['visits']], dtype=np.int64)
+    }
+    for column in QMATRIX_COLUMNS:
+        tables['qmatrix'][column] = _stack([arrays[column] for _, arrays in qmatrix_rows], np.nan, np.float64)
+
+    feedback_rows = rows['feedback']
+    tables['feedback'] = {
+        'session': np.array([row[0] for row in feedback_rows], dtype=np.int32),
+        'feedback_id': _strings([row[1] for row in feedback_rows]),
+        'evaluation': np.array([row[2].get('evaluation', np.nan) for row in feedback_rows], dtype=np.float64),
+        'attempt': _pad([row[2].get('attempt') or () for row in feedback_rows], -1, np.int16),
+        'time': _integers([parse_duration(row[2].get('time')) for row in feedback_rows]),
+        'analyzed': np.array([row[2].get('csv_path') is not None for row in feedback_rows], dtype=bool)
+    }
+    return tables
+
+
+def export_sessions(storage, export_path, part_size=DEFAULT_PART_SIZE):
+
+    """
+    Esporta in export_path le sessioni aggiunte all'archivio dall'esportazione
+    precedente, in nuovi file npz di al più part_size sessioni (part_NNNNN.npz,
+    colonne con chiave tabella.colonna). Il file manifest.json registra i file
+    prodotti e l'ultima sessione esportata; se l'archivio non contiene più tale
+    sessione l'esportazione riparte da zero
+
+    Parameters
+    -----------------------------------
+    (JSONLinesSessionStorage|SQLiteSessionStorage) storage
+        Archivio delle sessioni
+
+    (str) export_path
+        Cartella dell'esportazione (creata se inesistente)
+
+    (int) part_size [opt, default = DEFAULT_PART_SIZE]
+        Numero massimo di sessioni per file
+
+    Returns
+    -----------------------------------
+    (int) exported
+        Numero di sessioni esportate
+    """
+
+    if not os.path.isdir(export_path):
+        os.makedirs(export_path)
+    manifest = _load_manifest(export_path)
+    if manifest['position'] is not None:
+        try:
+            valid = storage.read(manifest['position']).get('session_id') == manifest['session_id']
+        except (ValueError, TypeError, IOError):
+            valid = False
+        if not valid:
+            for part in manifest['parts']:
+                if os.path.isfile(os.path.join(export_path, part)):
+                    os.remove(os.path.join(export_path, part))
+            manifest = _load_manifest(None)
+
+    exported = 0
+    sessions = []
+    for position, session in storage.scan(manifest['position']):
+        sessions.append(session)
+        if len(sessions) == part_size:
+            _write_part(export_path, manifest, sessions, position)
+            exported += len(sessions)
+            sessions = []
+    if len(sessions) > 0:
+        _write_part(export_path, manifest, sessions, position)
+        exported += len(sessions)
+    return exported
+
+
+def load_export(export_path):
+
+    """
+    Carica le tabelle esportate concatenando i file npz nell'ordine di
+    esportazione (le colonne a più valori sono completate alla larghezza
+    massima come in get_tables)
+
+    Parameters
+    -----------------------------------
+    (str) export_path
+        Cartella dell'esportazione
+
+    Returns
+    -----------------------------------
+    (dict) tables
+        Tabella -> colonna -> array
+    """
+
+    parts = []
+    for part in _load_manifest(export_path)['parts']:
+        with np.load(os.path.join(export_path, part)) as part_file:
+            parts.append(dict((key, part_file[key]) for key in part_file.files))
+    tables = dict((table, {}) for table in TABLES)
+    if len(parts) == 0:
+        return tables
+    for key in parts[0]:
+        table, column = key.split('.', 1)
+        arrays = [part[key] for part in parts]
+        if arrays[0].ndim == 1:
+            tables[table][column] = np.concatenate(arrays)
+        else:
+            tables[table][column] = _stack(arrays, _get_fill(arrays[0].dtype), arrays[0].dtype)
+    return tables
+
+
+def main(argv=None):
+
+    """
+    Esporta da riga di comando l'archivio delle sessioni in formato colonnare
+    """
+
+    parser = argparse.ArgumentParser(description='Incremental columnar (npz) export of the session storage')
+    parser.add_argument('storage', help='session storage file')
+    parser.add_argument('export_path', help='export directory')
+    parser.add_argument('--backend', choices=sorted(STORAGE_BACKENDS.keys()), default='jsonl')
+    parser.add_argument('--part-size', type=int, default=DEFAULT_PART_SIZE)
+    args = parser.parse_args(argv)
+
+    storage = open_storage(args.backend, args.storage)
+    try:
+        print('exported: {0}'.format(export_sessions(storage, args.export_path, args.part_size)))
+    finally:
+        storage.close()
+
+
+def _load_manifest(export_path):
+    manifest = {'version': EXPORT_VERSION, 'parts': [], 'sessions': 0, 'position': None, 'session_id': None}
+    if export_path is not None and os.path.isfile(os.path.join(export_path, MANIFEST_NAME)):
+        with open(os.path.join(export_path, MANIFEST_NAME)) as manifest_file:
+            loaded = json.load(manifest_file)
+        if loaded.get('version') == EXPORT_VERSION:
+            manifest.update(loaded)
+    return manifest
+
+
+def _write_part(export_path, manifest, sessions, position):
+    tables = get_tables(sessions, manifest['sessions'])
+    part = PART_PREFIX + str(len(manifest['parts'])).zfill(5) + '.npz'
+    arrays = dict(
+        (table + '.' + column, array)
+        for table, columns in tables.items()
+        for column, array in columns.items()
+    )
+    _replace(os.path.join(export_path, part), lambda part_file: np.savez_compressed(part_file, **arrays))
+    manifest['parts'].append(part)
+    manifest['sessions'] += len(sessions)
+    manifest['position'] = position
+    manifest['session_id'] = sessions[-1].get('session_id')
+    _replace(
+        os.path.join(export_path, MANIFEST_NAME),
+        lambda manifest_file: manifest_file.write(json.dumps(manifest, sort_keys=True, indent=4).encode('utf-8'))
+    )
+
+
+def _replace(path, write):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as tmp_file:
+        write(tmp_file)
+        tmp_file.flush()
+        os.fsync(tmp_file.fileno())
+    os.rename(tmp_path, path)
+
+
+def _strings(values):
+    return np.array([u'' if value is None else value for value in values], dtype='U')
+
+
+def _integers(values, dtype=np.int32):
+    return np.array([-1 if value is None else value for value in values], dtype=dtype)
+
+
+def _pad(rows, fill, dtype):
+    array = np.full((len(rows), max([len(row) for row in rows] + [0])), fill, dtype=dtype)
+    for row_no, row in enumerate(rows):
+        array[row_no, :len(row)] = row
+    return array
+
+
+def _stack(arrays, fill, dtype):
+    width = max([array.shape[1] for array in arrays] + [0])
+    stacked = np.full((sum(len(array) for array in arrays), width), fill, dtype=dtype)
+    offset = 0
+    for array in arrays:
+        stacked[offset:offset+len(array), :array.shape[1]] = array
+        offset += len(array)
+    return stacked
+
+
+def _get_fill(dtype):
+    if dtype.kind == 'f':
+        return np.nan
+    if dtype.kind == 'i':
+        return -1
+    if dtype.kind == 'U':
+        return u''
+    return 0
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
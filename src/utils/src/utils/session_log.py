@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import threading
+import utils_exceptions as uexc
+
+
+# constants------------------------------------------------------------------
+
+EVENT_TYPES = [
+    'begin',
+    'step',
+    'update',
+    'feedback',
+    'end'
+]
+
+LOG_EXTENSION = '.events.jsonl'
+
+DEFAULT_FSYNC_INTERVAL = 1.0
+
+
+# functions------------------------------------------------------------------
+
+def load_session_log(path):
+
+    """
+    Carica gli eventi di un registro di sessione. L'ultima riga, se incompleta
+    (ad esempio a causa di un crash), è ignorata
+
+    Parameters
+    -----------------------------------
+    (str) path
+        Path del registro
+
+    Returns
+    -----------------------------------
+    (list) events
+        Eventi in ordine di scrittura (dizionari con chiavi event e ts)
+    """
+
+    events = []
+    with open(path) as log_file:
+        for line in log_file:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+def is_sealed(events):
+
+    """
+    Verifica se il registro è stato chiuso (ultimo evento di tipo end)
+
+    Parameters
+    -----------------------------------
+    (list) events
+        Eventi del registro (ref. load_session_log)
+
+    Returns
+    -----------------------------------
+    (bool) sealed
+        Indica se la sessione è terminata regolarmente
+    """
+
+    return len(events) > 0 and events[-1]['event'] == EVENT_TYPES[-1]
+
+
+def get_unsealed_logs(log_path):
+
+    """
+    Restituisce i registri delle sessioni interrotte (non chiusi)
+
+    Parameters
+    -----------------------------------
+    (str) log_path
+        Cartella dei registri
+
+    Returns
+    -----------------------------------
+    (list) paths
+        Path dei registri non chiusi, ordinati per nome
+    """
+
+    paths = []
+    for name in sorted(os.listdir(log_path)):
+        path = os.path.join(log_path, name)
+        if name.endswith(LOG_EXTENSION) and not is_sealed(load_session_log(path)):
+            paths.append(path)
+    return paths
+
+
+# classes--------------------------------------------------------------------
+
+class SessionEventLog:
+
+    """
+    Registro degli eventi di una sessione (JSON lines, un evento per riga)
+    scritto man mano che la sessione procede. Ogni evento è passato subito al
+    sistema operativo (flush), così che un crash dell'applicativo non lo perda;
+    la scrittura su disco (fsync) avviene al più ogni fsync_interval secondi,
+    anche in assenza di nuovi eventi (ad esempio durante l'attesa di un
+    feedback), per cui un crash del sistema perde soltanto gli ultimi eventi.
+    La chiusura (seal) aggiunge l'evento end e forza la scrittura su disco
+
+    Attributes
+    -----------------------------------
+    (str) path
+        Path del registro
+
+    (float) fsync_interval
+        Intervallo minimo in secondi tra due fsync
+
+    (bool) sealed
+        Indica se il registro è stato chiuso
+
+    Methods
+    -----------------------------------
+    append(event, **fields)
+        Aggiunge un evento al registro
+
+    sync()
+        Rende persistenti su disco gli eventi aggiunti
+
+    seal(**fields)
+        Aggiunge l'evento end e chiude il registro
+    """
+
+    def __init__(self, path, fsync_interval=DEFAULT_FSYNC_INTERVAL):
+
+        """
+        Parameters
+        -----------------------------------
+        (str) path
+            Path del registro (gli eventi sono aggiunti in coda se esistente)
+
+        (float) fsync_interval [opt, default = DEFAULT_FSYNC_INTERVAL]
+            Intervallo minimo in secondi tra due fsync (0 -> fsync ad ogni evento)
+        """
+
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.sealed = False
+        self.lock = threading.Lock()
+        self.log_file = open(path, 'a')
+        self.last_sync = time.time()
+        self.sync_timer = None
+
+
+    def append(self, event, **fields):
+
+        """
+        Aggiunge un evento al registro (ignorato se il registro è chiuso). I
+        campi sono registrati invariati; l'istante di scrittura (secondi
+        dall'epoca) è registrato nella chiave ts
+
+        Parameters
+        -----------------------------------
+        (str) event
+            Tipo dell'evento (ref. EVENT_TYPES)
+
+        (dict) fields
+            Campi dell'evento (serializzabili in JSON, escluse le chiavi event e ts)
+
+        Raises
+        -----------------------------------
+        ReservedLogFieldError
+            fields contiene la chiave ts
+        """
+
+        if 'ts' in fields:
+            raise uexc.ReservedLogFieldError('ts')
+        fields['event'] = event
+        fields['ts'] = round(time.time(), 6)
+        line = json.dumps(fields, sort_keys=True, separators=(',', ':')) + '\n'
+        with self.lock:
+            if self.sealed:
+                return
+            self.log_file.write(line)
+            self.log_file.flush()
+            delay = self.last_sync + self.fsync_interval - time.time()
+            if delay <= 0:
+                self._sync()
+            elif self.sync_timer is None:
+                # fsync differito: gli eventi sono resi persistenti anche se non ne seguono altri
+                self.sync_timer = threading.Timer(delay, self.sync)
+                self.sync_timer.daemon = True
+                self.sync_timer.start()
+
+
+    def sync(self):
+
+        """
+        Rende persistenti su disco gli eventi aggiunti
+        """
+
+        with self.lock:
+            if not self.sealed:
+                self._sync()
+
+
+    def seal(self, **fields):
+
+        """
+        Aggiunge l'evento end, rende persistente il registro e lo chiude
+
+        Parameters
+        -----------------------------------
+        (dict) fields
+            Campi dell'evento end (ad esempio il risultato della sessione)
+        """
+
+        self.append(EVENT_TYPES[-1], **fields)
+        with self.lock:
+            if self.sealed:
+                return
+            self._sync()
+            self.log_file.close()
+            self.sealed = True
+
+
+    def _sync(self):
+        self.log_file.flush()
+        os.fsync(self.log_file.fileno())
+        self.last_sync = time.time()
+        if self.sync_timer is not None:
+            self.sync_timer.cancel()
+            self.sync_timer = None
\ No newline at end of file
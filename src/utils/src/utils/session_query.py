@@ -0,0 +1,570 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import argparse
+import numpy as np
+import utils_exceptions as uexc
+from session_storage import open_storage, STORAGE_BACKENDS
+
+
+# constants------------------------------------------------------------------
+
+INDEX_VERSION = 1
+
+INDEX_EXTENSION = '.index.jsonl'
+
+INDEX_FIELDS = {
+    'session_id': ('session_id',),
+    'secret': ('config', 'secret'),
+    'no_pegs': ('config', 'no_pegs'),
+    'code_len': ('config', 'code_len'),
+    'alpha': ('config', 'alpha'),
+    'gamma': ('config', 'gamma'),
+    'epsilon': ('config', 'epsilon'),
+    'beta': ('config', 'beta'),
+    'exploration_mode': ('config', 'exploration_mode'),
+    'epsilon_decay': ('config', 'epsilon_decay'),
+    'epsilon_low': ('config', 'epsilon_low'),
+    'guessed': ('result', 'guessed'),
+    'attempts': ('result', 'attempts'),
+    'duration': ('result', 'time'),
+    'timestamp': ('session_id',)
+}
+
+
+# functions------------------------------------------------------------------
+
+def get_index_values(session):
+
+    """
+    Estrae dalla sessione i valori dei campi indicizzati (ref. INDEX_FIELDS).
+    Le liste sono convertite in tuple, duration è la durata in secondi
+    (result.time nel formato mm:ss) e timestamp l'istante di inizio in
+    millisecondi (suffisso di session_id)
+
+    Parameters
+    -----------------------------------
+    (dict) session
+        Sessione
+
+    Returns
+    -----------------------------------
+    (dict) values
+        Valori dei campi indicizzati (None se assenti)
+    """
+
+    values = {}
+    for field, keys in INDEX_FIELDS.items():
+        value = session
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+        values[field] = _hashable(value)
+    values['duration'] = parse_duration(values['duration'])
+    values['timestamp'] = _parse_timestamp(values['timestamp'])
+    return values
+
+
+def get_stats(values):
+
+    """
+    Calcola le statistiche dei valori passati in ingresso (None esclusi)
+
+    Parameters
+    -----------------------------------
+    (list) values
+        Valori numerici (o booleani)
+
+    Returns
+    -----------------------------------
+    (dict) stats
+        Numero di valori, media, deviazione standard, minimo, mediana e massimo
+        (None se non ci sono valori)
+    """
+
+    values = np.array([value for value in values if value is not None], dtype=float)
+    if len(values) == 0:
+        return {'count': 0, 'mean': None, 'std': None, 'min': None, 'median': None, 'max': None}
+    return {
+        'count': len(values),
+        'mean': float(values.mean()),
+        'std': float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+        'min': float(values.min()),
+        'median': float(np.median(values)),
+        'max': float(values.max())
+    }
+
+
+def parse_duration(time_str):
+
+    """
+    Converte una durata nel formato mm:ss (result.time, feedback.time) in secondi
+
+    Parameters
+    -----------------------------------
+    (str) time_str
+        Durata nel formato mm:ss
+
+    Returns
+    -----------------------------------
+    (int) duration
+        Durata in secondi (None se il formato non è valido)
+    """
+
+    try:
+        minutes, seconds = time_str.split(':')
+        return int(minutes)*60+int(seconds)
+    except (AttributeError, ValueError):
+        return None
+
+
+def main(argv=None):
+
+    """
+    Interroga da riga di comando l'archivio delle sessioni, ad esempio:
+        python -m utils.session_query db.jsonl --where secret=[0,1,3]
+            --where epsilon_decay=0.85 --aggregate attempts
+    """
+
+    parser = argparse.ArgumentParser(description='Query and aggregate stored sessions through secondary indexes')
+    parser.add_argument('storage', help='session storage file')
+    parser.add_argument('--backend', choices=sorted(STORAGE_BACKENDS.keys()), default='jsonl')
+    parser.add_argument('--where', action='append', default=[], help='field=JSON value, or field={"low": a, "high": b}')
+    parser.add_argument('--aggregate', default=None, help='numeric field to aggregate')
+    parser.add_argument('--group-by', default=None, help='field to group the aggregation by')
+    args = parser.parse_args(argv)
+
+    criteria = {}
+    for condition in args.where:
+        field, value = condition.split('=', 1)
+        try:
+            criteria[field] = json.loads(value)
+        except ValueError:
+            criteria[field] = value
+
+    storage = open_storage(args.backend, args.storage)
+    try:
+        index = SessionIndex(storage)
+        if args.aggregate is None:
+            for values in index.get_values(**criteria):
+                print(values['session_id'])
+        elif args.group_by is None:
+            print(json.dumps(index.aggregate(args.aggregate, **criteria), sort_keys=True))
+        else:
+            groups = index.group_by(args.group_by, args.aggregate, **criteria)
+            for group in sorted(groups, key=str):
+                print('{0} -> {1}'.format(json.dumps(group), json.dumps(groups[group], sort_keys=True)))
+    finally:
+        storage.close()
+
+
+def _hashable(value):
+    if isinstance(value, list):
+        return tuple(_hashable(element) for element in value)
+    return value
+
+
+def _parse_timestamp(session_id):
+    try:
+        return int(session_id.rsplit('_', 1)[-1])
+    except (AttributeError, ValueError):
+        return None
+
+
+# classes--------------------------------------------------------------------
+
+class SessionIndex:
+
+    """
+    Indici secondari sui campi delle sessioni di un archivio (ref. INDEX_FIELDS):
+    per ogni campo associa a ciascun valore le sessioni che lo assumono. Gli
+    indici sono salvati in un file accanto all'archivio e aggiornati con le
+    sole sessioni aggiunte dall'ultimo aggiornamento; interrogazioni e
+    aggregazioni sui campi indicizzati non leggono le sessioni, che sono lette
+    una alla volta (in ordine di inserimento) soltanto da sessions
+
+    I criteri di ricerca sono passati come argomenti con nome (campo=criterio):
+    un valore (uguaglianza, le liste sono confrontate come tuple), un dizionario
+    {"low": a, "high": b} (intervallo chiuso, estremi opzionali) oppure
+    {"in": [v1, v2, ...]} (appartenenza)
+
+    Attributes
+    -----------------------------------
+    (JSONLinesSessionStorage|SQLiteSessionStorage) storage
+        Archivio indicizzato
+
+    (str) path
+        Path del file degli indici
+
+    (list) positions
+        Posizioni delle sessioni nell'archivio (ref. scan)
+
+    (list) values
+        Valori dei campi indicizzati di ciascuna sessione
+
+    (dict) indexes
+        Indici: campo -> valore -> numeri delle sessioni
+
+    Methods
+    -----------------------------------
+    clear()
+        Svuota gli indici
+
+    load()
+        Carica gli indici dal file
+
+    add(position, values)
+        Aggiunge una sessione agli indici in memoria
+
+    refresh()
+        Indicizza le sessioni aggiunte all'archivio
+
+    find(**criteria)
+        Restituisce i numeri delle sessioni che soddisfano i criteri
+
+    get_matching_values(field, criterion)
+        Restituisce i valori indicizzati del campo che soddisfano il criterio
+
+    count(**criteria)
+        Restituisce il numero di sessioni che soddisfano i criteri
+
+    get_values(**criteria)
+        Restituisce i valori indicizzati delle sessioni che soddisfano i criteri
+
+    sessions(**criteria)
+        Restituisce un iteratore sulle sessioni che soddisfano i criteri
+
+    aggregate(field, **criteria)
+        Calcola le statistiche di un campo sulle sessioni che soddisfano i criteri
+
+    group_by(group_field, field, **criteria)
+        Calcola le statistiche di un campo per ciascun valore di group_field
+    """
+
+    def __init__(self, storage, path=None):
+
+        """
+        Parameters
+        -----------------------------------
+        (JSONLinesSessionStorage|SQLiteSessionStorage) storage
+            Archivio da indicizzare
+
+        (str) path [opt, default = None]
+            Path del file degli indici (path dell'archivio seguito da
+            INDEX_EXTENSION se None)
+        """
+
+        self.storage = storage
+        self.path = path if path is not None else storage.path + INDEX_EXTENSION
+        self.load()
+        self.refresh()
+
+
+    def __len__(self):
+        return len(self.positions)
+
+
+    def clear(self):
+
+        """
+        Svuota gli indici in memoria e riscrive l'intestazione del file degli indici
+        """
+
+        self.positions = []
+        self.values = []
+        self.indexes = dict((field, {}) for field in INDEX_FIELDS)
+        with open(self.path, 'w') as index_file:
+            index_file.write(json.dumps({'version': INDEX_VERSION, 'fields': sorted(INDEX_FIELDS)}) + '\n')
+
+
+    def load(self):
+
+        """
+        Carica gli indici dal file senza riscriverlo (un'eventuale ultima riga
+        incompleta è troncata). Il file è ricostruito soltanto se assente, di
+        una versione diversa o se non corrisponde più all'archivio (ultima
+        sessione indicizzata non presente nella posizione memorizzata)
+        """
+
+        rows = []
+        size = 0
+        if os.path.isfile(self.path):
+            with open(self.path, 'rb') as index_file:
+                header_line = index_file.readline()
+                try:
+                    header = json.loads(header_line.decode('utf-8'))
+                except ValueError:
+                    header = None
+                if header == {'version': INDEX_VERSION, 'fields': sorted(INDEX_FIELDS)} and header_line.endswith(b'\n'):
+                    size = len(header_line)
+                    for line in index_file:
+                        try:
+                            if not line.endswith(b'\n'):
+                                break
+                            rows.append(json.loads(line.decode('utf-8')))
+                        except ValueError:
+                            break
+                        size += len(line)
+        valid = size > 0
+        if valid and len(rows) > 0:
+            position, values = rows[-1]
+            try:
+                valid = self.storage.read(position).get('session_id') == values['session_id']
+            except (ValueError, TypeError, IOError):
+                valid = False
+        if not valid:
+            self.clear()
+            return
+
+        self.positions = []
+        self.values = []
+        self.indexes = dict((field, {}) for field in INDEX_FIELDS)
+        for position, values in rows:
+            self.add(position, dict((field, _hashable(value)) for field, value in values.items()))
+        if os.path.getsize(self.path) > size:
+            with open(self.path, 'r+b') as index_file:
+                index_file.truncate(size)
+
+
+    def add(self, position, values):
+
+        """
+        Aggiunge agli indici in memoria la sessione passata in ingresso
+
+        Parameters
+        -----------------------------------
+        (int) position
+            Posizione della sessione nell'archivio
+
+        (dict) values
+            Valori dei campi indicizzati (ref. get_index_values)
+        """
+
+        row = len(self.positions)
+        self.positions.append(position)
+        self.values.append(values)
+        for field, value in values.items():
+            self.indexes[field].setdefault(value, []).append(row)
+
+
+    def refresh(self):
+
+        """
+        Indicizza le sessioni aggiunte all'archivio dall'ultimo aggiornamento
+
+        Returns
+        -----------------------------------
+        (int) added
+            Numero di sessioni indicizzate
+        """
+
+        after = self.positions[-1] if len(self.positions) > 0 else None
+        added = 0
+        with open(self.path, 'a') as index_file:
+            for position, session in self.storage.scan(after):
+                values = get_index_values(session)
+                self.add(position, values)
+                index_file.write(json.dumps([position, values], sort_keys=True, separators=(',', ':')) + '\n')
+                added += 1
+        return added
+
+
+    def find(self, **criteria):
+
+        """
+        Restituisce i numeri (in ordine di inserimento) delle sessioni che
+        soddisfano tutti i criteri
+
+        Parameters
+        -----------------------------------
+        (dict) criteria
+            Criteri di ricerca (campo=criterio)
+
+        Raises
+        -----------------------------------
+        InvalidQueryFieldError
+            Il campo non è indicizzato (non è indicato in INDEX_FIELDS)
+
+        Returns
+        -----------------------------------
+        (list) rows
+            Numeri delle sessioni
+        """
+
+        matches = None
+        for field, criterion in criteria.items():
+            if field not in INDEX_FIELDS:
+                raise uexc.InvalidQueryFieldError(field, sorted(INDEX_FIELDS))
+            rows = set()
+            for value in self.get_matching_values(field, criterion):
+                rows.update(self.indexes[field][value])
+            matches = rows if matches is None else matches & rows
+            if len(matches) == 0:
+                return []
+        if matches is None:
+            return list(range(len(self.positions)))
+        return sorted(matches)
+
+
+    def get_matching_values(self, field, criterion):
+
+        """
+        Restituisce i valori indicizzati del campo che soddisfano il criterio
+
+        Parameters
+        -----------------------------------
+        (str) field
+            Campo indicizzato
+
+        (object) criterion
+            Valore, {"low": a, "high": b} oppure {"in": [...]}
+
+        Returns
+        -----------------------------------
+        (list) values
+            Valori presenti nell'indice del campo
+        """
+
+        index = self.indexes[field]
+        if isinstance(criterion, dict) and 'in' in criterion:
+            return [value for value in set(_hashable(value) for value in criterion['in']) if value in index]
+        if isinstance(criterion, dict) and ('low' in criterion or 'high' in criterion):
+            low, high = criterion.get('low'), criterion.get('high')
+            return [
+                value for value in index
+                if value is not None and (low is None or value >= low) and (high is None or value <= high)
+            ]
+        criterion = _hashable(criterion)
+        return [criterion] if criterion in index else []
+
+
+    def count(self, **criteria):
+
+        """
+        Restituisce il numero di sessioni che soddisfano i criteri
+
+        Parameters
+        -----------------------------------
+        (dict) criteria
+            Criteri di ricerca (campo=criterio)
+
+        Returns
+        -----------------------------------
+        (int) count
+            Numero di sessioni
+        """
+
+        return len(self.find(**criteria))
+
+
+    def get_values(self, **criteria):
+
+        """
+        Restituisce i valori indicizzati delle sessioni che soddisfano i criteri
+        (senza leggere le sessioni)
+
+        Parameters
+        -----------------------------------
+        (dict) criteria
+            Criteri di ricerca (campo=criterio)
+
+        Returns
+        -----------------------------------
+        (list) values
+            Valori dei campi indicizzati, in ordine di inserimento
+        """
+
+        return [self.values[row] for row in self.find(**criteria)]
+
+
+    def sessions(self, **criteria):
+
+        """
+        Restituisce un iteratore sulle sessioni che soddisfano i criteri, lette
+        dall'archivio una alla volta
+
+        Parameters
+        -----------------------------------
+        (dict) criteria
+            Criteri di ricerca (campo=criterio)
+
+        Returns
+        -----------------------------------
+        (generator) sessions
+            Sessioni in ordine di inserimento
+        """
+
+        for row in self.find(**criteria):
+            yield self.storage.read(self.positions[row])
+
+
+    def aggregate(self, field, **criteria):
+
+        """
+        Calcola le statistiche di un campo numerico indicizzato sulle sessioni
+        che soddisfano i criteri (ad esempio attempts con secret=[0, 1, 3] e
+        epsilon_decay=0.85)
+
+        Parameters
+        -----------------------------------
+        (str) field
+            Campo indicizzato da aggregare
+
+        (dict) criteria
+            Criteri di ricerca (campo=criterio)
+
+        Raises
+        -----------------------------------
+        InvalidQueryFieldError
+            Il campo non è indicizzato (non è indicato in INDEX_FIELDS)
+
+        Returns
+        -----------------------------------
+        (dict) stats
+            Statistiche del campo (ref. get_stats)
+        """
+
+        if field not in INDEX_FIELDS:
+            raise uexc.InvalidQueryFieldError(field, sorted(INDEX_FIELDS))
+        return get_stats([values[field] for values in self.get_values(**criteria)])
+
+
+    def group_by(self, group_field, field, **criteria):
+
+        """
+        Calcola le statistiche di un campo per ciascun valore di group_field
+
+        Parameters
+        -----------------------------------
+        (str) group_field
+            Campo indicizzato secondo cui raggruppare le sessioni
+
+        (str) field
+            Campo indicizzato da aggregare
+
+        (dict) criteria
+            Criteri di ricerca (campo=criterio)
+
+        Raises
+        -----------------------------------
+        InvalidQueryFieldError
+            Uno dei campi non è indicizzato (non è indicato in INDEX_FIELDS)
+
+        Returns
+        -----------------------------------
+        (dict) groups
+            Valore di group_field -> statistiche del campo (ref. get_stats)
+        """
+
+        for query_field in (group_field, field):
+            if query_field not in INDEX_FIELDS:
+                raise uexc.InvalidQueryFieldError(query_field, sorted(INDEX_FIELDS))
+        groups = {}
+        for values in self.get_values(**criteria):
+            groups.setdefault(values[group_field], []).append(values[field])
+        return dict((group, get_stats(group_values)) for group, group_values in groups.items())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
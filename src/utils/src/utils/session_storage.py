@@ -0,0 +1,572 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import sqlite3
+import argparse
+import threading
+import utils_exceptions as uexc
+
+
+# constants------------------------------------------------------------------
+
+STORAGE_BACKENDS = {
+    'jsonl': '.jsonl',
+    'sqlite': '.sqlite'
+}
+
+TINYDB_DEFAULT_TABLE = 'rl_session'
+
+
+# functions------------------------------------------------------------------
+
+def open_storage(backend, path):
+
+    """
+    Apre (creandolo se necessario) l'archivio delle sessioni
+
+    Parameters
+    -----------------------------------
+    (str) backend
+        Tipo di archivio (ref. STORAGE_BACKENDS)
+
+    (str) path
+        Path del file dell'archivio
+
+    Raises
+    -----------------------------------
+    InvalidStorageBackendError
+        Il backend passato non è supportato (non è indicato in STORAGE_BACKENDS)
+
+    Returns
+    -----------------------------------
+    (JSONLinesSessionStorage|SQLiteSessionStorage) storage
+        Archivio delle sessioni
+    """
+
+    if backend not in STORAGE_BACKENDS:
+        raise uexc.InvalidStorageBackendError(backend, sorted(STORAGE_BACKENDS.keys()))
+    if backend == 'jsonl':
+        return JSONLinesSessionStorage(path)
+    return SQLiteSessionStorage(path)
+
+
+def import_tinydb(tinydb_path, storage, table=TINYDB_DEFAULT_TABLE):
+
+    """
+    Importa nell'archivio le sessioni di un database TinyDB (ad esempio il
+    db.json prodotto dalle versioni precedenti di app.py), nell'ordine degli
+    ID dei documenti. Le sessioni già presenti nell'archivio sono saltate
+
+    Parameters
+    -----------------------------------
+    (str) tinydb_path
+        Path del file TinyDB
+
+    (JSONLinesSessionStorage|SQLiteSessionStorage) storage
+        Archivio in cui importare le sessioni
+
+    (str) table [opt, default = TINYDB_DEFAULT_TABLE]
+        Tabella TinyDB da importare
+
+    Raises
+    -----------------------------------
+    FileNotFoundError
+        Il file tinydb_path è inesistente
+
+    Returns
+    -----------------------------------
+    (int) imported
+        Numero di sessioni importate
+    """
+
+    if not os.path.isfile(tinydb_path):
+        raise uexc.FileNotFoundError(tinydb_path)
+    with open(tinydb_path) as tinydb_file:
+        documents = json.load(tinydb_file).get(table, {})
+    session_ids = set(session.get('session_id') for session in storage.sessions())
+    imported = 0
+    for doc_id in sorted(documents, key=int):
+        session = documents[doc_id]
+        session.setdefault('session_id', table + '_' + doc_id)
+        if session['session_id'] not in session_ids:
+            storage.insert(session)
+            session_ids.add(session['session_id'])
+            imported += 1
+    return imported
+
+
+def main(argv=None):
+
+    """
+    Importa da riga di comando un database TinyDB in un archivio delle sessioni
+    """
+
+    parser = argparse.ArgumentParser(description='Import a TinyDB session database into a session storage')
+    parser.add_argument('tinydb', help='TinyDB JSON file (e.g. data/db/db.json)')
+    parser.add_argument('storage', help='destination storage file')
+    parser.add_argument('--backend', choices=sorted(STORAGE_BACKENDS.keys()), default='jsonl')
+    parser.add_argument('--table', default=TINYDB_DEFAULT_TABLE)
+    args = parser.parse_args(argv)
+
+    storage = open_storage(args.backend, args.storage)
+    try:
+        print('imported: {0}'.format(import_tinydb(args.tinydb, storage, args.table)))
+    finally:
+        storage.close()
+
+
+def _dumps(session):
+    return json.dumps(session, sort_keys=True, separators=(',', ':'))
+
+
+# classes--------------------------------------------------------------------
+
+class JSONLinesSessionStorage:
+
+    """
+    Archivio delle sessioni in un file JSON lines (una sessione per riga). Ogni
+    inserimento aggiunge una riga in coda al file (costo proporzionale alla
+    sola sessione inserita) e l'apertura non legge le sessioni presenti. Le
+    righe incomplete (ad esempio a causa di un'interruzione) sono ignorate
+
+    Attributes
+    -----------------------------------
+    (str) path
+        Path del file
+
+    Methods
+    -----------------------------------
+    insert(session)
+        Aggiunge una sessione all'archivio
+
+    insert_many(sessions)
+        Aggiunge le sessioni passate in ingresso con un'unica scrittura
+
+    sync()
+        Rende persistenti su disco le sessioni aggiunte
+
+    get(session_id)
+        Restituisce la sessione avente l'ID passato in ingresso
+
+    sessions()
+        Restituisce un iteratore sulle sessioni in ordine di inserimento
+
+    scan(after=None)
+        Restituisce un iteratore sulle coppie (posizione, sessione)
+
+    read(position)
+        Restituisce la sessione memorizzata nella posizione indicata
+
+    close()
+        Chiude l'archivio
+    """
+
+    def __init__(self, path):
+
+        """
+        Parameters
+        -----------------------------------
+        (str) path
+            Path del file (creato se inesistente)
+        """
+
+        self.path = path
+        self.lock = threading.Lock()
+
+        # Completa l'ultima riga se il file è stato troncato
+        needs_newline = False
+        if os.path.isfile(path) and os.path.getsize(path) > 0:
+            with open(path, 'rb') as storage_file:
+                storage_file.seek(-1, os.SEEK_END)
+                needs_newline = storage_file.read(1) != b'\n'
+        self.storage_file = open(path, 'a')
+        if needs_newline:
+            self.storage_file.write('\n')
+            self.storage_file.flush()
+
+
+    def __iter__(self):
+        return self.sessions()
+
+
+    def __len__(self):
+        return sum(1 for _ in self.sessions())
+
+
+    def insert(self, session):
+
+        """
+        Aggiunge una sessione all'archivio
+
+        Parameters
+        -----------------------------------
+        (dict) session
+            Sessione da aggiungere (serializzabile in JSON)
+        """
+
+        self.insert_many([session])
+
+
+    def insert_many(self, sessions):
+
+        """
+        Aggiunge le sessioni passate in ingresso con un'unica scrittura
+
+        Parameters
+        -----------------------------------
+        (list) sessions
+            Sessioni da aggiungere (serializzabili in JSON)
+        """
+
+        lines = ''.join(_dumps(session) + '\n' for session in sessions)
+        with self.lock:
+            self.storage_file.write(lines)
+            self.storage_file.flush()
+
+
+    def sync(self):
+
+        """
+        Rende persistenti su disco le sessioni aggiunte (fsync del file)
+        """
+
+        with self.lock:
+            self.storage_file.flush()
+            os.fsync(self.storage_file.fileno())
+
+
+    def get(self, session_id):
+
+        """
+        Restituisce la sessione avente l'ID passato in ingresso
+
+        Parameters
+        -----------------------------------
+        (str) session_id
+            ID della sessione
+
+        Returns
+        -----------------------------------
+        (dict) session
+            Sessione (None se assente)
+        """
+
+        for session in self.sessions():
+            if session.get('session_id') == session_id:
+                return session
+        return None
+
+
+    def sessions(self):
+
+        """
+        Restituisce un iteratore sulle sessioni in ordine di inserimento
+
+        Returns
+        -----------------------------------
+        (generator) sessions
+            Sessioni (dizionari)
+        """
+
+        for _, session in self.scan():
+            yield session
+
+
+    def scan(self, after=None):
+
+        """
+        Restituisce un iteratore sulle coppie (posizione, sessione) in ordine di
+        inserimento, a partire dalla sessione successiva a quella in posizione
+        after. La posizione è l'offset in byte della riga; l'ultima riga, se
+        non ancora terminata, non è restituita
+
+        Parameters
+        -----------------------------------
+        (int) after [opt, default = None]
+            Posizione dell'ultima sessione già letta (None -> dall'inizio)
+
+        Returns
+        -----------------------------------
+        (generator) sessions
+            Coppie (posizione, sessione)
+        """
+
+        with open(self.path, 'rb') as storage_file:
+            if after is not None:
+                storage_file.seek(after)
+                storage_file.readline()
+            position = storage_file.tell()
+            for line in iter(storage_file.readline, b''):
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    yield position, json.loads(line.decode('utf-8'))
+                except ValueError:
+                    pass
+                position += len(line)
+
+
+    def read(self, position):
+
+        """
+        Restituisce la sessione memorizzata nella posizione indicata
+
+        Parameters
+        -----------------------------------
+        (int) position
+            Posizione della sessione (ref. scan)
+
+        Returns
+        -----------------------------------
+        (dict) session
+            Sessione
+        """
+
+        with open(self.path, 'rb') as storage_file:
+            storage_file.seek(position)
+            return json.loads(storage_file.readline().decode('utf-8'))
+
+
+    def close(self):
+
+        """
+        Chiude l'archivio
+        """
+
+        with self.lock:
+            self.storage_file.close()
+
+
+
+class SQLiteSessionStorage:
+
+    """
+    Archivio delle sessioni in un database SQLite. Ogni sessione occupa una
+    riga della tabella sessions (sessione serializzata in JSON) ed è indicizzata
+    per session_id, secret e guessed. L'archivio può essere usato da più thread
+
+    Attributes
+    -----------------------------------
+    (str) path
+        Path del database
+
+    (sqlite3.Connection) connection
+        Connessione al database
+
+    Methods
+    -----------------------------------
+    insert(session)
+        Aggiunge una sessione all'archivio
+
+    insert_many(sessions)
+        Aggiunge le sessioni passate in ingresso in un'unica transazione
+
+    sync()
+        Rende persistenti su disco le sessioni aggiunte
+
+    get(session_id)
+        Restituisce la sessione avente l'ID passato in ingresso
+
+    sessions()
+        Restituisce un iteratore sulle sessioni in ordine di inserimento
+
+    scan(after=None)
+        Restituisce un iteratore sulle coppie (posizione, sessione)
+
+    read(position)
+        Restituisce la sessione memorizzata nella posizione indicata
+
+    close()
+        Chiude l'archivio
+    """
+
+    def __init__(self, path):
+
+        """
+        Parameters
+        -----------------------------------
+        (str) path
+            Path del database (creato se inesistente)
+        """
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                'id INTEGER PRIMARY KEY, '
+                'session_id TEXT UNIQUE, '
+                'secret TEXT, '
+                'guessed INTEGER, '
+                'record TEXT NOT NULL)'
+            )
+            self.connection.execute('CREATE INDEX IF NOT EXISTS sessions_secret ON sessions (secret)')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS sessions_guessed ON sessions (guessed)')
+
+
+    def __iter__(self):
+        return self.sessions()
+
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM sessions').fetchone()[0]
+
+
+    def insert(self, session):
+
+        """
+        Aggiunge una sessione all'archivio
+
+        Parameters
+        -----------------------------------
+        (dict) session
+            Sessione da aggiungere (serializzabile in JSON)
+        """
+
+        self.insert_many([session])
+
+
+    def insert_many(self, sessions):
+
+        """
+        Aggiunge le sessioni passate in ingresso in un'unica transazione
+
+        Parameters
+        -----------------------------------
+        (list) sessions
+            Sessioni da aggiungere (serializzabili in JSON)
+        """
+
+        rows = []
+        for session in sessions:
+            secret = session.get('config', {}).get('secret')
+            guessed = session.get('result', {}).get('guessed')
+            rows.append((
+                session.get('session_id'),
+                None if secret is None else json.dumps(secret),
+                None if guessed is None else int(guessed),
+                _dumps(session)
+            ))
+        with self.lock:
+            with self.connection:
+                self.connection.executemany('INSERT INTO sessions (session_id, secret, guessed, record) VALUES (?, ?, ?, ?)', rows)
+
+
+    def sync(self):
+
+        """
+        Rende persistenti su disco le sessioni aggiunte (nessun effetto: ogni
+        transazione è resa persistente da SQLite al commit)
+        """
+
+        pass
+
+
+    def get(self, session_id):
+
+        """
+        Restituisce la sessione avente l'ID passato in ingresso
+
+        Parameters
+        -----------------------------------
+        (str) session_id
+            ID della sessione
+
+        Returns
+        -----------------------------------
+        (dict) session
+            Sessione (None se assente)
+        """
+
+        with self.lock:
+            row = self.connection.execute('SELECT record FROM sessions WHERE session_id = ?', (session_id,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+
+    def sessions(self):
+
+        """
+        Restituisce un iteratore sulle sessioni in ordine di inserimento
+
+        Returns
+        -----------------------------------
+        (generator) sessions
+            Sessioni (dizionari)
+        """
+
+        for _, session in self.scan():
+            yield session
+
+
+    def scan(self, after=None, chunk_size=256):
+
+        """
+        Restituisce un iteratore sulle coppie (posizione, sessione) in ordine di
+        inserimento, a partire dalla sessione successiva a quella in posizione
+        after. La posizione è l'ID della riga; le righe sono lette a blocchi di
+        chunk_size
+
+        Parameters
+        -----------------------------------
+        (int) after [opt, default = None]
+            Posizione dell'ultima sessione già letta (None -> dall'inizio)
+
+        (int) chunk_size [opt, default = 256]
+            Numero di sessioni lette per interrogazione
+
+        Returns
+        -----------------------------------
+        (generator) sessions
+            Coppie (posizione, sessione)
+        """
+
+        position = -1 if after is None else after
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    'SELECT id, record FROM sessions WHERE id > ? ORDER BY id LIMIT ?',
+                    (position, chunk_size)
+                ).fetchall()
+            for position, record in rows:
+                yield position, json.loads(record)
+            if len(rows) < chunk_size:
+                return
+
+
+    def read(self, position):
+
+        """
+        Restituisce la sessione memorizzata nella posizione indicata
+
+        Parameters
+        -----------------------------------
+        (int) position
+            Posizione della sessione (ref. scan)
+
+        Returns
+        -----------------------------------
+        (dict) session
+            Sessione
+        """
+
+        with self.lock:
+            row = self.connection.execute('SELECT record FROM sessions WHERE id = ?', (position,)).fetchone()
+        return json.loads(row[0])
+
+
+    def close(self):
+
+        """
+        Chiude l'archivio
+        """
+
+        with self.lock:
+            self.connection.close()
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
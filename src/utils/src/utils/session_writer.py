@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import sqlite3
+import threading
+import utils_exceptions as uexc
+from session_storage import JSONLinesSessionStorage
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+# constants------------------------------------------------------------------
+
+FSYNC_POLICIES = [
+    'never',
+    'batch',
+    'close'
+]
+
+DEFAULT_QUEUE_SIZE = 64
+
+DEFAULT_BATCH_SIZE = 16
+
+DEFAULT_MAX_RETRIES = 3
+
+DEFAULT_RETRY_DELAY = 0.5
+
+TRANSIENT_ERRORS = (EnvironmentError, sqlite3.OperationalError)
+
+
+# classes--------------------------------------------------------------------
+
+class SessionWriter:
+
+    """
+    Scrive le sessioni nell'archivio da un thread dedicato, così che chi le
+    produce (thread RL, interfaccia grafica) si limiti ad accodarle. Le sessioni
+    in coda sono scritte a gruppi (al più batch_size per scrittura). La coda è
+    limitata: quando è piena put attende (al più timeout secondi) e l'attesa è
+    conteggiata in backpressure. La chiusura scrive tutte le sessioni accodate.
+    Una scrittura non riuscita per un errore transitorio (TRANSIENT_ERRORS) è
+    ripetuta al più max_retries volte con attesa crescente (retry_delay,
+    2*retry_delay, ...); in caso di altri errori le sessioni del gruppo sono
+    scritte una alla volta. Le sessioni che non è possibile scrivere sono
+    salvate nel file di riserva fallback_path (JSON lines, leggibile con
+    open_storage) e, se anche questo non è possibile, restano in failed
+
+    Attributes
+    -----------------------------------
+    (JSONLinesSessionStorage|SQLiteSessionStorage) storage
+        Archivio in cui scrivere le sessioni
+
+    (int) batch_size
+        Numero massimo di sessioni per scrittura
+
+    (str) fsync_policy
+        Indica quando rendere persistenti su disco le scritture (ref. FSYNC_POLICIES):
+        never -> mai (buffer del sistema operativo), batch -> dopo ogni scrittura,
+        close -> alla chiusura
+
+    (int) max_retries
+        Numero massimo di ripetizioni di una scrittura non riuscita
+
+    (float) retry_delay
+        Attesa in secondi prima della prima ripetizione (raddoppiata ad ogni ripetizione)
+
+    (str) fallback_path
+        Path del file di riserva (None se assente)
+
+    (int) written
+        Numero di sessioni scritte
+
+    (int) backpressure
+        Numero di put che hanno trovato la coda piena
+
+    (int) retries
+        Numero di scritture ripetute
+
+    (int) spilled
+        Numero di sessioni salvate nel file di riserva
+
+    (Exception) error
+        Ultimo errore di scrittura (None se assente)
+
+    (list) failed
+        Sessioni non salvate né nell'archivio né nel file di riserva
+
+    Methods
+    -----------------------------------
+    put(session, timeout=None)
+        Accoda una sessione
+
+    get_pending()
+        Restituisce il numero di sessioni in coda
+
+    write(sessions)
+        Scrive un gruppo di sessioni (con ripetizioni e file di riserva)
+
+    flush(timeout=None)
+        Attende la scrittura delle sessioni accodate
+
+    close(timeout=None)
+        Scrive le sessioni accodate e termina il thread
+    """
+
+    def __init__(
+        self,
+        storage,
+        maxsize=DEFAULT_QUEUE_SIZE,
+        batch_size=DEFAULT_BATCH_SIZE,
+        fsync_policy=FSYNC_POLICIES[1],
+        max_retries=DEFAULT_MAX_RETRIES,
+        retry_delay=DEFAULT_RETRY_DELAY,
+        fallback_path=None
+    ):
+
+        """
+        Parameters
+        -----------------------------------
+        (JSONLinesSessionStorage|SQLiteSessionStorage) storage
+            Archivio in cui scrivere le sessioni
+
+        (int) maxsize [opt, default = DEFAULT_QUEUE_SIZE]
+            Numero massimo di sessioni in coda
+
+        (int) batch_size [opt, default = DEFAULT_BATCH_SIZE]
+            Numero massimo di sessioni per scrittura
+
+        (str) fsync_policy [opt, default = 'batch']
+            Indica quando rendere persistenti su disco le scritture
+
+        (int) max_retries [opt, default = DEFAULT_MAX_RETRIES]
+            Numero massimo di ripetizioni di una scrittura non riuscita
+
+        (float) retry_delay [opt, default = DEFAULT_RETRY_DELAY]
+            Attesa in secondi prima della prima ripetizione
+
+        (str) fallback_path [opt, default = None]
+            Path del file di riserva per le sessioni non scritte (nessuno se None)
+
+        Raises
+        -----------------------------------
+        InvalidFsyncPolicyError
+            La politica fsync_policy non è supportata (non è indicata in FSYNC_POLICIES)
+        """
+
+        if fsync_policy not in FSYNC_POLICIES:
+            raise uexc.InvalidFsyncPolicyError(fsync_policy, FSYNC_POLICIES)
+
+        self.storage = storage
+        self.batch_size = max(1, batch_size)
+        self.fsync_policy = fsync_policy
+        self.max_retries = max(0, max_retries)
+        self.retry_delay = retry_delay
+        self.fallback_path = fallback_path
+        self.written = 0
+        self.backpressure = 0
+        self.retries = 0
+        self.spilled = 0
+        self.error = None
+        self.failed = []
+        self.closed = False
+        self.sessions = queue.Queue(maxsize)
+        self.worker = threading.Thread(target=self.run)
+        self.worker.daemon = True
+        self.worker.start()
+
+
+    def put(self, session, timeout=None):
+
+        """
+        Accoda una sessione. Se la coda è piena attende al più timeout secondi
+
+        Parameters
+        -----------------------------------
+        (dict) session
+            Sessione da scrivere (non deve essere modificata dopo l'accodamento)
+
+        (float) timeout [opt, default = None]
+            Tempo massimo di attesa in secondi (illimitato se None)
+
+        Returns
+        -----------------------------------
+        (bool) queued
+            Indica se la sessione è stata accodata (False se la coda è rimasta
+            piena per timeout secondi o se lo scrittore è chiuso)
+        """
+
+        if self.closed:
+            return False
+        try:
+            self.sessions.put_nowait(session)
+            return True
+        except queue.Full:
+            self.backpressure += 1
+        try:
+            self.sessions.put(session, timeout=timeout)
+            return True
+        except queue.Full:
+            return False
+
+
+    def get_pending(self):
+
+        """
+        Restituisce il numero di sessioni in coda
+
+        Returns
+        -----------------------------------
+        (int) pending
+            Numero (approssimato) di sessioni non ancora scritte
+        """
+
+        return self.sessions.qsize()
+
+
+    def run(self):
+
+        """
+        Ciclo del thread di scrittura: attende una sessione, raccoglie quelle
+        già in coda (al più batch_size) e le scrive con un'unica operazione
+        (ripetuta se non riesce, ref. write). Dopo la richiesta di chiusura
+        scrive le sessioni rimaste e termina
+        """
+
+        stop = False
+        while True:
+            batch = [] if stop else [self.sessions.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.sessions.get_nowait())
+                except queue.Empty:
+                    break
+            if len(batch) == 0:
+                break
+            stop = stop or None in batch
+            sessions = [session for session in batch if session is not None]
+            try:
+                if len(sessions) > 0:
+                    self.write(sessions)
+            finally:
+                for _ in batch:
+                    self.sessions.task_done()
+
+        if self.fsync_policy == FSYNC_POLICIES[2]:
+            self._retry(self.storage.sync)
+
+
+    def write(self, sessions):
+
+        """
+        Scrive un gruppo di sessioni nell'archivio (ref. SessionWriter): le
+        sessioni inserite sono conteggiate in written anche se la successiva
+        sincronizzazione su disco non riesce, che è quindi ripetuta da sola
+
+        Parameters
+        -----------------------------------
+        (list) sessions
+            Sessioni da scrivere
+        """
+
+        if self._retry(self.storage.insert_many, sessions):
+            self.written += len(sessions)
+        elif len(sessions) > 1 and not isinstance(self.error, TRANSIENT_ERRORS):
+            for session in sessions:
+                if self._retry(self.storage.insert_many, [session]):
+                    self.written += 1
+                else:
+                    self._spill([session])
+        else:
+            self._spill(sessions)
+        if self.fsync_policy == FSYNC_POLICIES[1]:
+            self._retry(self.storage.sync)
+
+
+    def _retry(self, func, *args):
+        for attempt in range(self.max_retries+1):
+            if attempt > 0:
+                self.retries += 1
+                time.sleep(self.retry_delay * 2**(attempt-1))
+            try:
+                func(*args)
+                return True
+            except TRANSIENT_ERRORS as error:
+                self.error = error
+            except Exception as error:
+                self.error = error
+                return False
+        return False
+
+
+    def _spill(self, sessions):
+        if self.fallback_path is not None:
+            try:
+                fallback = JSONLinesSessionStorage(self.fallback_path)
+                try:
+                    fallback.insert_many(sessions)
+                    fallback.sync()
+                finally:
+                    fallback.close()
+                self.spilled += len(sessions)
+                return
+            except Exception as error:
+                self.error = error
+        self.failed.extend(sessions)
+
+
+    def flush(self, timeout=None):
+
+        """
+        Attende la scrittura delle sessioni accodate
+
+        Parameters
+        -----------------------------------
+        (float) timeout [opt, default = None]
+            Tempo massimo di attesa in secondi (illimitato se None)
+
+        Returns
+        -----------------------------------
+        (bool) flushed
+            Indica se tutte le sessioni accodate sono state elaborate
+        """
+
+        if timeout is None:
+            self.sessions.join()
+            return True
+        done = threading.Event()
+        waiter = threading.Thread(target=lambda: (self.sessions.join(), done.set()))
+        waiter.daemon = True
+        waiter.start()
+        return done.wait(timeout)
+
+
+    def close(self, timeout=None):
+
+        """
+        Scrive le sessioni accodate e termina il thread di scrittura (non chiude
+        l'archivio). Ulteriori put sono rifiutati
+
+        Parameters
+        -----------------------------------
+        (float) timeout [opt, default = None]
+            Tempo massimo di attesa in secondi (illimitato se None)
+
+        Returns
+        -----------------------------------
+        (bool) closed
+            Indica se il thread di scrittura è terminato
+        """
+
+        if not self.closed:
+            self.closed = True
+            self.sessions.put(None)
+        self.worker.join(timeout)
+        return not self.worker.is_alive()
\ No newline at end of file
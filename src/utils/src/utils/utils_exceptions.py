@@ -76,4 +76,47 @@ class FileNotFoundError(IOError):
         super(IOError, self).__init__(self.message)
 
     def __str__(self):
-        return '\'{file}\' -> {message}'.format(file=self.file, message=self.message)
\ No newline at end of file
+        return '\'{file}\' -> {message}'.format(file=self.file, message=self.message)
+
+
+class InvalidStorageBackendError(ValueError):
+
+    def __init__(self, backend, backends, message='backend must be one of '):
+        self.backend = backend
+        self.message = message + str(backends)
+        super(ValueError, self).__init__(self.message)
+
+    def __str__(self):
+        return '\'{backend}\' -> {message}'.format(backend=self.backend, message=self.message)
+
+
+class InvalidFsyncPolicyError(ValueError):
+
+    def __init__(self, fsync_policy, fsync_policies, message='fsync_policy must be one of '):
+        self.fsync_policy = fsync_policy
+        self.message = message + str(fsync_policies)
+        super(ValueError, self).__init__(self.message)
+
+    def __str__(self):
+        return '\'{fsync_policy}\' -> {message}'.format(fsync_policy=self.fsync_policy, message=self.message)
+
+
+class InvalidQueryFieldError(ValueError):
+
+    def __init__(self, field, fields, message='field must be one of '):
+        self.field = field
+        self.message = message + str(fields)
+        super(ValueError, self).__init__(self.message)
+
+    def __str__(self):
+        return '\'{field}\' -> {message}'.format(field=self.field, message=self.message)
+
+class ReservedLogFieldError(ValueError):
+
+    def __init__(self, field, message='field is reserved by the session log'):
+        self.field = field
+        self.message = message
+        super(ValueError, self).__init__(self.message)
+
+    def __str__(self):
+        return '\'{field}\' -> {message}'.format(field=self.field, message=self.message)
\ No newline at end of file
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import utils.session_log as session_log
+from utils.session_log import SessionEventLog, load_session_log, is_sealed, get_unsealed_logs, LOG_EXTENSION
+
+
+# constants------------------------------------------------------------------
+
+FSYNC_INTERVAL = 0.1
+
+
+# classes--------------------------------------------------------------------
+
+class TestSessionEventLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_path = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_path, 'session' + LOG_EXTENSION)
+        self.fsyncs = []
+        self.fsync = session_log.os.fsync
+        session_log.os.fsync = lambda fd: self.fsyncs.append(fd)
+
+
+    def tearDown(self):
+        session_log.os.fsync = self.fsync
+        shutil.rmtree(self.tmp_path)
+
+
+    def test_fields_preserved(self):
+        log = SessionEventLog(self.path, FSYNC_INTERVAL)
+        log.append('feedback', feedback_id='f1', time='01:05', evaluation=3)
+        log.seal(guessed=True)
+        events = load_session_log(self.path)
+        self.assertEqual([event['event'] for event in events], ['feedback', 'end'])
+        self.assertEqual(events[0]['time'], '01:05')
+        self.assertEqual(events[0]['evaluation'], 3)
+        self.assertTrue(all(isinstance(event['ts'], float) for event in events))
+        self.assertTrue(is_sealed(events))
+
+
+    def test_reserved_field(self):
+        log = SessionEventLog(self.path, FSYNC_INTERVAL)
+        with self.assertRaises(ValueError):
+            log.append('step', ts=1.0)
+        log.seal()
+
+
+    def test_flush_and_deferred_fsync(self):
+        log = SessionEventLog(self.path, FSYNC_INTERVAL)
+        log.append('begin', session_id='s')
+        self.assertEqual(len(load_session_log(self.path)), 1)
+        self.assertEqual(len(self.fsyncs), 0)
+        time.sleep(3*FSYNC_INTERVAL)
+        self.assertEqual(len(self.fsyncs), 1)
+        self.assertEqual(get_unsealed_logs(self.tmp_path), [self.path])
+        log.seal()
+        self.assertEqual(get_unsealed_logs(self.tmp_path), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
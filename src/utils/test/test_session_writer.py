@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from utils.session_storage import open_storage
+from utils.session_writer import SessionWriter, FSYNC_POLICIES
+
+
+# constants------------------------------------------------------------------
+
+RETRY_DELAY = 0.001
+
+
+# classes--------------------------------------------------------------------
+
+class FlakyStorage:
+
+    """
+    Archivio in memoria i cui inserimenti e sincronizzazioni falliscono un
+    numero prefissato di volte (errori transitori) o sempre per le sessioni
+    indicate (errori permanenti)
+    """
+
+    def __init__(self, insert_failures=0, sync_failures=0, invalid_ids=(), delay=0.0):
+        self.insert_failures = insert_failures
+        self.sync_failures = sync_failures
+        self.invalid_ids = set(invalid_ids)
+        self.delay = delay
+        self.session_ids = []
+        self.syncs = 0
+
+
+    def insert_many(self, sessions):
+        time.sleep(self.delay)
+        if self.insert_failures > 0:
+            self.insert_failures -= 1
+            raise IOError('transient insert error')
+        if any(session['session_id'] in self.invalid_ids for session in sessions):
+            raise ValueError('invalid session')
+        self.session_ids.extend(session['session_id'] for session in sessions)
+
+
+    def sync(self):
+        if self.sync_failures > 0:
+            self.sync_failures -= 1
+            raise IOError('transient sync error')
+        self.syncs += 1
+
+
+
+class TestSessionWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_path = tempfile.mkdtemp()
+        self.fallback_path = os.path.join(self.tmp_path, 'fallback.jsonl')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+
+    def write(self, storage, session_ids, **kwargs):
+        writer = SessionWriter(storage, retry_delay=RETRY_DELAY, fallback_path=self.fallback_path, **kwargs)
+        for session_id in session_ids:
+            writer.put({'session_id': session_id})
+        self.assertTrue(writer.close(timeout=10.0))
+        return writer
+
+
+    def get_fallback_ids(self):
+        if not os.path.isfile(self.fallback_path):
+            return []
+        fallback = open_storage('jsonl', self.fallback_path)
+        try:
+            return [session['session_id'] for session in fallback.sessions()]
+        finally:
+            fallback.close()
+
+
+    def test_retry_transient_insert(self):
+        storage = FlakyStorage(insert_failures=2)
+        writer = self.write(storage, ['a', 'b', 'c'])
+        self.assertEqual(sorted(storage.session_ids), ['a', 'b', 'c'])
+        self.assertEqual(writer.written, 3)
+        self.assertEqual(writer.retries, 2)
+        self.assertEqual(writer.spilled, 0)
+
+
+    def test_retry_sync_only(self):
+        storage = FlakyStorage(sync_failures=1)
+        writer = self.write(storage, ['a'])
+        self.assertEqual(storage.session_ids, ['a'])
+        self.assertEqual(writer.written, 1)
+        self.assertEqual(writer.retries, 1)
+        self.assertEqual(storage.syncs, 1)
+
+
+    def test_spill_permanent_error(self):
+        storage = FlakyStorage(invalid_ids=['b'], delay=0.01)
+        writer = self.write(storage, ['a', 'b', 'c', 'd'])
+        self.assertEqual(sorted(storage.session_ids), ['a', 'c', 'd'])
+        self.assertEqual(writer.written, 3)
+        self.assertEqual(writer.retries, 0)
+        self.assertEqual(writer.spilled, 1)
+        self.assertEqual(self.get_fallback_ids(), ['b'])
+
+
+    def test_spill_after_retries(self):
+        storage = FlakyStorage(insert_failures=100)
+        writer = self.write(storage, ['a', 'b'], max_retries=2)
+        self.assertEqual(storage.session_ids, [])
+        self.assertEqual(writer.written, 0)
+        self.assertEqual(writer.spilled, 2)
+        self.assertEqual(sorted(self.get_fallback_ids()), ['a', 'b'])
+        self.assertEqual(writer.failed, [])
+
+
+    def test_failed_without_fallback(self):
+        storage = FlakyStorage(insert_failures=100)
+        writer = SessionWriter(storage, max_retries=1, retry_delay=RETRY_DELAY)
+        writer.put({'session_id': 'a'})
+        writer.close()
+        self.assertEqual(writer.failed, [{'session_id': 'a'}])
+        self.assertIsInstance(writer.error, IOError)
+
+
+    def test_sqlite_duplicate(self):
+        storage = open_storage('sqlite', os.path.join(self.tmp_path, 'db.sqlite'))
+        try:
+            storage.insert({'session_id': 'a'})
+            writer = self.write(storage, ['a', 'b'], batch_size=2)
+            self.assertEqual(sorted(session['session_id'] for session in storage.sessions()), ['a', 'b'])
+            self.assertEqual(writer.written, 1)
+            self.assertEqual(writer.retries, 0)
+            self.assertEqual(self.get_fallback_ids(), ['a'])
+        finally:
+            storage.close()
+
+
+    def test_close_drains_queue(self):
+        for fsync_policy in FSYNC_POLICIES:
+            storage = FlakyStorage(delay=0.001)
+            writer = SessionWriter(storage, maxsize=4, batch_size=3, fsync_policy=fsync_policy)
+            producers = [
+                threading.Thread(target=lambda prefix=prefix: [writer.put({'session_id': prefix + str(i)}) for i in range(20)])
+                for prefix in 'xyz'
+            ]
+            for producer in producers:
+                producer.start()
+            for producer in producers:
+                producer.join()
+            self.assertTrue(writer.close(timeout=10.0))
+            self.assertFalse(writer.put({'session_id': 'late'}))
+            self.assertEqual(len(storage.session_ids), 60)
+            self.assertEqual(len(set(storage.session_ids)), 60)
+            self.assertEqual(writer.written, 60)
+            self.assertEqual(storage.syncs > 0, fsync_policy != FSYNC_POLICIES[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file